@@ -0,0 +1,4 @@
+"""
+Benchmark suite package
+성능 측정용 벤치마크 모듈들
+"""
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+벤치마크용 합성 데이터 생성 모듈
+한국어 채팅 로그, 엑셀 붙여넣기 데이터, OCR용 이미지, 대용량 가이드라인 파일을 재현 가능하게 생성합니다.
+"""
+
+import json
+import random
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+NAMES = ["김민수", "이서연", "박지훈", "최유진", "정하늘", "강도윤", "user01", "Alex"]
+EMOJIS = ["😀", "🎉", "🔥", "👍", "🙏", "☀", "🌸", "💬"]
+MESSAGES = [
+    "안녕하세요 오늘 회의 자료 공유드립니다",
+    "확인했습니다 감사합니다",
+    "이 회원님에게 보낸 답장 내일 다시 연락드릴게요",
+    "보낸 메시지 사진 확인 부탁드려요",
+    "링크 참고하세요",
+    "(참고) [공지] 일정이 변경되었습니다",
+    "ㅋㅋㅋ 좋네요",
+    "주문 번호 12345 처리 완료",
+]
+WEEKDAYS = ["월", "화", "수", "목", "금", "토", "일"]
+
+
+def _random_date(rng: random.Random) -> str:
+    """다양한 형식의 날짜 문자열"""
+    year, month, day = rng.randint(2023, 2026), rng.randint(1, 12), rng.randint(1, 28)
+    formats = [
+        f"{year}년 {month}월 {day}일",
+        f"{year}. {month}. {day}.",
+        f"{year}.{month}.{day}",
+        f"{year % 100}. {month}. {day}",
+    ]
+    return rng.choice(formats)
+
+
+def _random_time(rng: random.Random) -> str:
+    """다양한 형식의 시간 문자열"""
+    hour, minute = rng.randint(1, 12), rng.randint(0, 59)
+    formats = [
+        f"오전 {hour}:{minute:02d}",
+        f"오후 {hour}:{minute:02d}",
+        f"{hour}:{minute:02d} PM",
+        f"{rng.choice(WEEKDAYS)}요일 {hour}:{minute:02d} AM",
+        f"{rng.randint(0, 23)}:{minute:02d}",
+    ]
+    return rng.choice(formats)
+
+
+def generate_chat_line(rng: random.Random) -> str:
+    """채팅 로그 한 줄 생성"""
+    kind = rng.random()
+    name = rng.choice(NAMES)
+    if rng.random() < 0.3:
+        name += rng.choice(EMOJIS)
+
+    if kind < 0.15:
+        return _random_date(rng)
+    if kind < 0.25:
+        return f"https://www.youtube.com/watch?v={rng.getrandbits(40):x} {rng.choice(MESSAGES)}"
+    if kind < 0.40:
+        cells = [name, str(rng.randint(1, 500)), rng.choice(MESSAGES)]
+        return " | ".join(cells)
+    if kind < 0.45:
+        return ""
+    return f"{name} {_random_time(rng)} {rng.choice(MESSAGES)}"
+
+
+def generate_chat_log(line_count: int, seed: int = 42) -> str:
+    """지정한 줄 수의 채팅 로그 생성 (같은 seed면 같은 결과)"""
+    rng = random.Random(seed)
+    return "\n".join(generate_chat_line(rng) for _ in range(line_count))
+
+
+def generate_spreadsheet(row_count: int, seed: int = 42, delimiter: str = "\t") -> str:
+    """엑셀에서 복사한 것과 같은 표 데이터 생성 (체크박스, 수량, 내용, 비고)"""
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(row_count):
+        quantity = rng.choice([f"{rng.randint(1, 500)}개", str(rng.randint(1, 500)), f"약 {rng.randint(1, 99)}.5", ""])
+        rows.append(delimiter.join([rng.choice(["O", "X", "", "✔"]), quantity,
+                                    rng.choice(MESSAGES), rng.choice(NAMES)]))
+    return "\n".join(rows)
+
+
+def generate_guidelines(preset_count: int, rules_per_preset: int,
+                        replacements_per_preset: int = 0, seed: int = 42) -> Dict[str, Any]:
+    """대용량 가이드라인 데이터 생성"""
+    rng = random.Random(seed)
+    guidelines: Dict[str, Any] = {}
+    for preset in range(preset_count):
+        guideline: Dict[str, Any] = {
+            "description": f"벤치마크 가이드라인 {preset}",
+            "rules": [f"규칙 {preset}-{rule}: {rng.choice(MESSAGES)}" for rule in range(rules_per_preset)],
+        }
+        if replacements_per_preset:
+            guideline["replacements"] = {
+                f"문구{preset}_{index}": f"치환{index}" for index in range(replacements_per_preset)
+            }
+        guidelines[f"프리셋_{preset:04d}"] = guideline
+    return guidelines
+
+
+def write_guidelines_file(directory: Path, preset_count: int, rules_per_preset: int,
+                          replacements_per_preset: int = 0, seed: int = 42) -> Path:
+    """대용량 guidelines.json 파일 생성"""
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / "guidelines.json"
+    data = generate_guidelines(preset_count, rules_per_preset, replacements_per_preset, seed)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    return path
+
+
+def generate_ocr_images(count: int, seed: int = 42, size: tuple = (480, 160)) -> List[Any]:
+    """OCR 벤치마크용 이미지 생성 (PIL이 없으면 빈 리스트)"""
+    try:
+        from PIL import Image, ImageDraw, ImageFont  # type: ignore
+    except ImportError:
+        return []
+
+    rng = random.Random(seed)
+    font: Optional[Any] = None
+    for font_name in ("malgun.ttf", "NanumGothic.ttf", "arial.ttf"):
+        try:
+            font = ImageFont.truetype(font_name, 18)
+            break
+        except Exception:
+            continue
+    if font is None:
+        font = ImageFont.load_default()
+
+    images = []
+    for _ in range(count):
+        image = Image.new('RGB', size, color='white')
+        draw = ImageDraw.Draw(image)
+        lines = [generate_chat_line(rng) or rng.choice(MESSAGES) for _ in range(3)]
+        draw.text((10, 10), "\n".join(lines), fill='black', font=font)
+        images.append(image)
+    return images
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+성능 벤치마크 실행 스크립트
+TextProcessor, 표 붙여넣기 변환, OCRProcessor, GuidelineManager의 단계별 처리량과 지연 시간을 측정합니다.
+
+사용 예:
+    python -m benchmarks.run_benchmarks --lines 20000
+    python -m benchmarks.run_benchmarks --compare benchmarks/results/이전결과.json
+"""
+
+import argparse
+import datetime
+import json
+import logging
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+# 프로젝트 루트를 sys.path에 추가
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks import corpus  # noqa: E402
+
+RESULTS_DIR = PROJECT_ROOT / "benchmarks" / "results"
+# 시간 주석 결과를 재현 가능하게 고정
+REFERENCE_TIME = datetime.datetime(2025, 1, 1, 9, 0, 0)
+
+
+def _percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """정렬된 값에서 백분위수 계산 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def measure_stage(items: Sequence[Any], func: Callable[[Any], Any],
+                  lines_per_item: Callable[[Any], int],
+                  bytes_per_item: Callable[[Any], int]) -> Dict[str, Any]:
+    """항목별로 함수를 실행하며 처리량/지연 시간/최대 메모리 측정"""
+    latencies: List[float] = []
+    total_lines = 0
+    total_bytes = 0
+
+    # 1차: 시간 측정 (tracemalloc 오버헤드 없이)
+    started = time.perf_counter()
+    for item in items:
+        item_started = time.perf_counter()
+        func(item)
+        latencies.append(time.perf_counter() - item_started)
+        total_lines += lines_per_item(item)
+        total_bytes += bytes_per_item(item)
+    elapsed = time.perf_counter() - started
+
+    # 2차: 최대 메모리 측정
+    tracemalloc.start()
+    try:
+        for item in items:
+            func(item)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "items": len(items),
+        "seconds": round(elapsed, 6),
+        "lines_per_sec": round(total_lines / elapsed, 1) if elapsed else 0.0,
+        "mb_per_sec": round(total_bytes / (1024 * 1024) / elapsed, 3) if elapsed else 0.0,
+        "p50_ms": round(_percentile(latencies, 0.50) * 1000, 4),
+        "p99_ms": round(_percentile(latencies, 0.99) * 1000, 4),
+        "peak_memory_kb": round(peak_bytes / 1024, 1),
+    }
+
+
+def _utf8_size(text: str) -> int:
+    return len(text.encode('utf-8'))
+
+
+def bench_text_processor(text: str, repeat: int) -> Dict[str, Dict[str, Any]]:
+    """TextProcessor 단계 벤치마크"""
+    from src.core.text_processor import TextProcessor
+
+    processor = TextProcessor()
+    today_str = processor.get_today_str(REFERENCE_TIME)
+    lines = [line for line in text.splitlines() if line.strip()]
+
+    return {
+        "text.clean_line": measure_stage(
+            lines,
+            lambda line: processor.clean_line(line, today_str),
+            lambda line: 1,
+            _utf8_size,
+        ),
+        "text.process_text": measure_stage(
+            [text] * repeat,
+            lambda batch: processor.process_text(batch, REFERENCE_TIME),
+            lambda batch: batch.count("\n") + 1,
+            _utf8_size,
+        ),
+    }
+
+
+def bench_tabular_paste(rows: int, repeat: int, seed: int) -> Dict[str, Dict[str, Any]]:
+    """엑셀/CSV 붙여넣기 변환 벤치마크"""
+    from src.core import tabular_paste
+
+    results = {}
+    for name, delimiter in (("paste.tsv", "\t"), ("paste.csv", ",")):
+        text = corpus.generate_spreadsheet(rows, seed, delimiter)
+        results[name] = measure_stage(
+            [text] * repeat,
+            lambda batch: tabular_paste.convert_to_list_format(batch, tabular_paste.sniff_dialect(batch)),
+            lambda batch: batch.count("\n") + 1,
+            _utf8_size,
+        )
+    return results
+
+
+def bench_guideline_manager(presets: int, rules: int, replacements: int,
+                            repeat: int) -> Dict[str, Dict[str, Any]]:
+    """GuidelineManager 대용량 파일 로드 벤치마크"""
+    from src.core.guideline_manager import GuidelineManager
+
+    with tempfile.TemporaryDirectory(prefix="bench_guidelines_") as temp_dir:
+        path = corpus.write_guidelines_file(Path(temp_dir), presets, rules, replacements)
+        file_size = path.stat().st_size
+        manager = GuidelineManager(Path(temp_dir))
+        line_count = presets * rules
+
+        return {
+            "guidelines.load": measure_stage(
+                list(range(repeat)),
+                lambda _: manager.load_guidelines(),
+                lambda _: line_count,
+                lambda _: file_size,
+            ),
+        }
+
+
+def bench_ocr(image_count: int) -> Dict[str, Dict[str, Any]]:
+    """OCRProcessor 전처리/인식 벤치마크 (환경이 없으면 건너뜀)"""
+    try:
+        from src.ocr.ocr_processor import OCRProcessor
+    except Exception as e:
+        return {"ocr": {"skipped": f"OCR module could not be imported: {e}"}}
+
+    processor = OCRProcessor()
+    if not processor.is_available():
+        return {"ocr": {"skipped": "pytesseract or PIL is not installed"}}
+
+    images = corpus.generate_ocr_images(image_count)
+    if not images:
+        return {"ocr": {"skipped": "could not generate images"}}
+
+    def image_bytes(image: Any) -> int:
+        return image.size[0] * image.size[1] * len(image.getbands())
+
+    results = {
+        "ocr.preprocess": measure_stage(
+            images, processor.preprocess_image, lambda image: 1, image_bytes
+        ),
+    }
+    try:
+        variants = [processor.preprocess_image(image) for image in images]
+        results["ocr.extract"] = measure_stage(
+            variants, processor.extract_text_from_images, lambda variant: 1,
+            lambda variant: sum(image_bytes(image) for image in variant),
+        )
+    except Exception as e:
+        results["ocr.extract"] = {"skipped": f"tesseract failed: {e}"}
+    return results
+
+
+def compare_results(current: Dict[str, Any], previous: Dict[str, Any]) -> List[str]:
+    """이전 결과와 비교한 표 생성"""
+    rows = [f"{'stage':<22}{'lines/s (prev)':>18}{'lines/s (now)':>16}{'change':>10}"]
+    for stage, result in current["stages"].items():
+        before = previous.get("stages", {}).get(stage, {})
+        if "lines_per_sec" not in result or "lines_per_sec" not in before:
+            continue
+        change = (result["lines_per_sec"] / before["lines_per_sec"] - 1) * 100 if before["lines_per_sec"] else 0.0
+        rows.append(f"{stage:<22}{before['lines_per_sec']:>18.1f}{result['lines_per_sec']:>16.1f}{change:>+9.1f}%")
+    return rows
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    """선택한 벤치마크 실행"""
+    from src import __version__
+    from src.utils.perf_metrics import metrics
+
+    if args.metrics:
+        metrics.reset()
+        metrics.enable()
+
+    stages: Dict[str, Any] = {}
+    if "text" in args.stages:
+        text = corpus.generate_chat_log(args.lines, args.seed)
+        stages.update(bench_text_processor(text, args.repeat))
+    if "paste" in args.stages:
+        stages.update(bench_tabular_paste(args.paste_rows, args.repeat, args.seed))
+    if "guidelines" in args.stages:
+        stages.update(bench_guideline_manager(args.presets, args.rules, args.replacements, args.repeat))
+    if "ocr" in args.stages:
+        stages.update(bench_ocr(args.images))
+
+    result: Dict[str, Any] = {
+        "meta": {
+            "version": __version__,
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "lines": args.lines,
+            "repeat": args.repeat,
+            "log_level": args.log_level,
+        },
+        "stages": stages,
+    }
+    if args.metrics:
+        # 계측 오버헤드가 처리량 수치에 포함되므로 단계별 비중 확인용으로만 사용
+        result["metrics"] = metrics.snapshot()
+        metrics.disable()
+    return result
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="text_cleaner 성능 벤치마크")
+    parser.add_argument("--stages", nargs="+", default=["text", "paste", "guidelines", "ocr"],
+                        choices=["text", "paste", "guidelines", "ocr"], help="실행할 벤치마크 단계")
+    parser.add_argument("--lines", type=int, default=10000, help="합성 채팅 로그 줄 수")
+    parser.add_argument("--repeat", type=int, default=5, help="배치 단위 측정 반복 횟수")
+    parser.add_argument("--paste-rows", type=int, default=100000, help="붙여넣기 변환 표 행 수")
+    parser.add_argument("--seed", type=int, default=42, help="합성 데이터 seed")
+    parser.add_argument("--presets", type=int, default=500, help="가이드라인 프리셋 수")
+    parser.add_argument("--rules", type=int, default=50, help="프리셋당 규칙 수")
+    parser.add_argument("--replacements", type=int, default=20, help="프리셋당 문구 치환 수")
+    parser.add_argument("--images", type=int, default=3, help="OCR 이미지 수")
+    parser.add_argument("--log-level", default="WARNING",
+                        help="측정 중 로그 레벨 (INFO면 라인별 로그 비용까지 포함)")
+    parser.add_argument("--metrics", action="store_true",
+                        help="앱 내부 단계별 계측 결과도 함께 저장")
+    parser.add_argument("--output", type=Path, help="결과 JSON 경로 (기본: benchmarks/results/)")
+    parser.add_argument("--compare", type=Path, help="비교할 이전 결과 JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=getattr(logging, args.log_level.upper(), logging.WARNING),
+                        format='%(asctime)s - %(levelname)s - %(message)s')
+
+    result = run(args)
+
+    output = args.output
+    if output is None:
+        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        output = RESULTS_DIR / f"bench_{result['meta']['version']}_{stamp}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+
+    for stage, stage_result in result["stages"].items():
+        print(f"{stage}: {json.dumps(stage_result, ensure_ascii=False)}")
+    print(f"결과 저장: {output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+        print("\n".join(compare_results(result, previous)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+시작 시간 벤치마크
+새 프로세스에서 main()과 같은 순서로 시작 단계를 실행해 단계별 시간과 모듈 임포트 시간을 측정합니다.
+화면이 없는 환경에서는 Tk 단계만 건너뜁니다.
+
+사용 예:
+    python -m benchmarks.startup_benchmark --runs 5
+    python -m benchmarks.startup_benchmark --compare benchmarks/results/이전결과.json --fail-over-budget
+"""
+
+import argparse
+import datetime
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+RESULTS_DIR = PROJECT_ROOT / "benchmarks" / "results"
+
+# -X importtime 출력에서 누적 시간을 기록할 모듈
+TRACKED_MODULES = {
+    "src.core.text_processor": "TextProcessor",
+    "src.core.guideline_manager": "GuidelineManager",
+    "src.core.upgrade_manager": "UpgradeManager",
+    "src.ocr.ocr_processor": "OCRProcessor",
+    "src.ui.app": "TextCleanerApp",
+}
+
+
+def run_child(cache_dir: Path) -> Dict[str, Any]:
+    """자식 프로세스: main()과 같은 순서로 시작 단계 실행"""
+    from src.utils.startup_profiler import startup
+
+    import logging
+    logging.basicConfig(level=logging.WARNING)
+
+    from src.utils.environment import bootstrap_environment
+    with startup.phase("env.bootstrap"):
+        environment = bootstrap_environment(cache_dir)
+    with startup.phase("import.core"):
+        from src.core import TextProcessor, GuidelineManager  # noqa: F401
+    with startup.phase("import.app"):
+        from src.ui.app import TextCleanerApp
+
+    skipped: Optional[str] = None
+    try:
+        import tkinter as tk
+        with startup.phase("tk.root"):
+            root = tk.Tk()
+    except Exception as e:
+        skipped = f"Tk unavailable: {e}"
+    else:
+        root.withdraw()
+        TextCleanerApp(root)
+        root.update()
+        startup.mark("first_paint")
+        root.destroy()
+
+    # 첫 화면 이후(지연 로드)에 임포트되는 모듈
+    with startup.phase("import.OCRProcessor"):
+        import src.ocr.ocr_processor  # noqa: F401
+    with startup.phase("import.UpgradeManager"):
+        import src.core.upgrade_manager  # noqa: F401
+
+    result = startup.to_dict()
+    result["env_cached"] = environment.get("cached", False)
+    result["skipped"] = skipped
+    return result
+
+
+def parse_importtime(stderr: str) -> Dict[str, float]:
+    """-X importtime 출력에서 추적 모듈의 누적 임포트 시간(ms) 추출"""
+    times: Dict[str, float] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = [part.strip() for part in line[len("import time:"):].split("|")]
+        if len(parts) != 3 or not parts[1].isdigit():
+            continue
+        name = parts[2]
+        if name in TRACKED_MODULES:
+            times[f"import.{TRACKED_MODULES[name]}"] = int(parts[1]) / 1000
+    return times
+
+
+def run_once(cache_dir: Path) -> Dict[str, Any]:
+    """자식 프로세스 한 번 실행"""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "benchmarks.startup_benchmark",
+         "--child", "--cache-dir", str(cache_dir)],
+        cwd=str(PROJECT_ROOT), capture_output=True, text=True, encoding="utf-8", timeout=120,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"startup child failed: {completed.stderr[-2000:]}")
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    result["module_imports"] = parse_importtime(completed.stderr)
+    return result
+
+
+def summarize(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """여러 실행 결과의 단계별 중앙값"""
+    phases: Dict[str, Dict[str, Any]] = {}
+    for name in runs[0]["phases"]:
+        durations = [run["phases"][name]["duration_ms"] for run in runs if name in run["phases"]]
+        budget = runs[0]["phases"][name]["budget_ms"]
+        median = statistics.median(durations)
+        phases[name] = {
+            "median_ms": round(median, 2),
+            "max_ms": round(max(durations), 2),
+            "budget_ms": budget,
+            "over_budget": budget is not None and median > budget,
+        }
+    module_imports: Dict[str, float] = {}
+    for name in runs[0]["module_imports"]:
+        module_imports[name] = round(statistics.median(
+            run["module_imports"][name] for run in runs if name in run["module_imports"]), 2)
+    return {"phases": phases, "module_imports_ms": module_imports}
+
+
+def compare_results(current: Dict[str, Any], previous: Dict[str, Any]) -> List[str]:
+    """이전 결과와 비교한 표 생성"""
+    rows = [f"{'phase':<26}{'prev ms':>10}{'now ms':>10}{'change':>10}"]
+    previous_phases = previous.get("warm", {}).get("phases", {})
+    for name, result in current["warm"]["phases"].items():
+        before = previous_phases.get(name)
+        if not before or not before["median_ms"]:
+            continue
+        change = (result["median_ms"] / before["median_ms"] - 1) * 100
+        rows.append(f"{name:<26}{before['median_ms']:>10.1f}{result['median_ms']:>10.1f}{change:>+9.1f}%")
+    return rows
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="text_cleaner 시작 시간 벤치마크")
+    parser.add_argument("--runs", type=int, default=5, help="캐시가 채워진 상태의 반복 실행 횟수")
+    parser.add_argument("--output", type=Path, help="결과 JSON 경로 (기본: benchmarks/results/)")
+    parser.add_argument("--compare", type=Path, help="비교할 이전 결과 JSON")
+    parser.add_argument("--fail-over-budget", action="store_true",
+                        help="예산을 넘는 단계가 있으면 종료 코드 1 반환")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--cache-dir", type=Path, help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = parse_args(argv)
+    if args.child:
+        print(json.dumps(run_child(args.cache_dir)))
+        return 0
+
+    from src import __version__
+
+    with tempfile.TemporaryDirectory(prefix="bench_startup_") as temp_dir:
+        cache_dir = Path(temp_dir)
+        # 첫 실행은 환경 캐시가 비어 있는 상태(설치 직후), 이후는 캐시 사용
+        cold = run_once(cache_dir)
+        warm_runs = [run_once(cache_dir) for _ in range(max(1, args.runs))]
+
+    result = {
+        "meta": {
+            "version": __version__,
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "runs": len(warm_runs),
+            "skipped": warm_runs[0]["skipped"],
+        },
+        "cold": summarize([cold]),
+        "warm": summarize(warm_runs),
+    }
+
+    output = args.output
+    if output is None:
+        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        output = RESULTS_DIR / f"startup_{__version__}_{stamp}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+
+    print(f"{'phase':<38}{'cold ms':>10}{'warm ms':>10}{'budget':>10}  status")
+    for name, warm in result["warm"]["phases"].items():
+        cold_ms = result["cold"]["phases"].get(name, {}).get("median_ms", 0.0)
+        budget = "-" if warm["budget_ms"] is None else f"{warm['budget_ms']:.0f}"
+        status = "OVER" if warm["over_budget"] else "ok"
+        print(f"{name:<38}{cold_ms:>10.1f}{warm['median_ms']:>10.1f}{budget:>10}  {status}")
+    for name, value in result["warm"]["module_imports_ms"].items():
+        print(f"{name + ' (importtime)':<38}{'':>10}{value:>10.1f}")
+    if result["meta"]["skipped"]:
+        print(f"skipped: {result['meta']['skipped']}")
+    print(f"결과 저장: {output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+        print("\n".join(compare_results(result, previous)))
+
+    if args.fail_over_budget and any(phase["over_budget"] for phase in result["warm"]["phases"].values()):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
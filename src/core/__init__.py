@@ -14,8 +14,20 @@ except ImportError as e:
     raise ImportError("Failed to import GuidelineManager from guideline_manager module. Please ensure 'src/core/guideline_manager.py' exists and is error-free.") from e
 
 try:
-    from .upgrade_manager import UpgradeManager
+    from .document import Document
 except ImportError as e:
-    raise ImportError("Failed to import UpgradeManager from upgrade_manager module. Please ensure 'src/core/upgrade_manager.py' exists and is error-free.") from e
+    raise ImportError("Failed to import Document from document module. Please ensure 'src/core/document.py' exists and is error-free.") from e
 
-__all__ = ['TextProcessor', 'GuidelineManager', 'UpgradeManager']
\ No newline at end of file
+
+def __getattr__(name):
+    """UpgradeManager는 psutil/tkinter 등을 불러오므로 처음 사용할 때 임포트"""
+    if name == 'UpgradeManager':
+        try:
+            from .upgrade_manager import UpgradeManager
+        except ImportError as e:
+            raise ImportError("Failed to import UpgradeManager from upgrade_manager module. Please ensure 'src/core/upgrade_manager.py' exists and is error-free.") from e
+        globals()['UpgradeManager'] = UpgradeManager
+        return UpgradeManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+__all__ = ['TextProcessor', 'GuidelineManager', 'Document', 'UpgradeManager']
\ No newline at end of file
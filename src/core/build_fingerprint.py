@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+빌드 지문 모듈
+소스/데이터 파일과 의존성 버전으로 빌드 지문을 만들어 증분 빌드 여부를 결정합니다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+# 지문 형식이 바뀌면 올려서 기존 지문을 무효화
+FINGERPRINT_VERSION = 2
+FINGERPRINT_FILE = ".build_fingerprint.json"
+
+# 지문에 포함할 빌드 입력 (base_path 기준)
+SOURCE_PATTERNS = ("src/**/*.py",)
+DATA_PATTERNS = ("guidelines.json", "runtime_hook.py", "fonts/**/*")
+
+# 빌드 모드
+BUILD_SKIP = "skip"
+BUILD_INCREMENTAL = "incremental"
+BUILD_FULL = "full"
+
+_REQUIREMENT_NAME = re.compile(r'^\s*([A-Za-z0-9][A-Za-z0-9._-]*)')
+
+# 빌드 인터프리터에서 실행할 버전 조회 스크립트 (인자: 패키지 이름들)
+_VERSION_QUERY = (
+    "import json, sys\n"
+    "from importlib import metadata\n"
+    "versions = {}\n"
+    "for name in sys.argv[1:]:\n"
+    "    try:\n"
+    "        versions[name] = metadata.version(name)\n"
+    "    except metadata.PackageNotFoundError:\n"
+    "        versions[name] = 'missing'\n"
+    "print(json.dumps({'python': sys.version, 'packages': versions}, sort_keys=True))\n"
+)
+VERSION_QUERY_TIMEOUT = 60
+
+
+def _iter_files(base_path: Path, patterns: Iterable[str]) -> List[Path]:
+    """패턴에 맞는 파일 목록 (캐시 폴더 제외, 정렬)"""
+    files = set()
+    for pattern in patterns:
+        for path in base_path.glob(pattern):
+            if path.is_file() and "__pycache__" not in path.parts:
+                files.add(path)
+    return sorted(files)
+
+
+def hash_files(base_path: Path, patterns: Iterable[str]) -> str:
+    """파일 경로와 내용으로 하나의 해시 계산"""
+    digest = hashlib.sha256()
+    for path in _iter_files(base_path, patterns):
+        digest.update(path.relative_to(base_path).as_posix().encode('utf-8'))
+        digest.update(b'\0')
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def requirement_names(base_path: Path) -> List[str]:
+    """버전을 확인할 패키지 이름 (requirements.txt + pyinstaller, 정렬)"""
+    names: List[str] = ["pyinstaller"]
+    requirements = base_path / "requirements.txt"
+    if requirements.exists():
+        for line in requirements.read_text(encoding='utf-8').splitlines():
+            match = _REQUIREMENT_NAME.match(line)
+            if match and not line.lstrip().startswith("#"):
+                names.append(match.group(1).lower())
+    return sorted(set(names))
+
+
+def dependency_versions(base_path: Path, python_command: Optional[Sequence[str]] = None,
+                        env: Optional[Mapping[str, str]] = None) -> Optional[Dict[str, Any]]:
+    """빌드 인터프리터의 sys.version과 패키지 설치 버전 (없는 패키지는 'missing')
+
+    python_command(예: ["py", "-3.11"])로 한 번 실행해 조회하므로 빌드에 쓰는 인터프리터와
+    업그레이드 관리자를 실행한 인터프리터가 달라도 실제 빌드 환경의 버전을 얻습니다.
+    조회에 실패하면 None을 반환합니다.
+    """
+    command = list(python_command) if python_command else [sys.executable]
+    try:
+        result = subprocess.run(command + ["-c", _VERSION_QUERY] + requirement_names(base_path),
+                                capture_output=True, text=True, encoding='utf-8',
+                                env=dict(env) if env is not None else None,
+                                timeout=VERSION_QUERY_TIMEOUT)
+    except (OSError, subprocess.SubprocessError) as e:
+        logging.warning("빌드 인터프리터 버전 조회 실패: %s", e)
+        return None
+    if result.returncode != 0:
+        logging.warning("빌드 인터프리터 버전 조회 실패 (코드 %s): %s", result.returncode, result.stderr.strip())
+        return None
+    try:
+        versions = json.loads(result.stdout)
+    except ValueError:
+        logging.warning("빌드 인터프리터 버전 조회 결과를 읽을 수 없음: %r", result.stdout[:200])
+        return None
+    return versions if isinstance(versions, dict) else None
+
+
+def compute_build_fingerprint(base_path: Path, build_options: Iterable[str] = (),
+                              python_command: Optional[Sequence[str]] = None,
+                              env: Optional[Mapping[str, str]] = None) -> Dict[str, Any]:
+    """빌드 입력 지문 계산
+
+    sources는 앱 코드, data는 함께 번들되는 파일, environment는 빌드 인터프리터 버전,
+    의존성 버전과 빌드 옵션입니다.
+    environment가 같으면 PyInstaller 작업 폴더(분석 캐시)를 재사용할 수 있습니다.
+    버전 조회에 실패하면 interpreter/dependencies가 None이 되어 항상 전체 빌드합니다.
+    """
+    options = [str(option) for option in build_options]
+    versions = dependency_versions(base_path, python_command, env)
+    if versions is None:
+        interpreter = dependencies = None
+    else:
+        interpreter = hashlib.sha256(str(versions.get("python")).encode('utf-8')).hexdigest()
+        dependencies = hashlib.sha256(
+            json.dumps(versions.get("packages"), sort_keys=True).encode('utf-8')).hexdigest()
+    environment = {
+        "interpreter": interpreter,
+        "dependencies": dependencies,
+        "options": hashlib.sha256("\0".join(options).encode('utf-8')).hexdigest(),
+        "platform": sys.platform,
+    }
+    return {
+        "version": FINGERPRINT_VERSION,
+        "sources": hash_files(base_path, SOURCE_PATTERNS),
+        "data": hash_files(base_path, DATA_PATTERNS),
+        "environment": environment,
+    }
+
+
+def load_fingerprint(work_path: Path) -> Optional[Dict[str, Any]]:
+    """마지막 성공 빌드의 지문 (없거나 읽을 수 없으면 None)"""
+    try:
+        with open(work_path / FINGERPRINT_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else None
+    except (OSError, ValueError):
+        return None
+
+
+def save_fingerprint(work_path: Path, fingerprint: Dict[str, Any]) -> None:
+    """성공한 빌드의 지문 저장 (임시 파일에 쓴 뒤 교체)"""
+    try:
+        work_path.mkdir(parents=True, exist_ok=True)
+        target = work_path / FINGERPRINT_FILE
+        temp_file = target.with_suffix('.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(fingerprint, f, ensure_ascii=False, indent=2)
+        os.replace(temp_file, target)
+    except OSError as e:
+        logging.warning("빌드 지문 저장 실패: %s", e)
+
+
+def decide_build_mode(previous: Optional[Dict[str, Any]], current: Dict[str, Any],
+                      output_exists: bool) -> str:
+    """이전 지문과 비교해 빌드 모드 결정
+
+    - skip: 입력이 모두 같고 결과물이 남아 있음
+    - incremental: 의존성/옵션이 같고 앱 코드나 데이터만 바뀜 (작업 폴더 재사용)
+    - full: 첫 빌드이거나 의존성/옵션이 바뀜 (--clean 빌드)
+    """
+    if not previous or previous.get("version") != current["version"]:
+        return BUILD_FULL
+    environment = current["environment"]
+    if environment.get("dependencies") is None or previous.get("environment") != environment:
+        return BUILD_FULL
+    if (output_exists and previous.get("sources") == current["sources"]
+            and previous.get("data") == current["data"]):
+        return BUILD_SKIP
+    return BUILD_INCREMENTAL
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+빌드 진행률 모듈
+서브프로세스 출력을 리더 스레드와 큐로 한 줄씩 받아 PyInstaller 단계를 진행률로 바꾸고,
+일정 시간 출력이 없으면 멈춤으로 판단합니다.
+"""
+
+import logging
+import os
+import queue
+import signal
+import subprocess
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from src.utils.lazy_import import OptionalModule
+
+psutil = OptionalModule("psutil")
+
+# 진행 이벤트: {"percent": float, "phase": str, "line": Optional[str], "stalled": bool}
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+# (출력에 포함된 문자열, 도달 진행률, 단계 이름) - PyInstaller 로그 순서
+PYINSTALLER_PHASES: Sequence[Tuple[str, float, str]] = (
+    ("INFO: PyInstaller:", 2.0, "PyInstaller 시작"),
+    (" Analysis", 5.0, "분석 준비"),
+    ("Analyzing base_library.zip", 10.0, "기본 라이브러리 분석"),
+    ("Processing module hooks", 30.0, "모듈 훅 처리"),
+    ("Analyzing hidden import", 45.0, "숨은 임포트 분석"),
+    ("Looking for ctypes DLLs", 55.0, "DLL 검색"),
+    ("Looking for dynamic libraries", 58.0, "동적 라이브러리 검색"),
+    ("Warnings written to", 65.0, "분석 완료"),
+    (" PYZ", 70.0, "PYZ 생성"),
+    (" PKG", 78.0, "PKG 생성"),
+    ("Bootloader", 82.0, "부트로더 복사"),
+    (" EXE", 85.0, "EXE 생성"),
+    (" COLLECT", 90.0, "파일 수집"),
+    ("Build complete", 100.0, "빌드 완료"),
+)
+
+# 단계 표시가 없는 줄마다 다음 단계 진행률 쪽으로 다가가는 비율
+LINE_PROGRESS_STEP = 0.01
+
+# 기본 제한 시간 (초)
+STALL_WARNING_SECONDS = 30.0
+IDLE_TIMEOUT_SECONDS = 180.0
+# 오류 보고용으로 보관할 마지막 출력 줄 수
+OUTPUT_TAIL_LINES = 200
+
+
+class PyInstallerProgress:
+    """PyInstaller 출력 줄을 진행률로 변환 (단계는 앞으로만 진행)"""
+
+    def __init__(self, phases: Sequence[Tuple[str, float, str]] = PYINSTALLER_PHASES):
+        self.phases = phases
+        self.percent = 0.0
+        self.phase = "시작"
+        self._next = 0
+
+    def feed(self, line: str) -> bool:
+        """출력 한 줄 반영 (진행률이나 단계가 바뀌면 True)"""
+        for index in range(self._next, len(self.phases)):
+            marker, percent, phase = self.phases[index]
+            if marker in line:
+                self._next = index + 1
+                self.percent = max(self.percent, percent)
+                self.phase = phase
+                return True
+
+        # 단계 사이의 긴 구간(모듈 분석 등)은 다음 단계 진행률에 점근적으로 접근
+        if self._next < len(self.phases):
+            ceiling = self.phases[self._next][1]
+            step = (ceiling - self.percent) * LINE_PROGRESS_STEP
+            if step >= 0.1:
+                self.percent += step
+                return True
+        return False
+
+
+def kill_process_tree(process: subprocess.Popen) -> None:
+    """프로세스와 모든 하위 프로세스 종료
+
+    shell=True로 실행한 빌드는 직접 자식이 cmd.exe/sh이므로 자식만 죽이면
+    PyInstaller가 계속 실행되며 dist 폴더를 잠급니다.
+    """
+    if psutil.available:
+        try:
+            children = psutil.Process(process.pid).children(recursive=True)
+        except psutil.NoSuchProcess:
+            children = []
+        for child in children:
+            try:
+                child.kill()
+            except psutil.NoSuchProcess:
+                pass
+        process.kill()
+        psutil.wait_procs(children, timeout=5)
+    elif os.name == 'nt':
+        subprocess.run(['taskkill', '/F', '/T', '/PID', str(process.pid)],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    else:
+        # stream_process가 새 세션으로 시작하므로 프로세스 그룹 전체 종료
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except OSError:
+            process.kill()
+    process.wait()
+
+
+def stream_process(cmd: Any, on_line: Callable[[str], None], timeout: Optional[float] = None,
+                   idle_timeout: Optional[float] = IDLE_TIMEOUT_SECONDS,
+                   on_stall: Optional[Callable[[float], None]] = None,
+                   stall_warning: float = STALL_WARNING_SECONDS,
+                   **popen_kwargs: Any) -> Tuple[Optional[int], List[str]]:
+    """프로세스를 실행하고 출력(stdout+stderr)을 한 줄씩 on_line으로 전달
+
+    리더 스레드가 줄을 큐에 넣고 호출한 스레드는 큐에서 꺼내므로 출력이 없어도 막히지 않습니다.
+    stall_warning초 동안 출력이 없으면 on_stall(경과 초)을 부르고, idle_timeout초 동안 없거나
+    전체가 timeout초를 넘으면 프로세스 트리 전체를 종료하고 returncode None을 반환합니다.
+    반환값: (returncode, 마지막 출력 줄들)
+    """
+    if os.name != 'nt':
+        # 하위 프로세스까지 한 번에 종료할 수 있도록 별도 프로세스 그룹으로 실행
+        popen_kwargs.setdefault('start_new_session', True)
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+                               encoding='utf-8', errors='replace', **popen_kwargs)
+    lines: "queue.Queue[Optional[str]]" = queue.Queue()
+
+    def reader() -> None:
+        try:
+            for raw in process.stdout:
+                lines.put(raw.rstrip('\r\n'))
+        except (OSError, ValueError):
+            pass
+        finally:
+            lines.put(None)
+
+    threading.Thread(target=reader, name="process-output", daemon=True).start()
+
+    tail: Deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+    started = last_output = time.monotonic()
+    stall_reported = False
+    while True:
+        now = time.monotonic()
+        if timeout is not None and now - started > timeout:
+            logging.error("프로세스 시간 초과 (%.0f초): %s", timeout, cmd)
+            break
+        idle = now - last_output
+        if idle_timeout is not None and idle > idle_timeout:
+            logging.error("프로세스 출력 없음 %.0f초 - 멈춤으로 판단하고 종료", idle)
+            break
+        if not stall_reported and idle > stall_warning:
+            stall_reported = True
+            logging.warning("프로세스 출력이 %.0f초째 없습니다", idle)
+            if on_stall is not None:
+                on_stall(idle)
+
+        try:
+            line = lines.get(timeout=0.5)
+        except queue.Empty:
+            continue
+        if line is None:
+            return process.wait(), list(tail)
+        last_output = time.monotonic()
+        stall_reported = False
+        tail.append(line)
+        if line:
+            on_line(line)
+
+    kill_process_tree(process)
+    return None, list(tail)
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+델타 업그레이드 모듈
+미리 빌드된 패키지(폴더 또는 zip)의 해시 매니페스트를 설치 폴더와 비교해
+바뀐 파일만 스테이징 폴더로 복사한 뒤 폴더를 교체합니다.
+"""
+
+import json
+import logging
+import os
+import shutil
+import zipfile
+from pathlib import Path, PurePosixPath, PureWindowsPath
+from typing import Any, Dict, List, Optional, Union
+
+from src.core import integrity
+
+MANIFEST_FILE = integrity.MANIFEST_FILE
+MANIFEST_FORMAT = 1
+
+# 해시 계산 시 읽기 단위
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# 매니페스트에 있어도 설치 폴더의 파일을 덮어쓰거나 지우지 않는 사용자 파일
+PRESERVE_FILES = ("guidelines.json",)
+
+
+def file_sha256(path: Path) -> str:
+    """파일 SHA-256"""
+    return integrity.hash_file(path)
+
+
+def build_manifest(directory: Path, version: Optional[str] = None) -> Dict[str, Any]:
+    """폴더 내 모든 파일의 해시 매니페스트 생성 (매니페스트 파일 자체는 제외, 병렬 해시)"""
+    paths = [path for path in sorted(directory.rglob("*"))
+             if path.is_file() and path.relative_to(directory).as_posix() != MANIFEST_FILE]
+    files: Dict[str, Dict[str, Any]] = {}
+    for path, digest in integrity.hash_files(paths).items():
+        if digest is None:
+            raise OSError(f"파일을 읽을 수 없습니다: {path}")
+        files[path.relative_to(directory).as_posix()] = {"sha256": digest, "size": path.stat().st_size}
+    return {"format": MANIFEST_FORMAT, "version": version, "files": files}
+
+
+def write_manifest(directory: Path, version: Optional[str] = None) -> Path:
+    """빌드 결과 폴더에 manifest.json 작성 (패키지 배포 전 빌드 머신에서 실행)
+
+    서명 키(integrity.get_manifest_key)가 설정되어 있으면 HMAC 서명을 붙입니다.
+    """
+    manifest = build_manifest(directory, version)
+    key = integrity.get_manifest_key()
+    if key is not None:
+        integrity.sign_manifest(manifest, key)
+    path = directory / MANIFEST_FILE
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    logging.info("매니페스트 작성: %s (%d개 파일)", path, len(manifest["files"]))
+    return path
+
+
+def _safe_relative(relative: str) -> str:
+    """매니페스트 경로 검증 (절대 경로, 드라이브/UNC, 역슬래시, 상위 폴더 참조 거부)
+
+    Windows에서는 역슬래시도 구분자이므로 POSIX와 Windows 규칙 모두로 확인합니다.
+    """
+    posix = PurePosixPath(relative)
+    windows = PureWindowsPath(relative)
+    if (not posix.parts or "\\" in relative or ":" in relative
+            or posix.is_absolute() or windows.is_absolute() or windows.drive or windows.root
+            or ".." in posix.parts or ".." in windows.parts):
+        raise ValueError(f"잘못된 패키지 경로: {relative}")
+    return posix.as_posix()
+
+
+def _contained_path(root: Path, relative: str) -> Path:
+    """root 아래의 경로 (링크 등으로 root 밖을 가리키면 거부)"""
+    path = root / relative
+    if not path.resolve().is_relative_to(root.resolve()):
+        raise ValueError(f"패키지 경로가 설치 폴더를 벗어납니다: {relative}")
+    return path
+
+
+class _DirectoryPackage:
+    """폴더 형태의 패키지"""
+
+    def __init__(self, root: Path):
+        self.root = root
+
+    def read_manifest(self) -> Dict[str, Any]:
+        with open(self.root / MANIFEST_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def extract(self, relative: str, target: Path) -> None:
+        shutil.copy2(self.root / relative, target)
+
+    def close(self) -> None:
+        pass
+
+
+class _ZipPackage:
+    """zip 형태의 패키지 (manifest.json이 zip 최상위에 있어야 함)"""
+
+    def __init__(self, archive: Path):
+        self.archive = zipfile.ZipFile(archive)
+
+    def read_manifest(self) -> Dict[str, Any]:
+        return json.loads(self.archive.read(MANIFEST_FILE).decode('utf-8'))
+
+    def extract(self, relative: str, target: Path) -> None:
+        with self.archive.open(relative) as src, open(target, 'wb') as dst:
+            shutil.copyfileobj(src, dst, HASH_CHUNK_SIZE)
+
+    def close(self) -> None:
+        self.archive.close()
+
+
+def _open_package(source: Path) -> Union[_DirectoryPackage, _ZipPackage]:
+    if source.is_dir():
+        return _DirectoryPackage(source)
+    if zipfile.is_zipfile(source):
+        return _ZipPackage(source)
+    raise ValueError(f"패키지는 폴더 또는 zip 파일이어야 합니다: {source}")
+
+
+def _previous_files(install_dir: Path) -> Dict[str, Any]:
+    """설치 폴더의 기존 매니페스트가 관리하던 파일 (없거나 읽을 수 없으면 빈 dict)"""
+    previous = integrity.load_manifest(install_dir)
+    return previous["files"] if previous is not None else {}
+
+
+def plan_delta(manifest: Dict[str, Any], install_dir: Path) -> Dict[str, List[str]]:
+    """설치 폴더와 매니페스트 비교 (크기가 같은 파일만 해시 비교)
+
+    삭제 대상은 기존 매니페스트에 있던 파일뿐입니다. 매니페스트에 없던 파일(사용자가
+    저장한 guidelines.json 등)과 PRESERVE_FILES는 preserved로 분류해 새 폴더로 옮깁니다.
+    """
+    plan: Dict[str, List[str]] = {"changed": [], "unchanged": [], "removed": [], "preserved": []}
+    files: Dict[str, Dict[str, Any]] = manifest["files"]
+    for relative, entry in files.items():
+        local = install_dir / relative
+        if relative in PRESERVE_FILES and local.is_file():
+            plan["preserved"].append(relative)
+            continue
+        try:
+            same = local.stat().st_size == entry["size"] and file_sha256(local) == entry["sha256"]
+        except OSError:
+            same = False
+        plan["unchanged" if same else "changed"].append(relative)
+
+    if install_dir.exists():
+        owned = _previous_files(install_dir)
+        for path in install_dir.rglob("*"):
+            if path.is_file():
+                relative = path.relative_to(install_dir).as_posix()
+                if relative in files or relative == MANIFEST_FILE:
+                    continue
+                plan["removed" if relative in owned else "preserved"].append(relative)
+    return plan
+
+
+def _link_or_copy(source: Path, target: Path) -> None:
+    """바뀌지 않은 파일은 하드 링크 (다른 볼륨이면 복사)"""
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+
+def _stage(package: Union[_DirectoryPackage, _ZipPackage], manifest: Dict[str, Any],
+           plan: Dict[str, List[str]], install_dir: Path, staging_dir: Path) -> None:
+    """스테이징 폴더 구성: 바뀐 파일은 패키지에서 복사 후 해시 검증"""
+    if staging_dir.exists():
+        shutil.rmtree(staging_dir)
+    staging_dir.mkdir(parents=True)
+
+    for relative in plan["unchanged"] + plan["preserved"]:
+        target = _contained_path(staging_dir, relative)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        _link_or_copy(install_dir / relative, target)
+
+    for relative in plan["changed"]:
+        target = _contained_path(staging_dir, relative)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        package.extract(relative, target)
+        if file_sha256(target) != manifest["files"][relative]["sha256"]:
+            raise ValueError(f"패키지 파일 해시 불일치: {relative}")
+
+    with open(staging_dir / MANIFEST_FILE, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+
+def _swap(install_dir: Path, staging_dir: Path, backup_dir: Path) -> None:
+    """설치 폴더를 스테이징 폴더로 교체 (같은 볼륨 안의 이름 변경, 실패 시 되돌림)"""
+    if backup_dir.exists():
+        shutil.rmtree(backup_dir)
+    had_install = install_dir.exists()
+    if had_install:
+        os.replace(install_dir, backup_dir)
+    try:
+        os.replace(staging_dir, install_dir)
+    except OSError:
+        if had_install:
+            os.replace(backup_dir, install_dir)
+        raise
+
+
+def apply_package(source: Path, install_dir: Path, keep_backup: bool = True) -> Optional[Dict[str, Any]]:
+    """델타 패키지 적용
+
+    설치 폴더 옆에 <이름>.staging을 만들어 완성한 뒤 한 번에 교체하고,
+    기존 폴더는 <이름>.old로 남깁니다(keep_backup=False면 삭제).
+    성공하면 변경 통계를, 실패하면 None을 반환하며 설치 폴더는 그대로 유지됩니다.
+    """
+    install_dir = install_dir.resolve()
+    staging_dir = install_dir.with_name(install_dir.name + ".staging")
+    backup_dir = install_dir.with_name(install_dir.name + ".old")
+
+    try:
+        package = _open_package(source)
+    except (OSError, ValueError) as e:
+        logging.error("델타 패키지 열기 실패: %s", e)
+        return None
+
+    try:
+        manifest = package.read_manifest()
+        if manifest.get("format") != MANIFEST_FORMAT or not isinstance(manifest.get("files"), dict):
+            raise ValueError("지원하지 않는 매니페스트 형식")
+        signature = integrity.verify_signature(manifest, integrity.get_manifest_key())
+        if signature == "invalid":
+            raise ValueError("매니페스트 서명 불일치")
+        logging.info("패키지 매니페스트 서명: %s", signature)
+        manifest["files"] = {_safe_relative(rel): entry for rel, entry in manifest["files"].items()}
+
+        plan = plan_delta(manifest, install_dir)
+        logging.info("델타 업그레이드 계획 (버전 %s): 변경 %d, 유지 %d, 삭제 %d, 보존 %d",
+                     manifest.get("version"), len(plan["changed"]), len(plan["unchanged"]),
+                     len(plan["removed"]), len(plan["preserved"]))
+        if not plan["changed"] and not plan["removed"]:
+            logging.info("설치 폴더가 이미 최신입니다: %s", install_dir)
+            return {"version": manifest.get("version"), "changed": 0, "removed": 0,
+                    "unchanged": len(plan["unchanged"]), "preserved": len(plan["preserved"])}
+
+        _stage(package, manifest, plan, install_dir, staging_dir)
+        _swap(install_dir, staging_dir, backup_dir)
+        if not keep_backup and backup_dir.exists():
+            shutil.rmtree(backup_dir, ignore_errors=True)
+        logging.info("델타 업그레이드 완료: %s", install_dir)
+        return {
+            "version": manifest.get("version"),
+            "changed": len(plan["changed"]),
+            "removed": len(plan["removed"]),
+            "unchanged": len(plan["unchanged"]),
+            "preserved": len(plan["preserved"]),
+        }
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile) as e:
+        logging.error("델타 업그레이드 실패: %s", e)
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        return None
+    finally:
+        package.close()
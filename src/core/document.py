@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+입력 문서 모델
+편집 위젯과 처리 코드가 함께 읽는 단일 문서 사본을 버전으로 관리합니다.
+"""
+
+from typing import Callable, Optional, Tuple
+
+
+class Document:
+    """버전이 붙은 입력 문서
+
+    편집 위젯이 원본일 때는 bind_source()로 읽기 함수를 연결하고, 키 입력마다
+    invalidate()로 버전만 올립니다(O(1)). 실제 텍스트는 text/snapshot()으로
+    읽을 때 한 번만 가져옵니다. 읽기 함수가 위젯을 읽는 경우 Tk 스레드에서만 접근해야 합니다.
+    버전을 기억해 두면 그 사이에 내용이 바뀌었는지 텍스트를 읽지 않고 확인할 수 있습니다.
+    """
+
+    def __init__(self, text: str = ""):
+        self._text = text
+        self._version = 0
+        self._stale = False
+        self._source: Optional[Callable[[], str]] = None
+
+    @property
+    def version(self) -> int:
+        """내용이 바뀔 때마다 1씩 증가"""
+        return self._version
+
+    @property
+    def text(self) -> str:
+        """현재 문서 텍스트 (원본이 바뀌었으면 이때 한 번 읽음)"""
+        if self._stale and self._source is not None:
+            self._text = self._source()
+            self._stale = False
+        return self._text
+
+    def snapshot(self) -> Tuple[int, str]:
+        """(버전, 텍스트) - 처리 스레드에 넘길 때 사용"""
+        return self._version, self.text
+
+    def bind_source(self, source: Callable[[], str]) -> None:
+        """편집 위젯 등 원본 텍스트를 읽는 함수 연결"""
+        self._source = source
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """원본이 바뀌었음을 기록 (텍스트는 읽지 않음)"""
+        self._stale = True
+        self._version += 1
+
+    def set_text(self, text: str) -> None:
+        """문서 내용을 직접 설정"""
+        self._text = text
+        self._stale = False
+        self._version += 1
@@ -8,10 +8,11 @@ text_cleaner의 가이드라인 관리 기능을 담당합니다.
 import json
 import logging
 import shutil
-import sys
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from src.utils import resource_paths
+
 
 class GuidelineManager:
     """가이드라인 관리 클래스"""
@@ -19,17 +20,9 @@ class GuidelineManager:
     def __init__(self, user_data_path: Path):
         self.user_data_path = user_data_path
         
-        # PyInstaller 환경에서 파일 경로 처리 개선
-        if hasattr(sys, 'frozen'):
-            # exe 실행 시: exe와 같은 디렉토리에서 먼저 찾기
-            exe_dir = Path(sys.executable).parent
-            self.guidelines_file = exe_dir / "guidelines.json"
-            # exe 디렉토리에 없으면 user_data_path에서 찾기
-            if not self.guidelines_file.exists():
-                self.guidelines_file = user_data_path / "guidelines.json"
-        else:
-            # Python 스크립트 실행 시: 기존 방식
-            self.guidelines_file = user_data_path / "guidelines.json"
+        # exe 실행 시 exe 디렉토리 등 여러 후보 중 처음 찾은 파일을 사용 (위치는 프로세스 동안 기억)
+        self.guidelines_file = (resource_paths.find_guidelines_file(user_data_path)
+                                or user_data_path / resource_paths.GUIDELINES_FILE)
         
         self.guidelines: Dict[str, Any] = {}
         self.load_guidelines()
@@ -39,38 +32,16 @@ class GuidelineManager:
         try:
             logging.info("가이드라인 파일 경로: %s", self.guidelines_file)
             
-            # 여러 경로에서 가이드라인 파일 찾기
-            possible_paths = []
-            
-            if hasattr(sys, 'frozen'):
-                # PyInstaller 환경
-                exe_dir = Path(sys.executable).parent
-                possible_paths = [
-                    exe_dir / "guidelines.json",  # exe와 같은 디렉토리
-                    exe_dir.parent / "guidelines.json",  # 상위 디렉토리
-                    self.user_data_path / "guidelines.json",  # 사용자 데이터 경로
-                ]
-            else:
-                # Python 스크립트 환경
-                script_dir = Path(__file__).parent
-                possible_paths = [
-                    script_dir / "guidelines.json",  # 스크립트와 같은 디렉토리
-                    self.user_data_path / "guidelines.json",  # 사용자 데이터 경로
-                ]
-            
-            # 각 경로에서 파일 찾기
-            for path in possible_paths:
-                logging.info("가이드라인 파일 확인: %s", path)
-                if path.exists():
-                    try:
-                        with open(path, 'r', encoding='utf-8') as f:
-                            self.guidelines = json.load(f)
-                            self.guidelines_file = path  # 찾은 경로로 업데이트
-                            logging.info("가이드라인 로드 완료: %d개 (경로: %s)", len(self.guidelines), path)
-                            return True
-                    except (json.JSONDecodeError, PermissionError) as e:
-                        logging.warning("파일 읽기 실패 (%s): %s", path, e)
-                        continue
+            # 기억한 위치를 바로 읽고, 읽을 수 없을 때만 후보 경로를 다시 확인
+            path = resource_paths.find_guidelines_file(self.user_data_path)
+            if path is not None and self._read_guidelines(path):
+                return True
+            if path is not None:
+                resource_paths.remember_guidelines_file(self.user_data_path, None)
+                for candidate in resource_paths.guidelines_candidates(self.user_data_path):
+                    if candidate != path and candidate.exists() and self._read_guidelines(candidate):
+                        resource_paths.remember_guidelines_file(self.user_data_path, candidate)
+                        return True
             
             # 파일을 찾지 못한 경우 기본 가이드라인 생성
             logging.warning("가이드라인 파일을 찾을 수 없음 - 기본 가이드라인 생성")
@@ -81,6 +52,18 @@ class GuidelineManager:
             logging.error("가이드라인 로드 실패: %s: %s", type(e).__name__, e)
             return False
 
+    def _read_guidelines(self, path: Path) -> bool:
+        """가이드라인 파일 읽기 (성공하면 그 경로를 현재 파일로 사용)"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self.guidelines = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError, PermissionError) as e:
+            logging.warning("파일 읽기 실패 (%s): %s", path, e)
+            return False
+        self.guidelines_file = path  # 찾은 경로로 업데이트
+        logging.info("가이드라인 로드 완료: %d개 (경로: %s)", len(self.guidelines), path)
+        return True
+
     def create_default_guidelines(self) -> bool:
         """기본 가이드라인 생성"""
         try:
@@ -121,6 +104,7 @@ class GuidelineManager:
         try:
             with open(self.guidelines_file, 'w', encoding='utf-8') as f:
                 json.dump(self.guidelines, f, ensure_ascii=False, indent=2)
+            resource_paths.remember_guidelines_file(self.user_data_path, self.guidelines_file)
             logging.info("가이드라인 저장 완료")
             return True
         except (PermissionError, OSError) as e:
@@ -130,11 +114,7 @@ class GuidelineManager:
     def restore_guidelines_from_backup(self) -> bool:
         """백업에서 가이드라인 복원"""
         try:
-            if hasattr(sys, 'frozen'):
-                base_path = Path(sys.executable).parent.parent
-            else:
-                base_path = Path(__file__).parent
-            backup_path = base_path / "guidelines_backup" / "guidelines_backup.json"
+            backup_path = resource_paths.guidelines_backup_base() / "guidelines_backup" / "guidelines_backup.json"
             
             if backup_path.exists():
                 shutil.copy2(backup_path, self.guidelines_file)
@@ -200,21 +180,44 @@ class GuidelineManager:
         """특정 가이드라인 반환"""
         return self.guidelines.get(name)
 
-    def add_guideline(self, name: str, description: str, rules: list) -> bool:
-        """새 가이드라인 추가"""
+    def get_replacements(self, name: Optional[str]) -> Dict[str, str]:
+        """가이드라인의 문구 치환 테이블 반환 ({"원문": "치환 문구"})"""
+        guideline = self.guidelines.get(name) if name else None
+        if not isinstance(guideline, dict):
+            return {}
+        
+        replacements = guideline.get("replacements", {})
+        if not isinstance(replacements, dict):
+            logging.warning("가이드라인 '%s'의 replacements 형식이 잘못됨 - 무시", name)
+            return {}
+        return {
+            str(source): str(target)
+            for source, target in replacements.items()
+            if source
+        }
+
+    def add_guideline(self, name: str, description: str, rules: list,
+                      replacements: Optional[Dict[str, str]] = None) -> bool:
+        """새 가이드라인 추가 (replacements를 생략하면 기존 치환 테이블 유지)"""
         try:
-            self.guidelines[name] = {
+            if replacements is None:
+                replacements = self.get_replacements(name)
+            guideline: Dict[str, Any] = {
                 "description": description,
                 "rules": rules
             }
+            if replacements:
+                guideline["replacements"] = replacements
+            self.guidelines[name] = guideline
             return self.save_guidelines()
         except Exception as e:
             logging.error("가이드라인 추가 실패: %s", e)
             return False
 
-    def update_guideline(self, name: str, description: str, rules: list) -> bool:
+    def update_guideline(self, name: str, description: str, rules: list,
+                         replacements: Optional[Dict[str, str]] = None) -> bool:
         """가이드라인 수정"""
-        return self.add_guideline(name, description, rules)
+        return self.add_guideline(name, description, rules, replacements)
 
     def delete_guideline(self, name: str) -> bool:
         """가이드라인 삭제"""
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+무결성 검증 모듈
+큰 버퍼로 파일을 병렬 해시하고 (경로, 크기, 수정 시각)을 키로 결과를 캐시하며,
+설치 폴더를 HMAC 서명된 매니페스트(manifest.json)와 비교합니다.
+"""
+
+import hashlib
+import hmac
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from src.utils import resource_paths
+
+# 해시 읽기 버퍼 (hashlib은 큰 버퍼에서 GIL을 풀어 스레드 병렬화가 가능)
+HASH_BUFFER_SIZE = 1024 * 1024
+MAX_HASH_WORKERS = 8
+
+MANIFEST_FILE = "manifest.json"
+SIGNATURE_ALGORITHM = "hmac-sha256"
+
+# 매니페스트 서명 키 (환경 변수 값 또는 키 파일 경로)
+MANIFEST_KEY_ENV = "TEXT_CLEANER_MANIFEST_KEY"
+MANIFEST_KEY_FILE_ENV = "TEXT_CLEANER_MANIFEST_KEY_FILE"
+MANIFEST_KEY_FILE = "manifest.key"
+
+CACHE_FILE = "integrity_cache.json"
+CACHE_VERSION = 1
+
+
+def hash_file(path: Path) -> str:
+    """파일 SHA-256 (재사용 버퍼로 읽어 큰 파일도 추가 할당 없이 처리)"""
+    digest = hashlib.sha256()
+    buffer = bytearray(HASH_BUFFER_SIZE)
+    view = memoryview(buffer)
+    with open(path, 'rb', buffering=0) as f:
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            digest.update(view[:size])
+    return digest.hexdigest()
+
+
+class DigestCache:
+    """(경로, 크기, 수정 시각) → SHA-256 캐시
+
+    크기나 수정 시각이 바뀐 파일만 다시 해시합니다. 여러 스레드에서 조회/갱신할 수 있고
+    save()는 바뀐 내용이 있을 때만 파일에 씁니다.
+    """
+
+    def __init__(self, cache_file: Optional[Path] = None):
+        self.cache_file = cache_file
+        self._entries: Dict[str, List[Any]] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        if cache_file is not None:
+            self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == CACHE_VERSION and isinstance(data.get("entries"), dict):
+                self._entries = data["entries"]
+        except (OSError, ValueError, AttributeError):
+            self._entries = {}
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        return os.path.normcase(os.path.abspath(path))
+
+    def get(self, path: Path, stat: os.stat_result) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(self._key(path))
+        if entry and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+            return entry[2]
+        return None
+
+    def put(self, path: Path, stat: os.stat_result, digest: str) -> None:
+        with self._lock:
+            self._entries[self._key(path)] = [stat.st_size, stat.st_mtime_ns, digest]
+            self._dirty = True
+
+    def save(self) -> None:
+        if self.cache_file is None or not self._dirty:
+            return
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.cache_file.with_suffix('.tmp')
+            with self._lock:
+                data = {"version": CACHE_VERSION, "entries": dict(self._entries)}
+                self._dirty = False
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(temp_file, self.cache_file)
+        except OSError as e:
+            logging.warning("무결성 캐시 저장 실패: %s", e)
+
+
+def cached_hash(path: Path, cache: Optional[DigestCache] = None) -> str:
+    """캐시를 거쳐 파일 해시 (크기/수정 시각이 같으면 다시 읽지 않음)"""
+    if cache is None:
+        return hash_file(path)
+    stat = os.stat(path)
+    digest = cache.get(path, stat)
+    if digest is None:
+        digest = hash_file(path)
+        cache.put(path, stat, digest)
+    return digest
+
+
+def hash_files(paths: Iterable[Path], cache: Optional[DigestCache] = None,
+               workers: Optional[int] = None) -> Dict[Path, Optional[str]]:
+    """여러 파일을 병렬로 해시 (읽을 수 없는 파일은 None)"""
+    paths = list(paths)
+
+    def task(path: Path) -> Optional[str]:
+        try:
+            return cached_hash(path, cache)
+        except OSError as e:
+            logging.debug("해시 계산 실패: %s (%s)", path, e)
+            return None
+
+    if workers is None:
+        workers = min(MAX_HASH_WORKERS, os.cpu_count() or 1)
+    if workers <= 1 or len(paths) <= 1:
+        return {path: task(path) for path in paths}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="integrity-hash") as executor:
+        return dict(zip(paths, executor.map(task, paths)))
+
+
+def default_key_dirs() -> List[Path]:
+    """manifest.key를 찾는 기본 폴더 (설치 폴더 밖의 사용자 데이터 폴더)"""
+    return [resource_paths.user_data_dir()]
+
+
+def get_manifest_key(search_dirs: Optional[Iterable[Path]] = None) -> Optional[bytes]:
+    """서명 키 (환경 변수 → 키 파일 환경 변수 → search_dirs의 manifest.key 순, 없으면 None)
+
+    search_dirs를 주지 않으면 default_key_dirs()를 사용하므로 호출하는 곳마다 같은 키를 찾습니다.
+    """
+    value = os.environ.get(MANIFEST_KEY_ENV)
+    if value:
+        return value.encode('utf-8')
+    candidates = []
+    if os.environ.get(MANIFEST_KEY_FILE_ENV):
+        candidates.append(Path(os.environ[MANIFEST_KEY_FILE_ENV]))
+    if search_dirs is None:
+        search_dirs = default_key_dirs()
+    candidates.extend(Path(directory) / MANIFEST_KEY_FILE for directory in search_dirs)
+    for candidate in candidates:
+        try:
+            key = candidate.read_bytes().strip()
+        except OSError:
+            continue
+        if key:
+            return key
+    return None
+
+
+def _canonical_bytes(manifest: Dict[str, Any]) -> bytes:
+    body = {key: value for key, value in manifest.items() if key != "signature"}
+    return json.dumps(body, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def sign_manifest(manifest: Dict[str, Any], key: bytes) -> Dict[str, Any]:
+    """매니페스트에 HMAC-SHA256 서명 추가"""
+    signature = hmac.new(key, _canonical_bytes(manifest), hashlib.sha256).hexdigest()
+    manifest["signature"] = {"algorithm": SIGNATURE_ALGORITHM, "value": signature}
+    return manifest
+
+
+def verify_signature(manifest: Dict[str, Any], key: Optional[bytes]) -> str:
+    """서명 확인 결과: valid / invalid / unsigned(키와 서명 모두 없음) / unchecked(키 없음)
+
+    키가 있으면 서명이 없는 매니페스트도 invalid입니다 (서명을 지워 검사를 피할 수 없도록).
+    """
+    signature = manifest.get("signature")
+    if key is None:
+        return "unchecked" if isinstance(signature, dict) else "unsigned"
+    if not isinstance(signature, dict):
+        return "invalid"
+    if signature.get("algorithm") != SIGNATURE_ALGORITHM:
+        return "invalid"
+    expected = hmac.new(key, _canonical_bytes(manifest), hashlib.sha256).hexdigest()
+    return "valid" if hmac.compare_digest(expected, str(signature.get("value", ""))) else "invalid"
+
+
+def load_manifest(directory: Path) -> Optional[Dict[str, Any]]:
+    try:
+        with open(directory / MANIFEST_FILE, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        return manifest if isinstance(manifest.get("files"), dict) else None
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def verify_tree(install_dir: Path, manifest: Optional[Dict[str, Any]] = None,
+                cache: Optional[DigestCache] = None, key: Optional[bytes] = None,
+                workers: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    """설치 폴더를 매니페스트와 비교
+
+    반환값: {"ok", "signature", "checked", "modified", "missing"}
+    (매니페스트가 없으면 None). 서명이 invalid면 해시가 모두 맞아도 ok는 False입니다.
+    """
+    if manifest is None:
+        manifest = load_manifest(install_dir)
+        if manifest is None:
+            return None
+
+    signature = verify_signature(manifest, key)
+    files: Dict[str, Dict[str, Any]] = manifest["files"]
+    missing: List[str] = []
+    modified: List[str] = []
+    to_hash: Dict[Path, str] = {}
+    for relative, entry in files.items():
+        path = install_dir / relative
+        try:
+            size = path.stat().st_size
+        except OSError:
+            missing.append(relative)
+            continue
+        if size != entry.get("size", size):
+            modified.append(relative)
+        else:
+            to_hash[path] = relative
+
+    for path, digest in hash_files(to_hash, cache, workers).items():
+        if digest != files[to_hash[path]].get("sha256"):
+            modified.append(to_hash[path])
+
+    return {
+        "ok": not missing and not modified and signature != "invalid",
+        "signature": signature,
+        "checked": len(files),
+        "modified": sorted(modified),
+        "missing": sorted(missing),
+    }
+
+
+def verify_installation(install_dir: Path, cache: Optional[DigestCache] = None,
+                        key_dirs: Optional[Iterable[Path]] = None) -> Optional[Dict[str, Any]]:
+    """설치 폴더 전체 검증 후 결과 로그 기록 (캐시 파일이 있으면 저장)
+
+    서명 키는 설치 폴더 밖(key_dirs, 기본은 사용자 데이터 폴더 또는 환경 변수)에 두어야 의미가 있습니다.
+    """
+    try:
+        key = get_manifest_key(key_dirs)
+        result = verify_tree(install_dir, cache=cache, key=key)
+    except Exception as e:
+        logging.warning("설치 무결성 검증 실패: %s", e)
+        return None
+    finally:
+        if cache is not None:
+            cache.save()
+
+    if result is None:
+        logging.info("설치 매니페스트 없음 - 무결성 검증 건너뜀: %s", install_dir)
+    elif result["ok"]:
+        logging.info("설치 무결성 확인: 파일 %d개, 서명 %s", result["checked"], result["signature"])
+    else:
+        logging.warning("설치 무결성 불일치: 변경 %d개, 누락 %d개, 서명 %s (예: %s)",
+                        len(result["modified"]), len(result["missing"]), result["signature"],
+                        (result["modified"] + result["missing"])[:5])
+    return result
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스냅샷 백업 모듈
+백업할 파일을 내용 해시로 저장소(.objects)에 한 번만 보관하고, 각 스냅샷은
+저장소 파일의 하드 링크로 구성합니다. 로그는 gzip으로 압축해 보관하며 보존 개수를 넘는 스냅샷은 정리합니다.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.core.delta_upgrade import HASH_CHUNK_SIZE
+
+SNAPSHOT_MANIFEST = "snapshot.json"
+SNAPSHOT_FORMAT = 1
+OBJECTS_DIR = ".objects"
+
+# 기본 보존 스냅샷 수
+DEFAULT_KEEP = 5
+
+
+def _iter_sources(base_path: Path, files: Iterable[str], log_dir: Optional[str]) -> Dict[str, bool]:
+    """백업 대상 {상대 경로: 압축 여부}"""
+    sources: Dict[str, bool] = {}
+    for name in files:
+        if (base_path / name).is_file():
+            sources[Path(name).as_posix()] = False
+    if log_dir and (base_path / log_dir).is_dir():
+        for path in sorted((base_path / log_dir).rglob("*")):
+            if path.is_file():
+                sources[path.relative_to(base_path).as_posix()] = True
+    return sources
+
+
+def _object_path(store: Path, digest: str, compressed: bool) -> Path:
+    return store / digest[:2] / (digest + (".gz" if compressed else ""))
+
+
+def _store_object(source: Path, store: Path, compressed: bool) -> Tuple[str, int, bool]:
+    """원본을 한 번 읽으며 임시 파일에 쓰고 해시한 뒤 해시 이름의 객체로 교체
+
+    해시는 실제로 쓴 바이트로 계산하므로 쓰는 중인 로그도 객체 내용과 해시가 어긋나지 않습니다.
+    (해시, 크기, 새로 저장했는지)를 반환하며 같은 객체가 이미 있으면 임시 파일은 버립니다.
+    """
+    store.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(suffix=".tmp", dir=store)
+    temp_file = Path(temp_name)
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with os.fdopen(fd, 'wb') as raw, open(source, 'rb') as src:
+            dst = gzip.GzipFile(fileobj=raw, mode='wb') if compressed else raw
+            for chunk in iter(lambda: src.read(HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+                size += len(chunk)
+                dst.write(chunk)
+            if compressed:
+                dst.close()
+        if not compressed:
+            shutil.copystat(source, temp_file)
+
+        target = _object_path(store, digest.hexdigest(), compressed)
+        if target.exists():
+            temp_file.unlink()
+            return digest.hexdigest(), size, False
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(temp_file, target)
+        return digest.hexdigest(), size, True
+    except OSError:
+        temp_file.unlink(missing_ok=True)
+        raise
+
+
+def _link_or_copy(source: Path, target: Path) -> str:
+    """저장소 객체를 스냅샷에 하드 링크 (지원하지 않는 볼륨이면 복사)"""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.link(source, target)
+        return "link"
+    except OSError:
+        shutil.copy2(source, target)
+        return "copy"
+
+
+def list_snapshots(backup_root: Path) -> List[Path]:
+    """완성된 스냅샷 폴더 목록 (오래된 순)"""
+    if not backup_root.is_dir():
+        return []
+    return sorted(path for path in backup_root.iterdir()
+                  if path.is_dir() and path.name != OBJECTS_DIR and (path / SNAPSHOT_MANIFEST).is_file())
+
+
+def load_snapshot_manifest(snapshot: Path) -> Optional[Dict[str, Any]]:
+    try:
+        with open(snapshot / SNAPSHOT_MANIFEST, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        return manifest if manifest.get("format") == SNAPSHOT_FORMAT else None
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def create_snapshot(base_path: Path, backup_root: Path, files: Iterable[str],
+                    log_dir: Optional[str] = "logs", keep: int = DEFAULT_KEEP) -> Optional[Path]:
+    """스냅샷 생성 후 보존 정책 적용
+
+    직전 스냅샷과 크기/수정 시각이 같은 파일은 다시 읽지 않고, 바뀐 파일(주로 새 로그)은
+    한 번 읽으며 해시와 복사를 함께 하므로 바뀐 파일만큼만 비용이 듭니다.
+    성공하면 스냅샷 폴더, 실패하면 None을 반환합니다.
+    """
+    store = backup_root / OBJECTS_DIR
+    snapshot = backup_root / datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    partial = snapshot.with_name(snapshot.name + ".partial")
+
+    previous_files: Dict[str, Dict[str, Any]] = {}
+    snapshots = list_snapshots(backup_root)
+    if snapshots:
+        previous = load_snapshot_manifest(snapshots[-1])
+        if previous:
+            previous_files = previous.get("files", {})
+
+    stats = {"stored": 0, "reused": 0, "link": 0, "copy": 0}
+    entries: Dict[str, Dict[str, Any]] = {}
+    try:
+        partial.mkdir(parents=True)
+        for relative, compressed in _iter_sources(base_path, files, log_dir).items():
+            source = base_path / relative
+            stat = source.stat()
+            cached = previous_files.get(relative)
+            if (cached and cached.get("size") == stat.st_size and cached.get("mtime_ns") == stat.st_mtime_ns
+                    and cached.get("compressed") == compressed
+                    and _object_path(store, cached["sha256"], compressed).exists()):
+                digest, size = cached["sha256"], stat.st_size
+                stats["reused"] += 1
+            else:
+                digest, size, stored = _store_object(source, store, compressed)
+                stats["stored" if stored else "reused"] += 1
+
+            target = partial / (relative + (".gz" if compressed else ""))
+            stats[_link_or_copy(_object_path(store, digest, compressed), target)] += 1
+            # 크기는 실제로 복사한 바이트 (복사 중 로그가 늘었으면 다음 스냅샷에서 다시 읽음)
+            entries[relative] = {"sha256": digest, "size": size,
+                                 "mtime_ns": stat.st_mtime_ns, "compressed": compressed}
+
+        manifest = {"format": SNAPSHOT_FORMAT, "created": datetime.now().isoformat(), "files": entries}
+        with open(partial / SNAPSHOT_MANIFEST, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(partial, snapshot)
+    except OSError as e:
+        logging.error("스냅샷 백업 실패: %s", e)
+        shutil.rmtree(partial, ignore_errors=True)
+        return None
+
+    logging.info("스냅샷 백업 완료: %s (파일 %d개, 새 객체 %d, 재사용 %d, 링크 %d, 복사 %d)",
+                 snapshot, len(entries), stats["stored"], stats["reused"], stats["link"], stats["copy"])
+    prune_snapshots(backup_root, keep)
+    return snapshot
+
+
+def restore_snapshot(snapshot: Path, base_path: Path, include_logs: bool = False) -> bool:
+    """스냅샷의 파일을 base_path로 복원 (로그는 include_logs일 때 없는 파일만 복원)"""
+    manifest = load_snapshot_manifest(snapshot)
+    if manifest is None:
+        logging.error("스냅샷 매니페스트를 읽을 수 없습니다: %s", snapshot)
+        return False
+
+    try:
+        for relative, entry in manifest["files"].items():
+            target = base_path / relative
+            if entry.get("compressed"):
+                if not include_logs or target.exists():
+                    continue
+                target.parent.mkdir(parents=True, exist_ok=True)
+                with gzip.open(snapshot / (relative + ".gz"), 'rb') as src, open(target, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, HASH_CHUNK_SIZE)
+            else:
+                # 링크를 끊고 복사해야 복원된 파일을 고쳐도 저장소 객체가 바뀌지 않음
+                target.parent.mkdir(parents=True, exist_ok=True)
+                temp_file = target.with_name(target.name + ".restore")
+                shutil.copy2(snapshot / relative, temp_file)
+                os.replace(temp_file, target)
+            logging.info("복원 완료: %s", relative)
+        return True
+    except (OSError, KeyError) as e:
+        logging.error("스냅샷 복원 실패: %s", e)
+        return False
+
+
+def prune_snapshots(backup_root: Path, keep: int = DEFAULT_KEEP) -> int:
+    """최근 keep개를 제외한 스냅샷과 어디서도 참조하지 않는 객체를 삭제하고 삭제한 스냅샷 수 반환"""
+    snapshots = list_snapshots(backup_root)
+    removed = snapshots[:-keep] if keep > 0 else snapshots
+    for snapshot in removed:
+        shutil.rmtree(snapshot, ignore_errors=True)
+        logging.info("오래된 스냅샷 삭제: %s", snapshot)
+
+    # 중단된 스냅샷 정리
+    if backup_root.is_dir():
+        for partial in backup_root.glob("*.partial"):
+            shutil.rmtree(partial, ignore_errors=True)
+
+    store = backup_root / OBJECTS_DIR
+    if not store.is_dir():
+        return len(removed)
+
+    referenced: Set[str] = set()
+    for snapshot in list_snapshots(backup_root):
+        manifest = load_snapshot_manifest(snapshot)
+        if manifest is None:
+            # 읽을 수 없는 스냅샷이 있으면 객체를 지우지 않음
+            return len(removed)
+        for entry in manifest["files"].values():
+            referenced.add(_object_path(store, entry["sha256"], entry.get("compressed", False)).name)
+
+    freed = 0
+    for obj in store.rglob("*"):
+        if obj.is_file() and obj.name not in referenced:
+            try:
+                freed += obj.stat().st_size
+                obj.unlink()
+            except OSError as e:
+                logging.warning("백업 객체 삭제 실패: %s (%s)", obj, e)
+    if freed:
+        logging.info("참조되지 않는 백업 객체 정리: %.1f KB", freed / 1024)
+    return len(removed)
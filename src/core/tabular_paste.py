@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+표 형식 붙여넣기 변환 모듈
+엑셀/CSV에서 복사한 TSV·CSV 데이터를 감지해 리스트 형식으로 변환합니다.
+"""
+
+import csv
+import re
+from collections import Counter
+from typing import List, Optional, Type
+
+# 구분자 감지에 사용할 앞부분 줄 수
+SNIFF_SAMPLE_LINES = 50
+
+# 표로 판단하기 위한 최소 열 수 일관성 (같은 열 수인 줄의 비율)
+MIN_COLUMN_CONSISTENCY = 0.8
+
+# 리스트 형식으로 변환할 최대 열 수 (체크박스 | 숫자 | 내용)
+LIST_FORMAT_COLUMNS = 3
+
+# 숫자 추출 패턴 (앞쪽 숫자 우선, 없으면 뒤쪽 숫자)
+_LEADING_NUMBER = re.compile(r'^(\d+(?:\.\d+)?)')
+_TRAILING_NUMBER = re.compile(r'(\d+(?:\.\d+)?)$')
+
+
+def extract_number(value: str) -> str:
+    """셀 값에서 숫자 부분 추출 (숫자가 없으면 원래 값)"""
+    stripped = value.strip()
+    match = _LEADING_NUMBER.match(stripped) or _TRAILING_NUMBER.search(stripped)
+    return match.group(1) if match else value
+
+
+def extract_numbers(values: List[str]) -> List[str]:
+    """열 전체에 extract_number 적용 (양 끝이 숫자가 아닌 셀은 정규식 없이 통과)
+
+    값은 이미 strip된 상태여야 합니다.
+    """
+    leading = _LEADING_NUMBER.match
+    trailing = _TRAILING_NUMBER.search
+    result: List[str] = []
+    append = result.append
+    for value in values:
+        if value and value[0].isdecimal():
+            append(leading(value).group(1))
+        elif value and value[-1].isdecimal():
+            append(trailing(value).group(1))
+        else:
+            append(value)
+    return result
+
+
+class TabDialect(csv.excel_tab):
+    """엑셀 복사(TSV): 탭으로만 나누고 따옴표는 셀 내용으로 유지"""
+    quoting = csv.QUOTE_NONE
+
+
+class CommaDialect(csv.excel):
+    """CSV: 셀 전체를 감싼 따옴표만 인용으로 처리 (그 외 형태는 csv.Error)"""
+    strict = True
+
+
+class LiteralCommaDialect(csv.excel):
+    """따옴표 규칙에 맞지 않는 CSV 줄용: 쉼표로만 나누고 따옴표는 그대로 유지"""
+    quoting = csv.QUOTE_NONE
+
+
+def _content_lines(text: str, limit: Optional[int] = None) -> List[str]:
+    """빈 줄을 제외한 줄 목록 (limit이 있으면 앞부분만 잘라 전체 분할 없이)"""
+    head = text.split('\n', limit)[:limit] if limit else text.split('\n')
+    return [line.rstrip('\r') for line in head if line.strip()]
+
+
+def sniff_dialect(text: str) -> Optional[Type[csv.Dialect]]:
+    """표 형식이면 CSV 방언을, 아니면 None 반환
+
+    탭이 있으면 엑셀 복사로 보고 줄마다 탭으로만 나눕니다. 쉼표만 있으면 두 줄 이상이고
+    열 수(2 이상)가 일관될 때만 CSV로 봅니다. 쉼표가 들어간 한 줄 문장은 표가 아닙니다.
+    """
+    if '\t' not in text and ',' not in text:
+        return None
+    lines = _content_lines(text, SNIFF_SAMPLE_LINES)
+    if not lines:
+        return None
+    if any('\t' in line for line in lines):
+        return TabDialect
+    if len(lines) < 2:
+        return None
+
+    column_counts = Counter(len(row) for row in _parse_lines(lines, CommaDialect))
+    columns, matching = column_counts.most_common(1)[0]
+    if columns < 2 or matching / len(lines) < MIN_COLUMN_CONSISTENCY:
+        return None
+    return CommaDialect
+
+
+def is_tabular(text: str) -> bool:
+    """붙여넣은 텍스트가 표 형식인지 확인"""
+    return sniff_dialect(text) is not None
+
+
+def _parse_lines(lines: List[str], dialect: Type[csv.Dialect]) -> List[List[str]]:
+    """줄 단위 파싱 (한 줄이 한 행, 셀이 여러 줄에 걸치지 않음)
+
+    CSV 모듈(C 구현)로 한 번에 파싱하고, 따옴표가 규칙에 맞지 않아 오류가 나거나
+    닫히지 않은 따옴표가 다음 줄을 끌어오면 줄마다 다시 파싱해 그 줄만 따옴표를 글자로 취급합니다.
+    """
+    if dialect is TabDialect or '"' not in ''.join(lines):
+        return list(csv.reader(lines, dialect))
+    try:
+        rows = list(csv.reader(lines, dialect))
+        if len(rows) == len(lines):
+            return rows
+    except csv.Error:
+        pass
+
+    rows = []
+    for line in lines:
+        try:
+            parsed = list(csv.reader([line], dialect))
+        except csv.Error:
+            parsed = []
+        rows.append(parsed[0] if len(parsed) == 1 else next(csv.reader([line], LiteralCommaDialect)))
+    return rows
+
+
+def _default_dialect(text: str) -> Type[csv.Dialect]:
+    return sniff_dialect(text) or (TabDialect if '\t' in text else CommaDialect)
+
+
+def _read_rows(text: str, dialect: Type[csv.Dialect]) -> List[List[str]]:
+    """빈 줄을 제외한 전체 행 파싱"""
+    return _parse_lines(_content_lines(text), dialect)
+
+
+def convert_to_list_format(text: str, dialect: Optional[Type[csv.Dialect]] = None) -> str:
+    """표 데이터를 'A | B | C' 리스트 형식으로 변환 (앞 3개 열, 두 번째 열은 숫자만)"""
+    if dialect is None:
+        dialect = _default_dialect(text)
+    rows = _read_rows(text, dialect)
+    if not rows:
+        return ""
+
+    # 열 단위로 처리: 행마다 셀 수가 다를 수 있으므로 행별 길이를 따로 보관
+    widths = [min(len(row), LIST_FORMAT_COLUMNS) for row in rows]
+    columns = [[row[i].strip() if i < len(row) else "" for row in rows]
+               for i in range(max(widths))]
+    if len(columns) > 1:
+        columns[1] = extract_numbers(columns[1])
+
+    lines = []
+    for width, cells in zip(widths, zip(*columns)):
+        cells = cells[:width]
+        if any(cells):
+            lines.append(" | ".join(cells))
+    return '\n'.join(lines)
+
+
+def convert_to_numbered_list(text: str, dialect: Optional[Type[csv.Dialect]] = None) -> str:
+    """표 데이터를 '1. A | B' 형식의 번호 목록으로 변환 (빈 셀 제외)"""
+    if dialect is None:
+        dialect = _default_dialect(text)
+    numbered = []
+    for row in _read_rows(text, dialect):
+        cells = [cell.strip() for cell in row if cell.strip()]
+        if cells:
+            numbered.append(f"{len(numbered) + 1}. {' | '.join(cells)}")
+    return '\n'.join(numbered)
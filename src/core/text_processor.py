@@ -8,7 +8,11 @@ text_cleaner의 핵심 텍스트 처리 로직을 담당합니다.
 import datetime
 import logging
 import re
-from typing import List, Tuple
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from src.utils.perf_metrics import metrics
+
+from .literal_replacer import LiteralReplacer
 
 class TextProcessor:
     """텍스트 처리 클래스"""
@@ -69,13 +73,8 @@ class TextProcessor:
              lambda m: f"20{m.group(1)}/{int(m.group(2)):02d}/{int(m.group(3)):02d}"),
         ]
         
-        # 시간 패턴들
-        self.time_patterns = [
-            # AM/PM이 있는 시간
-            re.compile(r'(?<!\d)(\d{1,2}:\d{2}\s*[AP]M)(?!\d)'),
-            # 일반 시간
-            re.compile(r'(?<!\d)(\d{1,2}:\d{2}(?: ?[AP]M)?)(?!\d)')
-        ]
+        # 시간 토큰 패턴 (한 번의 스캔으로 AM/PM 유무까지 판별)
+        self.time_token_pattern = re.compile(r'(?<!\d)\d{1,2}:\d{2}(\s*[AP]M)?(?!\d)')
         
         # 요일 시간 → 시간 요일 변환 패턴
         self.weekday_time_pattern = re.compile(r'([월화수목금토일])요일\s*(\d{1,2}:\d{2}\s*[AP]M)')
@@ -85,6 +84,34 @@ class TextProcessor:
         
         # 날짜 슬래시 패턴 (이미 변환된 날짜 확인용)
         self.date_slash_pattern = re.compile(r'\d{4}/\d{2}/\d{2}')
+        
+        # 기본 치환 테이블 (날짜/시간 처리 전: 괄호 제거, 오전/오후 변환)
+        self.base_replacements: Dict[str, str] = {
+            "[": "", "]": "", "(": "", ")": "",
+            "오전": "AM", "오후": "PM",
+        }
+        
+        # 문구 치환 테이블 (공백 정리 후 적용, 가이드라인 치환이 추가됨)
+        self.phrase_replacements: Dict[str, str] = {
+            "보낸 메시지": "나",
+            "이 회원님에게 보낸 답장": "의",
+        }
+        
+        # 오토마톤은 테이블이 바뀔 때만 한 번 생성
+        self.base_replacer = LiteralReplacer(self.base_replacements)
+        self.custom_replacements: Dict[str, str] = {}
+        self.phrase_replacer = LiteralReplacer(self.phrase_replacements)
+
+    def set_custom_replacements(self, replacements: Optional[Mapping[str, str]]) -> None:
+        """가이드라인 문구 치환 테이블 설정 (기본 문구 테이블과 합쳐서 오토마톤 재생성)"""
+        custom = dict(replacements or {})
+        if custom == self.custom_replacements:
+            return
+        
+        self.custom_replacements = custom
+        # 처리 스레드가 사용 중일 수 있으므로 새 오토마톤을 만든 뒤 한 번에 교체
+        self.phrase_replacer = LiteralReplacer({**self.phrase_replacements, **custom})
+        self.logger.info(f"문구 치환 테이블 갱신: {len(self.phrase_replacer)}개")
 
     def process_date_formats(self, text: str) -> str:
         """다양한 날짜 형식을 표준 형식으로 변환"""
@@ -95,14 +122,27 @@ class TextProcessor:
         
         return processed_text
 
-    def process_time_formats(self, text: str) -> str:
-        """시간 형식을 처리하고 오늘 날짜 추가"""
-        today_str = datetime.datetime.now().strftime("%Y/%m/%d")
+    @staticmethod
+    def get_today_str(reference_time: Optional[datetime.datetime] = None) -> str:
+        """시간 주석에 사용할 날짜 문자열 반환 (기준 시각이 없으면 현재 시각)"""
+        if reference_time is None:
+            reference_time = datetime.datetime.now()
+        return reference_time.strftime("%Y/%m/%d")
+
+    def process_time_formats(self, text: str, today_str: Optional[str] = None) -> str:
+        """시간 형식을 처리하고 오늘 날짜 추가
+        
+        today_str을 넘기면 배치 전체가 같은 날짜를 사용하므로 결과가 재현 가능합니다.
+        """
+        if today_str is None:
+            today_str = self.get_today_str()
         processed_text = text
         
         # 오전/오후 변환
-        processed_text = re.sub(r'오전', 'AM', processed_text)
-        processed_text = re.sub(r'오후', 'PM', processed_text)
+        if '오전' in processed_text:
+            processed_text = processed_text.replace('오전', 'AM')
+        if '오후' in processed_text:
+            processed_text = processed_text.replace('오후', 'PM')
         
         # 요일 시간 → 시간 요일 변환
         processed_text = self.weekday_time_pattern.sub(
@@ -110,15 +150,28 @@ class TextProcessor:
             processed_text
         )
         
-        # AM/PM이 있는 시간에 오늘 날짜 추가
-        for time_pattern in self.time_patterns:
-            if re.search(time_pattern, processed_text) and not self.date_slash_pattern.search(processed_text):
-                time_match = re.search(time_pattern, processed_text)
-                if time_match:
-                    time_part = time_match.group(1)
-                    processed_text = re.sub(time_pattern, f"{today_str} {time_part}", processed_text)
+        # 이미 날짜가 있는 라인은 날짜를 추가하지 않음
+        if self.date_slash_pattern.search(processed_text):
+            return processed_text
         
-        return processed_text
+        # 시간 토큰을 한 번에 찾아서 제자리에서 날짜 추가
+        matches = list(self.time_token_pattern.finditer(processed_text))
+        if not matches:
+            return processed_text
+        
+        # AM/PM이 있는 시간이 하나라도 있으면 그 시간들에만 날짜 추가
+        meridiem_only = any(m.group(1) for m in matches)
+        parts: List[str] = []
+        last_end = 0
+        for m in matches:
+            if meridiem_only and not m.group(1):
+                continue
+            parts.append(processed_text[last_end:m.start()])
+            parts.append(f"{today_str} {m.group(0)}")
+            last_end = m.end()
+        parts.append(processed_text[last_end:])
+        
+        return ''.join(parts)
 
     def remove_youtube_links(self, text: str) -> Tuple[str, int]:
         """유튜브 링크 제거"""
@@ -130,54 +183,53 @@ class TextProcessor:
         """이름 뒤의 이모지도 포함하여 아무것도 제거하지 않음(이모지 보존)"""
         return text
 
-    def clean_line(self, line: str) -> str:
+    def clean_line(self, line: str, today_str: Optional[str] = None) -> str:
         """개별 라인 정리"""
         if not line.strip():
             return ""
         
+        # 단계별 계측 (비활성화 시 빈 측정기)
+        clock = metrics.stage_clock("text.stage")
         original_line = line
         self.logger.debug(f"원본 라인: {repr(original_line)}")
         
-        # 기본 정리
-        cleaned_line = re.sub(r'[\[\]\(\)]', '', line)
+        # 기본 정리 (괄호 제거, 오전/오후 변환을 한 번의 스캔으로 처리)
+        cleaned_line = self.base_replacer.replace(line)
         if cleaned_line != line:
-            self.logger.debug(f"괄호 제거: {repr(line)} → {repr(cleaned_line)}")
+            self.logger.debug(f"기본 치환: {repr(line)} → {repr(cleaned_line)}")
+        clock.lap("base_replace")
         
         # 날짜 형식 처리
         date_processed = self.process_date_formats(cleaned_line)
         if date_processed != cleaned_line:
             self.logger.debug(f"날짜 형식 변환: {repr(cleaned_line)} → {repr(date_processed)}")
         cleaned_line = date_processed
+        clock.lap("date")
         
         # 시간 형식 처리
-        time_processed = self.process_time_formats(cleaned_line)
+        time_processed = self.process_time_formats(cleaned_line, today_str)
         if time_processed != cleaned_line:
             self.logger.debug(f"시간 형식 변환: {repr(cleaned_line)} → {repr(time_processed)}")
         cleaned_line = time_processed
+        clock.lap("time")
         
         # 유튜브 링크 제거
         cleaned_line, _ = self.remove_youtube_links(cleaned_line)
         
         # 이름 이모지 제거
         cleaned_line = self.remove_name_emojis(cleaned_line)
+        clock.lap("youtube")
         
         # 추가 정리
         if cleaned_line.strip():
             cleaned_line = re.sub(r' +', ' ', cleaned_line)
             
-            # "보낸 메시지" → "나" 변환 (조건 수정)
-            if "보낸 메시지" in cleaned_line:
-                old_line = cleaned_line
-                cleaned_line = cleaned_line.replace("보낸 메시지", "나")
-                self.logger.info(f"텍스트 변환: '보낸 메시지' → '나': {repr(old_line)} → {repr(cleaned_line)}")
-            else:
-                self.logger.debug(f"'보낸 메시지' 없음: {repr(cleaned_line)}")
-            
-            # "이 회원님에게 보낸 답장" → "의" 변환
-            if "이 회원님에게 보낸 답장" in cleaned_line:
-                old_line = cleaned_line
-                cleaned_line = cleaned_line.replace("이 회원님에게 보낸 답장", "의")
-                self.logger.info(f"텍스트 변환: '이 회원님에게 보낸 답장' → '의': {repr(old_line)} → {repr(cleaned_line)}")
+            # 문구 치환 ("보낸 메시지" → "나", "이 회원님에게 보낸 답장" → "의", 가이드라인 치환)
+            old_line = cleaned_line
+            cleaned_line = self.phrase_replacer.replace(cleaned_line)
+            if cleaned_line != old_line:
+                self.logger.info(f"텍스트 변환: {repr(old_line)} → {repr(cleaned_line)}")
+            clock.lap("phrase")
             
             # | 구분자 제거
             if '|' in cleaned_line:
@@ -185,14 +237,25 @@ class TextProcessor:
                 cleaned_line = re.sub(r'\s*\|\s*', ' ', cleaned_line)
                 cleaned_line = re.sub(r' +', ' ', cleaned_line).strip()  # 연속 공백 정리
                 self.logger.info(f"구분자 제거: {repr(old_line)} → {repr(cleaned_line)}")
+                clock.lap("separator")
         
         if original_line != cleaned_line:
             self.logger.info(f"라인 변환 완료: {repr(original_line)} → {repr(cleaned_line)}")
         
+        clock.finish("text.clean_line")
         return cleaned_line
 
-    def process_text(self, text: str) -> Tuple[List[str], int]:
-        """전체 텍스트 처리"""
+    def process_text(self, text: str,
+                     reference_time: Optional[datetime.datetime] = None) -> Tuple[List[str], int]:
+        """전체 텍스트 처리
+        
+        reference_time은 시간 주석의 기준 시각입니다. 배치마다 한 번만 날짜를 계산합니다.
+        """
+        with metrics.timer("text.process_text"):
+            return self._process_text(text, self.get_today_str(reference_time))
+
+    def _process_text(self, text: str, today_str: str) -> Tuple[List[str], int]:
+        """process_text 본체"""
         self.logger.info(f"=== 텍스트 처리 시작 ===")
         self.logger.info(f"입력 텍스트 길이: {len(text)} 문자")
         self.logger.info(f"입력 텍스트 미리보기: {repr(text[:200])}...")
@@ -222,7 +285,7 @@ class TextProcessor:
             total_youtube_links_removed += links_removed
             
             # 라인 정리
-            cleaned_line = self.clean_line(line)
+            cleaned_line = self.clean_line(line, today_str)
             if cleaned_line.strip():
                 cleaned_lines.append(cleaned_line)
                 self.logger.debug(f"라인 {i} 처리 완료: {repr(line)} → {repr(cleaned_line)}")
@@ -234,6 +297,8 @@ class TextProcessor:
         self.logger.info(f"정리된 줄 수: {len(cleaned_lines)}")
         self.logger.info(f"제거된 줄 수: {len(lines) - len(cleaned_lines)}")
         self.logger.info(f"유튜브 링크 제거: {total_youtube_links_removed}개")
+        metrics.increment("text.lines_in", len(lines))
+        metrics.increment("text.lines_out", len(cleaned_lines))
         
         # 출력 텍스트 미리보기 로그
         output_text = '\n'.join(cleaned_lines)
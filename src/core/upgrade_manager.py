@@ -6,7 +6,6 @@ text_cleaner의 업그레이드 기능을 담당합니다.
 상업용 기준의 안정성과 보안을 제공합니다.
 """
 
-import hashlib
 import logging
 import os
 import subprocess
@@ -17,95 +16,56 @@ from pathlib import Path
 from typing import Optional, Dict, Any, Tuple
 from datetime import datetime
 
-try:
-    import psutil  # type: ignore
-    PSUTIL_AVAILABLE = True
-except ImportError:
-    PSUTIL_AVAILABLE = False
-    logging.warning("psutil 모듈이 설치되지 않았습니다. 프로세스 종료 기능이 제한됩니다.")
+if not __package__:
+    # 스크립트로 직접 실행될 때(--upgrade-and-restart) 프로젝트 루트를 경로에 추가
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
-try:
-    from tkinter import messagebox
-except ImportError:
-    messagebox = None  # type: ignore
+from src.core import build_fingerprint, build_progress, delta_upgrade, integrity, snapshot_backup
+from src.utils import process_registry, resource_paths, verification
+from src.utils.logging_utils import get_user_data_path
+from src.utils.lazy_import import OptionalModule
+from src.utils.wait_utils import (remove_tree, retry_call, wait_for_file_unlocked,
+                                  wait_for_path_gone, wait_for_processes_exit, wait_until)
 
-# tkinter 모듈 경로 설정 및 설치 확인
-def setup_tkinter_environment():
-    """tkinter 모듈 환경 설정"""
-    try:
-        # Python 설치 경로에서 tkinter 찾기
-        python_paths = [
-            sys.prefix,
-            sys.base_prefix,
-            os.path.dirname(sys.executable),
-            os.path.join(os.path.dirname(sys.executable), 'Lib', 'site-packages'),
-            os.path.join(os.path.dirname(sys.executable), 'DLLs'),
-            os.path.join(os.path.dirname(sys.executable), 'tcl'),
-            os.path.join(os.path.dirname(sys.executable), 'tk'),
-        ]
-        
-        # 환경 변수에 Python 경로 추가
-        current_path = os.environ.get('PATH', '')
-        for path in python_paths:
-            if os.path.exists(path) and path not in current_path:
-                os.environ['PATH'] = path + os.pathsep + current_path
-                logging.info(f"PATH에 추가됨: {path}")
-        
-        # PYTHONPATH 설정
-        python_path = os.environ.get('PYTHONPATH', '')
-        for path in python_paths:
-            if os.path.exists(path) and path not in python_path:
-                os.environ['PYTHONPATH'] = path + os.pathsep + python_path
-                logging.info(f"PYTHONPATH에 추가됨: {path}")
-        
-        return True
-    except Exception as e:
-        logging.error(f"tkinter 환경 설정 실패: {e}")
-        return False
-
-# tkinter 환경 설정 실행
-setup_tkinter_environment()
-
-# tkinter 설치 확인 및 안내
-try:
-    import tkinter
-    logging.info("tkinter 모듈 로드 성공")
-except ImportError:
-    try:
-        # 추가 시도: 직접 경로에서 import
-        import sys
-        python_dir = os.path.dirname(sys.executable)
-        tkinter_path = os.path.join(python_dir, 'Lib', 'tkinter')
-        if os.path.exists(tkinter_path):
-            sys.path.insert(0, tkinter_path)
-            import tkinter
-            logging.info("tkinter 모듈 직접 경로에서 로드 성공")
-        else:
-            raise ImportError("tkinter 경로를 찾을 수 없습니다")
-    except ImportError:
-        import sys
-        print("""[오류] Python에 tkinter 모듈이 설치되어 있지 않습니다.
-This program requires the tkinter module for GUI.
-
-설치 방법(Windows):
-    py -m pip install tk
-    또는
-    py -m pip install tkinter
-
-설치 후 프로그램을 다시 실행해 주세요.
-Please install tkinter and restart the program.
-""")
-        sys.exit(1)
+# psutil은 프로세스 종료가 필요할 때 처음 임포트
+psutil = OptionalModule("psutil", "psutil 모듈이 설치되지 않았습니다. 프로세스 종료 기능이 제한됩니다.")
 
 
 class UpgradeManager:
     """업그레이드 관리 클래스 - 상업용 기준"""
     
-    def __init__(self, guideline_manager):
+    # 조건 대기 제한 시간 (초) - 조건이 만족되면 즉시 진행
+    PROCESS_EXIT_TIMEOUT: float = 10.0
+    FILE_RELEASE_TIMEOUT: float = 10.0
+    REMOVE_TIMEOUT: float = 15.0
+    LAUNCH_TIMEOUT: float = 5.0
+    # 빌드 출력이 이 시간 동안 없으면 멈춘 것으로 보고 종료
+    BUILD_IDLE_TIMEOUT: float = build_progress.IDLE_TIMEOUT_SECONDS
+    BUILD_TIMEOUT: float = 1800.0
+    # 전체 업그레이드 진행률 중 빌드가 차지하는 구간
+    BUILD_START_PERCENT: float = 15.0
+    BUILD_END_PERCENT: float = 95.0
+    
+    # 업그레이드 전 스냅샷 백업 (base_path 기준)
+    BACKUP_DIR: str = "backups"
+    BACKUP_KEEP: int = snapshot_backup.DEFAULT_KEEP
+    BACKUP_FILES: Tuple[str, ...] = (
+        "guidelines.json",
+        "text_cleaner.py",
+        "text_processor.py",
+        "guideline_manager.py",
+        "upgrade_manager.py",
+    )
+    
+    def __init__(self, guideline_manager, progress_callback: Optional[build_progress.ProgressCallback] = None):
         self.guideline_manager = guideline_manager
+        # 진행 이벤트 수신 함수 (작업 스레드에서 호출되므로 UI는 큐로 받아야 함)
+        self.progress_callback = progress_callback
         self.upgrade_log_file = None
         self.backup_path = None
         self.rollback_available = False
+        # 같은 파일을 여러 번 검증해도 한 번만 읽도록 (경로, 크기, 수정 시각) 캐시
+        self._digest_cache = integrity.DigestCache(get_user_data_path() / "cache" / integrity.CACHE_FILE)
         
     def _setup_upgrade_logging(self):
         """업그레이드 전용 로깅 설정"""
@@ -189,13 +149,9 @@ class UpgradeManager:
             return True  # 예외 발생해도 계속 진행
 
     def _calculate_file_hash(self, file_path: Path) -> str:
-        """파일 해시 계산 (SHA-256)"""
+        """파일 해시 계산 (SHA-256, 캐시 사용)"""
         try:
-            hash_sha256 = hashlib.sha256()
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_sha256.update(chunk)
-            return hash_sha256.hexdigest()
+            return integrity.cached_hash(file_path, self._digest_cache)
         except Exception as e:
             logging.error("파일 해시 계산 실패: %s", e)
             return ""
@@ -221,55 +177,29 @@ class UpgradeManager:
             return False
 
     def _create_comprehensive_backup(self) -> bool:
-        """포괄적인 백업 생성"""
+        """포괄적인 백업 생성 (내용 해시 저장소 + 하드 링크 스냅샷, 로그는 압축)"""
         try:
             base_path = self.get_base_path()
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            self.backup_path = base_path / f"backup_upgrade_{timestamp}"
-            
-            logging.info("포괄적 백업 시작: %s", self.backup_path)
-            
-            # 백업 디렉토리 생성
-            self.backup_path.mkdir(exist_ok=True)
+            logging.info("포괄적 백업 시작: %s", base_path / self.BACKUP_DIR)
             
-            # 중요 파일들 백업
-            important_files = [
-                "guidelines.json",
-                "text_cleaner.py",
-                "text_processor.py",
-                "guideline_manager.py",
-                "upgrade_manager.py"
-            ]
-            
-            for file_name in important_files:
-                source_file = base_path / file_name
-                if source_file.exists():
-                    backup_file = self.backup_path / file_name
-                    shutil.copy2(source_file, backup_file)
-                    logging.info("백업 완료: %s", file_name)
-            
-            # 로그 디렉토리 백업
-            log_dir = base_path / "logs"
-            if log_dir.exists():
-                backup_log_dir = self.backup_path / "logs"
-                shutil.copytree(log_dir, backup_log_dir, dirs_exist_ok=True)
-                logging.info("로그 디렉토리 백업 완료")
-            
-            # 백업 완료 확인
-            if self.backup_path.exists() and any(self.backup_path.iterdir()):
-                self.rollback_available = True
-                logging.info("포괄적 백업 완료: %s", self.backup_path)
-                return True
-            else:
+            snapshot = snapshot_backup.create_snapshot(
+                base_path, base_path / self.BACKUP_DIR, self.BACKUP_FILES,
+                log_dir="logs", keep=self.BACKUP_KEEP)
+            if snapshot is None:
                 logging.error("백업 생성 실패")
                 return False
+            
+            self.backup_path = snapshot
+            self.rollback_available = True
+            logging.info("포괄적 백업 완료: %s", self.backup_path)
+            return True
                 
         except Exception as e:
             logging.error("포괄적 백업 실패: %s", e)
             return False
 
     def _rollback_from_backup(self) -> bool:
-        """백업에서 복원"""
+        """백업에서 복원 (현재 로그는 유지하고 없어진 로그만 복원)"""
         try:
             if not self.rollback_available or not self.backup_path:
                 logging.error("롤백 불가능: 백업이 없습니다")
@@ -277,23 +207,8 @@ class UpgradeManager:
                 
             logging.info("백업에서 복원 시작: %s", self.backup_path)
             
-            base_path = self.get_base_path()
-            
-            # 중요 파일들 복원
-            for backup_file in self.backup_path.glob("*"):
-                if backup_file.is_file():
-                    target_file = base_path / backup_file.name
-                    shutil.copy2(backup_file, target_file)
-                    logging.info("복원 완료: %s", backup_file.name)
-            
-            # 로그 디렉토리 복원
-            backup_log_dir = self.backup_path / "logs"
-            if backup_log_dir.exists():
-                log_dir = base_path / "logs"
-                if log_dir.exists():
-                    shutil.rmtree(log_dir)
-                shutil.copytree(backup_log_dir, log_dir)
-                logging.info("로그 디렉토리 복원 완료")
+            if not snapshot_backup.restore_snapshot(self.backup_path, self.get_base_path(), include_logs=True):
+                return False
             
             logging.info("백업에서 복원 완료")
             return True
@@ -303,29 +218,8 @@ class UpgradeManager:
             return False
 
     def get_base_path(self) -> Path:
-        """프로젝트 기본 경로 반환"""
-        # exe 파일에서 실행되는 경우와 Python 스크립트에서 실행되는 경우를 구분
-        if hasattr(sys, 'frozen'):
-            # exe 파일에서 실행되는 경우
-            exe_path = Path(sys.executable)
-            # dist/text_cleaner/text_cleaner.exe -> 프로젝트 루트
-            if exe_path.name == "text_cleaner.exe":
-                # dist/text_cleaner/ 폴더에서 상위로 올라가서 프로젝트 루트 찾기
-                current_dir = exe_path.parent
-                if current_dir.name == "text_cleaner":
-                    # dist/text_cleaner/ -> dist/ -> 프로젝트 루트
-                    return current_dir.parent.parent
-                else:
-                    # 직접 프로젝트 루트에 있는 경우
-                    return current_dir
-            else:
-                # upgrade_manager.exe인 경우
-                return exe_path.parent
-        else:
-            # Python 스크립트에서 실행되는 경우
-            # src/core/upgrade_manager.py -> src/core -> src -> 프로젝트 루트
-            current_file = Path(__file__).resolve()
-            return current_file.parent.parent.parent
+        """프로젝트 기본 경로 반환 (exe/스크립트 실행에 따라 한 번만 계산)"""
+        return resource_paths.project_root()
 
     def find_build_script(self) -> Optional[Path]:
         """빌드 스크립트 찾기 및 검증"""
@@ -378,7 +272,7 @@ class UpgradeManager:
 
     def kill_process_tree(self, pid: int, timeout: int = 10) -> bool:
         """프로세스 트리 전체를 강제 종료 (psutil 사용)"""
-        if not PSUTIL_AVAILABLE:
+        if not psutil.available:
             logging.warning("psutil이 없어 기본 종료 방식 사용")
             return self.kill_process_basic(pid, timeout)
         
@@ -448,33 +342,24 @@ class UpgradeManager:
             return False
 
     def kill_all_python_processes(self) -> bool:
-        """모든 Python 관련 프로세스 종료"""
-        if not PSUTIL_AVAILABLE:
+        """실행 중인 text_cleaner 인스턴스 종료 (등록부에 기록된 프로세스만 대상)"""
+        if not psutil.available:
             logging.warning("psutil이 없어 Python 프로세스 종료를 건너뜀")
             return True
         
         try:
             killed_count = 0
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+            for proc in process_registry.find_app_processes():
                 try:
-                    # 현재 프로세스는 제외
-                    if proc.pid == os.getpid():
-                        continue
-                    
-                    # Python 관련 프로세스 확인
-                    if (proc.name() and 'python' in proc.name().lower()) or \
-                       (proc.cmdline() and any('text_cleaner' in cmd.lower() for cmd in proc.cmdline() if cmd)):
-                        
-                        logging.info("Python 프로세스 발견: %d (%s)", proc.pid, proc.name())
-                        if self.kill_process_tree(proc.pid, timeout=5):
-                            killed_count += 1
-                            
+                    logging.info("text_cleaner 프로세스 발견: %d (%s)", proc.pid, proc.name())
+                    if self.kill_process_tree(proc.pid, timeout=5):
+                        killed_count += 1
                 except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                     pass
                 except Exception as e:
                     logging.warning("프로세스 확인 중 오류: %s", e)
             
-            logging.info("총 %d개의 Python 프로세스 종료됨", killed_count)
+            logging.info("총 %d개의 text_cleaner 프로세스 종료됨", killed_count)
             return True
             
         except Exception as e:
@@ -486,15 +371,19 @@ class UpgradeManager:
         try:
             logging.info("Python에서 직접 완전 강제 종료 시작")
             
-            # Windows에서 taskkill 명령으로 직접 종료
+            # Windows: 등록된 인스턴스를 프로세스 트리째 종료 (psutil이 없으면 앱 exe 이름으로만 종료)
             if os.name == 'nt':
-                kill_commands = [
-                    'taskkill /f /im "text_cleaner.exe" /t',
-                    'taskkill /f /im "pythonw.exe" /t',
-                    'taskkill /f /im "pyinstaller.exe" /t'
-                ]
+                # 현재 프로세스는 제외 (업그레이드가 중단되지 않도록)
+                current_pid = os.getpid()
+                logging.info("현재 프로세스 PID %d는 제외하고 종료", current_pid)
                 
-                for cmd in kill_commands:
+                targets = process_registry.find_app_processes() if psutil.available else []
+                if psutil.available:
+                    for proc in targets:
+                        logging.info("강제 종료: %d", proc.pid)
+                        self.kill_process_tree(proc.pid, timeout=5)
+                else:
+                    cmd = 'taskkill /f /im "text_cleaner.exe" /t'
                     try:
                         logging.info("실행: %s", cmd)
                         result = subprocess.run(cmd, shell=True, capture_output=True, timeout=10)
@@ -505,28 +394,14 @@ class UpgradeManager:
                     except Exception as e:
                         logging.warning("명령 실행 실패: %s - %s", cmd, e)
                 
-                # 현재 프로세스는 제외 (업그레이드가 중단되지 않도록)
-                current_pid = os.getpid()
-                logging.info("현재 프로세스 PID %d는 제외하고 종료", current_pid)
-                
                 # 프로세스 종료 확인
                 logging.info("프로세스 종료 확인 중...")
-                time.sleep(1)
                 
-                # 남은 프로세스 확인
-                remaining_processes = []
-                for proc in psutil.process_iter(['pid', 'name']):
-                    try:
-                        if proc.pid == os.getpid():
-                            continue
-                        if (proc.name() and 'python' in proc.name().lower()) or \
-                           (proc.name() and 'text_cleaner' in proc.name().lower()):
-                            remaining_processes.append(f"{proc.pid} ({proc.name()})")
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        pass
+                # 종료한 프로세스가 모두 끝날 때까지 대기 (다시 검색하지 않고 같은 프로세스 객체로 확인)
+                remaining_processes = wait_for_processes_exit(targets, self.PROCESS_EXIT_TIMEOUT)
                 
                 if remaining_processes:
-                    logging.warning("Remaining processes: %s", ', '.join(remaining_processes))
+                    logging.warning("Remaining processes: %s", ', '.join(str(proc.pid) for proc in remaining_processes))
                 else:
                     logging.info("All related processes terminated successfully")
                 
@@ -546,6 +421,7 @@ class UpgradeManager:
             logging.info("=== 간단한 업그레이드 시작 ===")
             
             # 환경 검증 추가
+            self._report_progress(0, "환경 검증")
             if not self.validate_upgrade_environment():
                 logging.error("업그레이드 환경 검증 실패")
                 # 환경 검증 스크립트 실행 시도
@@ -561,11 +437,13 @@ class UpgradeManager:
             if auto_upgrade:
                 # 1단계: text_cleaner.exe 종료
                 logging.info("1단계: text_cleaner.exe 종료 중...")
+                self._report_progress(5, "실행 중인 프로그램 종료")
+                # terminate_current_program이 프로세스 종료와 exe 잠금 해제까지 기다림
                 self.terminate_current_program()
-                time.sleep(2)  # 프로세스 종료 대기
                 
                 # 2단계: 배치 파일을 통한 빌드 (우선 시도)
                 logging.info("2단계: 배치 파일을 통한 빌드 시도...")
+                self._report_progress(self.BUILD_START_PERCENT, "빌드 시작")
                 build_script = self.find_build_script()
                 if build_script and build_script.exists():
                     logging.info("배치 파일 발견: %s", build_script)
@@ -576,10 +454,12 @@ class UpgradeManager:
                 
                 if not build_success:
                     logging.error("빌드 실패")
+                    self._report_progress(self.BUILD_END_PERCENT, "빌드 실패")
                     return False
                 
                 # 3단계: 빌드 후 환경 재검증
                 logging.info("3단계: 빌드 후 환경 재검증...")
+                self._report_progress(self.BUILD_END_PERCENT, "빌드 후 환경 재검증")
                 if not self.validate_upgrade_environment():
                     logging.warning("빌드 후 환경 검증 실패, 계속 진행")
                     
@@ -587,6 +467,7 @@ class UpgradeManager:
                 logging.info("4단계: 새 프로그램 실행 중...")
                 # launch_new_program은 메인 스크립트에서 호출하므로 여기서는 건너뜀
                 logging.info("빌드 완료 - 메인 스크립트에서 새 프로그램 실행 예정")
+                self._report_progress(100, "업그레이드 완료")
                 return True
             else:
                 logging.info("수동 업그레이드 모드")
@@ -596,61 +477,78 @@ class UpgradeManager:
             logging.error("업그레이드 실패: %s", e)
             return False
 
-    def _build_with_python(self) -> bool:
-        """PyInstaller로 간단한 빌드"""
-        try:
-            logging.info("PyInstaller 빌드 시작")
-            
-            base_path = self.get_base_path()
-            
-            # 기존 빌드 파일 정리 (강화된 버전)
-            for path in ["dist", "build"]:
-                full_path = base_path / path
-                if full_path.exists():
-                    try:
-                        # 파일 잠금 해제를 위한 대기
-                        time.sleep(2)
-                        
-                        # 먼저 일반적인 삭제 시도
-                        shutil.rmtree(full_path, ignore_errors=True)
+    def apply_delta_package(self, package_path: Path, terminate_running: bool = True) -> bool:
+        """미리 빌드된 델타 패키지(폴더/zip)를 dist/text_cleaner에 적용 (로컬 빌드 없음)"""
+        logging.info("=== 델타 패키지 업그레이드 시작: %s ===", package_path)
+        if terminate_running:
+            # 실행 중인 exe가 있으면 폴더 교체가 실패하므로 먼저 종료
+            self.terminate_current_program()
+        install_dir = self.get_base_path() / "dist" / "text_cleaner"
+        result = delta_upgrade.apply_package(Path(package_path), install_dir)
+        if result is None:
+            return False
+        logging.info("델타 패키지 적용 결과: %s", result)
+        return True
+
+    def _clean_build_outputs(self, base_path: Path) -> None:
+        """전체 빌드 전 dist/build 폴더와 spec 파일 삭제"""
+        # 기존 빌드 파일 정리 (강화된 버전)
+        for path in ["dist", "build"]:
+            full_path = base_path / path
+            if full_path.exists():
+                try:
+                    # 잠긴 파일이 풀릴 때까지 백오프로 재시도하며 삭제
+                    if remove_tree(full_path, self.REMOVE_TIMEOUT):
                         logging.info("삭제됨: %s", full_path)
-                        
-                        # 삭제 확인
-                        if full_path.exists():
-                            logging.warning("일반 삭제 실패, 강제 삭제 시도: %s", full_path)
-                            # 강제 삭제 시도
-                            if os.name == 'nt':
-                                # Windows에서 강제 삭제
-                                result = subprocess.run(f'rmdir /s /q "{full_path}"', shell=True, capture_output=True, timeout=30)
-                                if result.returncode == 0:
+                    
+                    # 삭제 확인
+                    if full_path.exists():
+                        logging.warning("일반 삭제 실패, 강제 삭제 시도: %s", full_path)
+                        # 강제 삭제 시도
+                        if os.name == 'nt':
+                            # Windows에서 강제 삭제
+                            result = subprocess.run(f'rmdir /s /q "{full_path}"', shell=True, capture_output=True, timeout=30)
+                            if result.returncode == 0:
+                                # 삭제 예약된 파일이 남아 있을 수 있어 폴더가 실제로 사라질 때까지 대기
+                                if wait_for_path_gone(full_path, self.REMOVE_TIMEOUT, description="빌드 폴더 삭제"):
                                     logging.info("Windows 강제 삭제 완료: %s", full_path)
-                                else:
-                                    logging.warning("Windows 강제 삭제 실패: %s", result.stderr)
-                                    # 추가 대기 후 재시도
-                                    time.sleep(5)
-                                    subprocess.run(f'rmdir /s /q "{full_path}"', shell=True, capture_output=True)
                             else:
-                                # Linux/Mac에서 강제 삭제
-                                subprocess.run(f'rm -rf "{full_path}"', shell=True, capture_output=True)
+                                logging.warning("Windows 강제 삭제 실패: %s", result.stderr)
+                                # 폴더가 사라질 때까지 재시도
+                                wait_until(lambda: subprocess.run(f'rmdir /s /q "{full_path}"', shell=True,
+                                                                  capture_output=True).returncode == 0
+                                           or not full_path.exists(),
+                                           self.REMOVE_TIMEOUT, description="빌드 폴더 강제 삭제")
+                        else:
+                            # Linux/Mac에서 강제 삭제
+                            subprocess.run(f'rm -rf "{full_path}"', shell=True, capture_output=True)
+                            if wait_for_path_gone(full_path, self.REMOVE_TIMEOUT, description="빌드 폴더 삭제"):
                                 logging.info("Linux/Mac 강제 삭제 완료: %s", full_path)
-                    except Exception as e:
-                        logging.error("빌드 폴더 삭제 실패: %s - %s", full_path, e)
-            
-            # .spec 파일 삭제 (강화된 버전)
-            for spec_file in base_path.glob("*.spec"):
+                except Exception as e:
+                    logging.error("빌드 폴더 삭제 실패: %s - %s", full_path, e)
+        
+        # .spec 파일 삭제 (강화된 버전)
+        for spec_file in base_path.glob("*.spec"):
+            try:
+                spec_file.unlink()
+                logging.info("삭제됨: %s", spec_file)
+            except PermissionError:
+                logging.warning("spec 파일 삭제 실패 (잠겨있음): %s", spec_file)
+                # 강제 삭제 시도
                 try:
-                    spec_file.unlink()
-                    logging.info("삭제됨: %s", spec_file)
-                except PermissionError:
-                    logging.warning("spec 파일 삭제 실패 (잠겨있음): %s", spec_file)
-                    # 강제 삭제 시도
-                    try:
-                        subprocess.run(f'del /f /q "{spec_file}"', shell=True, capture_output=True, timeout=5)
-                        logging.info("spec 파일 강제 삭제 성공: %s", spec_file)
-                    except Exception as e:
-                        logging.error("spec 파일 강제 삭제 실패: %s - %s", spec_file, e)
+                    subprocess.run(f'del /f /q "{spec_file}"', shell=True, capture_output=True, timeout=5)
+                    logging.info("spec 파일 강제 삭제 성공: %s", spec_file)
                 except Exception as e:
-                    logging.warning("spec 파일 삭제 실패: %s - %s", spec_file, e)
+                    logging.error("spec 파일 강제 삭제 실패: %s - %s", spec_file, e)
+            except Exception as e:
+                logging.warning("spec 파일 삭제 실패: %s - %s", spec_file, e)
+
+    def _build_with_python(self, incremental: bool = True) -> bool:
+        """PyInstaller 빌드 (incremental이면 빌드 지문을 비교해 건너뛰거나 작업 폴더 재사용)"""
+        try:
+            logging.info("PyInstaller 빌드 시작")
+            
+            base_path = self.get_base_path()
             
             # PyInstaller 설치 확인 및 설치 (강화된 버전)
             try:
@@ -737,14 +635,16 @@ class UpgradeManager:
                 
                 # PyInstaller 실행 방법 결정 (Python 3.11 사용)
                 if python_executable == "py -3.11":
-                    pyinstaller_cmd = ["py", "-3.11", "-m", "PyInstaller"]
+                    python_cmd = ["py", "-3.11"]
                 else:
-                    pyinstaller_cmd = [python_executable, "-m", "PyInstaller"]
+                    python_cmd = [python_executable]
+                pyinstaller_cmd = python_cmd + ["-m", "PyInstaller"]
                 logging.info("PyInstaller 실행 방법: %s", " ".join(pyinstaller_cmd))
                 
                 # Tcl/Tk 인코딩 문제 해결을 위한 최소 설정 (onedir 모드로 변경)
+                # --clean은 전체 빌드일 때만 아래에서 추가
                 cmd = pyinstaller_cmd + [
-                    "--noconfirm", "--clean", "--onedir", "--windowed",  # --onefile 대신 --onedir 사용
+                    "--noconfirm", "--onedir", "--windowed",  # --onefile 대신 --onedir 사용
                     "--name", "text_cleaner",
                     "--add-data", f"{base_path / 'guidelines.json'};.",
                     "--add-data", f"{base_path / 'fonts'};fonts",
@@ -755,7 +655,12 @@ class UpgradeManager:
                     "--hidden-import", "PIL",
                     "--hidden-import", "PIL.Image",
                     "--hidden-import", "PIL.ImageTk",
+                    # OptionalModule로 실행 중에만 임포트하는 모듈 (정적 분석에서 보이지 않음)
+                    "--hidden-import", "PIL.ImageGrab",
+                    "--hidden-import", "PIL.ImageEnhance",
+                    "--hidden-import", "PIL.ImageFilter",
                     "--hidden-import", "cv2",
+                    "--hidden-import", "numpy",
                     "--hidden-import", "pytesseract",
                     "--hidden-import", "psutil",
                     "--distpath", str(base_path / "dist"),
@@ -768,10 +673,29 @@ class UpgradeManager:
                 logging.error("메인 스크립트를 찾을 수 없음: %s", main_script)
                 return False
             
-            # 빌드 전 추가 파일 잠금 해제 및 대기
+            # 빌드 지문 비교: 바뀐 것이 없으면 건너뛰고, 앱 코드만 바뀌면 분석 캐시 재사용
+            work_path = base_path / "build"
+            exe_path = base_path / "dist" / "text_cleaner" / "text_cleaner.exe"
+            # 의존성 버전은 빌드에 쓰는 인터프리터(같은 환경 변수)에서 조회
+            fingerprint = build_fingerprint.compute_build_fingerprint(base_path, cmd, python_cmd, env)
+            if incremental:
+                build_mode = build_fingerprint.decide_build_mode(
+                    build_fingerprint.load_fingerprint(work_path), fingerprint, exe_path.exists())
+            else:
+                build_mode = build_fingerprint.BUILD_FULL
+            logging.info("빌드 모드: %s", build_mode)
+            
+            if build_mode == build_fingerprint.BUILD_SKIP:
+                logging.info("빌드 입력이 바뀌지 않음 - 기존 빌드 사용: %s", exe_path)
+                return True
+            if build_mode == build_fingerprint.BUILD_FULL:
+                self._clean_build_outputs(base_path)
+                cmd.insert(len(pyinstaller_cmd) + 1, "--clean")
+            
+            # 빌드 전 추가 파일 잠금 해제 (해제될 때까지만 대기)
             logging.info("빌드 전 추가 파일 잠금 해제 및 대기")
             self._force_unlock_exe_file()
-            time.sleep(3)  # 추가 대기 시간
+            wait_for_file_unlocked(exe_path, self.FILE_RELEASE_TIMEOUT, description="exe 잠금 해제")
             
             logging.info("PyInstaller 빌드 실행: %s", " ".join(cmd))
             
@@ -783,37 +707,20 @@ class UpgradeManager:
                 startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
                 startupinfo.wShowWindow = subprocess.SW_HIDE
             
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                cwd=base_path,
-                env=env,
-                startupinfo=startupinfo
-            )
-            
-            # 실시간으로 출력 읽기
-            output_lines = []
-            if process.stdout:
-                while True:
-                    output = process.stdout.readline()
-                    if output == '' and process.poll() is not None:
-                        break
-                    if output:
-                        output_lines.append(output.strip())
-                        logging.info("PyInstaller: %s", output.strip())
-            
-            returncode = process.wait()
+            # 출력을 줄 단위로 스트리밍하며 진행률 보고 (출력이 끊기면 멈춤으로 판단)
+            returncode, output_lines = self._run_build_process(
+                cmd, "PyInstaller", cwd=base_path, env=env, startupinfo=startupinfo)
+            if returncode is None:
+                logging.error("PyInstaller 빌드 중단 (시간 초과 또는 멈춤)")
+                logging.error("빌드 출력: %s", output_lines[-20:])
+                return False
             logging.info("PyInstaller 빌드 완료 (returncode: %d)", returncode)
             
             if returncode == 0:
                 # 빌드 결과 확인 (onedir 모드)
-                exe_path = base_path / "dist" / "text_cleaner" / "text_cleaner.exe"
                 if exe_path.exists():
                     logging.info("빌드 성공: %s", exe_path)
+                    build_fingerprint.save_fingerprint(work_path, fingerprint)
                     return True
                 else:
                     logging.error("빌드 실패: text_cleaner.exe가 생성되지 않음")
@@ -821,7 +728,7 @@ class UpgradeManager:
                     return False
             else:
                 logging.error("PyInstaller 빌드 실패 (returncode: %d)", returncode)
-                logging.error("빌드 출력: %s", output_lines)
+                logging.error("빌드 출력: %s", output_lines[-20:])
                 return False
                 
         except Exception as e:
@@ -845,45 +752,18 @@ class UpgradeManager:
                 env['PYTHONPATH'] = str(build_script.parent)
                 env['PYTHONIOENCODING'] = 'utf-8'
                 
-                process = subprocess.Popen(
-                    [str(build_script)], 
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True, 
-                    encoding='utf-8',
-                    errors='replace',
-                    cwd=build_script.parent,
-                    startupinfo=startupinfo,
-                    shell=True,
-                    env=env
-                )
-                
-                # 실시간으로 출력 읽기
-                output_lines = []
-                if process.stdout:
-                    while True:
-                        output = process.stdout.readline()
-                        if output == '' and process.poll() is not None:
-                            break
-                        if output:
-                            output_lines.append(output.strip())
-                            logging.info("빌드: %s", output.strip())
-                
-                returncode = process.wait()
-                logging.info("배치 파일 빌드 완료 (returncode: %d)", returncode)
+                returncode, output_lines = self._run_build_process(
+                    [str(build_script)], "빌드", cwd=build_script.parent,
+                    startupinfo=startupinfo, shell=True, env=env)
             else:
                 # Linux/Mac 환경
-                result = subprocess.run(
-                    [str(build_script)], 
-                    capture_output=True, 
-                    text=True, 
-                    encoding='utf-8',
-                    errors='replace',
-                    cwd=build_script.parent,
-                    timeout=300
-                )
-                returncode = result.returncode
-                output_lines = result.stdout.splitlines() if result.stdout else []
+                returncode, output_lines = self._run_build_process(
+                    [str(build_script)], "빌드", cwd=build_script.parent)
+            
+            if returncode is None:
+                logging.error("배치 파일 빌드 시간 초과 또는 멈춤")
+                return False
+            logging.info("배치 파일 빌드 완료 (returncode: %d)", returncode)
             
             # 빌드 결과 확인
             base_path = self.get_base_path()
@@ -904,21 +784,58 @@ class UpgradeManager:
             else:
                 logging.error("배치 파일 빌드 실패: returncode %d", returncode)
                 if output_lines:
-                    logging.error("빌드 출력: %s", output_lines)
+                    logging.error("빌드 출력: %s", output_lines[-20:])
                 return False
                 
-        except subprocess.TimeoutExpired:
-            logging.error("배치 파일 빌드 시간 초과")
-            return False
         except Exception as e:
             logging.error("배치 파일 빌드 실패: %s", e)
             return False
 
+    def _report_progress(self, percent: float, phase: str, line: Optional[str] = None,
+                         stalled: bool = False) -> None:
+        """진행 이벤트 전달 (수신 함수 오류는 업그레이드를 멈추지 않음)"""
+        if self.progress_callback is None:
+            return
+        try:
+            self.progress_callback({"percent": percent, "phase": phase, "line": line, "stalled": stalled})
+        except Exception as e:
+            logging.debug("진행 이벤트 전달 실패: %s", e)
+
+    def _run_build_process(self, cmd: Any, label: str, **popen_kwargs: Any) -> Tuple[Optional[int], list]:
+        """빌드 프로세스 출력을 스트리밍하며 진행률 보고 (BUILD_START~BUILD_END 구간에 매핑)"""
+        tracker = build_progress.PyInstallerProgress()
+        span = self.BUILD_END_PERCENT - self.BUILD_START_PERCENT
+
+        def on_line(line: str) -> None:
+            logging.info("%s: %s", label, line)
+            tracker.feed(line)
+            self._report_progress(self.BUILD_START_PERCENT + span * tracker.percent / 100,
+                                  tracker.phase, line)
+
+        def on_stall(idle: float) -> None:
+            self._report_progress(self.BUILD_START_PERCENT + span * tracker.percent / 100,
+                                  f"{tracker.phase} (출력 없음 {idle:.0f}초)", stalled=True)
+
+        return build_progress.stream_process(cmd, on_line, timeout=self.BUILD_TIMEOUT,
+                                             idle_timeout=self.BUILD_IDLE_TIMEOUT, on_stall=on_stall,
+                                             **popen_kwargs)
+
+    def _installed_exe_path(self) -> Path:
+        """설치된(onedir) text_cleaner.exe 경로"""
+        return self.get_base_path() / "dist" / "text_cleaner" / "text_cleaner.exe"
+
+    def _find_running_programs(self) -> list:
+        """실행 중인 text_cleaner 인스턴스 (psutil 필요, 현재 프로세스 제외)"""
+        return process_registry.find_app_processes()
+
     def terminate_current_program(self) -> bool:
         """text_cleaner 관련 프로세스 정확히 종료 (개선된 버전)"""
         try:
             logging.info("1단계: text_cleaner.exe 종료 중...")
             
+            # 종료할 인스턴스는 한 번만 찾아 두고 이후 종료/대기는 이 목록으로 처리
+            targets = process_registry.find_app_processes() if psutil.available else []
+            
             if os.name == 'nt':  # Windows
                 # 1단계: text_cleaner.exe 종료
                 cmd = 'taskkill /f /im "text_cleaner.exe"'
@@ -934,38 +851,22 @@ class UpgradeManager:
                 
                 # 2단계: text_cleaner 관련 Python 프로세스 종료
                 logging.info("2단계: text_cleaner 관련 Python 프로세스 종료 중...")
-                if PSUTIL_AVAILABLE:
+                if psutil.available:
                     try:
+                        # 등록된 인스턴스(스크립트 실행 포함)만 종료 (1단계에서 이미 끝난 것은 건너뜀)
                         terminated_count = 0
-                        for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-                            if proc.info['name']:
-                                # text_cleaner.exe 또는 text_cleaner 관련 Python 프로세스만 종료
-                                should_terminate = False
-                                
-                                if proc.info['name'].lower() == 'text_cleaner.exe':
-                                    should_terminate = True
-                                elif (proc.info['name'].lower() == 'python.exe' and 
-                                      proc.info.get('cmdline')):
-                                    cmdline = ' '.join(proc.info['cmdline']).lower()
-                                    # text_cleaner 관련 명령어 확인
-                                    if any(keyword in cmdline for keyword in [
-                                        'text_cleaner', 'main.py', 'src/main.py', 
-                                        'app.py', 'src/ui/app.py'
-                                    ]):
-                                        should_terminate = True
-                                
-                                if should_terminate:
-                                    try:
-                                        logging.info("text_cleaner 관련 프로세스 종료: PID %s, 이름: %s, 명령어: %s", 
-                                                   proc.info['pid'], proc.info['name'], 
-                                                   ' '.join(proc.info.get('cmdline', [])))
-                                        proc.terminate()
-                                        proc.wait(timeout=5)
-                                        terminated_count += 1
-                                    except psutil.NoSuchProcess:
-                                        pass
-                                    except Exception as e:
-                                        logging.warning("프로세스 종료 실패 (PID %s): %s", proc.info['pid'], e)
+                        for proc in targets:
+                            try:
+                                if not proc.is_running():
+                                    continue
+                                logging.info("text_cleaner 관련 프로세스 종료: PID %s, 이름: %s",
+                                             proc.pid, proc.name())
+                                proc.terminate()
+                                terminated_count += 1
+                            except psutil.NoSuchProcess:
+                                pass
+                            except Exception as e:
+                                logging.warning("프로세스 종료 실패 (PID %s): %s", proc.pid, e)
                         
                         logging.info("종료된 text_cleaner 관련 프로세스 수: %d", terminated_count)
                         
@@ -985,13 +886,16 @@ class UpgradeManager:
                     except Exception as e:
                         logging.warning("WMIC 프로세스 종료 실패: %s", e)
                 
-                # 3단계: 추가 대기 시간으로 프로세스 완전 종료 확인
+                # 3단계: 프로세스 완전 종료 확인 (실행 중인 text_cleaner.exe가 없어질 때까지)
                 logging.info("3단계: 프로세스 완전 종료 대기 중...")
-                time.sleep(3)
+                remaining = wait_for_processes_exit(targets, self.PROCESS_EXIT_TIMEOUT)
+                if remaining:
+                    logging.warning("종료되지 않은 프로세스: %s", ', '.join(str(proc.pid) for proc in remaining))
                 
-                # 4단계: 파일 잠금 해제를 위한 대기
+                # 4단계: 파일 잠금 해제 대기 (exe를 쓰기 모드로 열 수 있을 때까지)
                 logging.info("4단계: 파일 잠금 해제 대기 중...")
-                time.sleep(2)
+                wait_for_file_unlocked(self._installed_exe_path(), self.FILE_RELEASE_TIMEOUT,
+                                       description="exe 잠금 해제")
                 
                 # 5단계: 파일 핸들러 해제를 위한 가비지 컬렉션
                 import gc
@@ -1029,23 +933,20 @@ class UpgradeManager:
                     # text_cleaner.exe 프로세스 강제 종료
                     subprocess.run("taskkill /f /im text_cleaner.exe", shell=True, capture_output=True, timeout=5)
                     
-                    # Python 프로세스 중 text_cleaner 관련 프로세스 강제 종료
-                    if PSUTIL_AVAILABLE:
-                        for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-                            if proc.info['name'] and proc.info['name'].lower() == 'python.exe':
-                                try:
-                                    cmdline = ' '.join(proc.info.get('cmdline', [])).lower()
-                                    if any(keyword in cmdline for keyword in ['text_cleaner', 'main.py', 'src/main.py']):
-                                        logging.info(f"text_cleaner 관련 Python 프로세스 강제 종료: PID {proc.info['pid']}")
-                                        proc.kill()
-                                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                                    continue
+                    # 등록된 text_cleaner 인스턴스(스크립트 실행 포함) 강제 종료
+                    if psutil.available:
+                        for proc in process_registry.find_app_processes():
+                            try:
+                                logging.info(f"text_cleaner 관련 프로세스 강제 종료: PID {proc.pid}")
+                                proc.kill()
+                            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                                continue
                 except Exception as e:
                     logging.warning(f"프로세스 강제 종료 중 오류: {e}")
                 
-                # 방법 2: 파일 핸들러 해제를 위한 대기
+                # 방법 2: 파일 핸들러 해제 대기 (풀리면 즉시 진행)
                 logging.info("방법 2: 파일 핸들러 해제 대기")
-                time.sleep(3)
+                wait_for_file_unlocked(exe_path, self.FILE_RELEASE_TIMEOUT)
                 
                 # 방법 3: 파일 삭제 시도
                 logging.info("방법 3: 파일 삭제 시도")
@@ -1056,11 +957,10 @@ class UpgradeManager:
                 except PermissionError:
                     logging.warning("text_cleaner.exe 파일 삭제 실패 (잠겨있음)")
                     
-                    # 방법 4: 추가 대기 후 재시도
-                    logging.info("방법 4: 추가 대기 후 재시도")
-                    time.sleep(5)
+                    # 방법 4: 백오프로 재시도
+                    logging.info("방법 4: 백오프로 재시도")
                     try:
-                        exe_path.unlink()
+                        retry_call(exe_path.unlink, self.FILE_RELEASE_TIMEOUT, (PermissionError,))
                         logging.info("text_cleaner.exe 파일 삭제 성공 (재시도)")
                         return True
                     except PermissionError:
@@ -1126,14 +1026,16 @@ class UpgradeManager:
                     os.startfile(str(new_exe_path))
                     logging.info("text_cleaner.exe 실행 완료")
                     
-                    # 3초 대기 후 cmd 창 닫기
-                    logging.info("새 프로그램 실행 완료 - 3초 대기 후 cmd 창 닫기")
-                    time.sleep(3)
+                    # 새 프로세스가 뜰 때까지 기다린 뒤 cmd 창 닫기
+                    logging.info("새 프로그램 실행 완료 - 프로세스 시작 확인 후 cmd 창 닫기")
+                    if psutil.available:
+                        wait_until(self._find_running_programs, self.LAUNCH_TIMEOUT,
+                                   description="새 프로그램 프로세스 시작")
                     
                     # cmd 창 닫기 (개선된 방법)
                     try:
                         # 현재 프로세스의 부모 프로세스(CMD) 종료
-                        if PSUTIL_AVAILABLE:
+                        if psutil.available:
                             current_process = psutil.Process()
                             parent_process = current_process.parent()
                             if parent_process and "cmd.exe" in parent_process.name().lower():
@@ -1169,62 +1071,73 @@ class UpgradeManager:
         return self.launch_new_program()
 
     def validate_upgrade_environment(self) -> bool:
-        """업그레이드 환경 검증 (개선된 버전)"""
+        """업그레이드 환경 검증 (독립 검사는 병렬, 바뀐 것이 없으면 캐시 결과 사용)"""
         try:
             logging.info("업그레이드 환경 검증 시작")
-            
-            # Python 설치 확인
-            if not sys.executable:
-                logging.error("Python 실행 파일을 찾을 수 없음")
-                return False
-
-            # 기본 경로 확인
+            started = time.perf_counter()
             base_path = self.get_base_path()
-            if not base_path.exists():
-                logging.error("기본 경로가 존재하지 않음: %s", base_path)
-                return False
-
-            # src/main.py 파일 존재 확인
             main_script = base_path / "src" / "main.py"
-            if not main_script.exists():
-                logging.error("메인 스크립트를 찾을 수 없음: %s", main_script)
-                return False
             
-            # 메인 스크립트 무결성 검증
-            if not self._validate_file_integrity(main_script):
-                logging.error("메인 스크립트 무결성 검증 실패")
-                return False
-
-            # tkinter 모듈 확인 (중요!)
-            try:
-                import tkinter
-                logging.info("tkinter 모듈 확인 완료")
-            except ImportError:
-                logging.error("tkinter 모듈을 찾을 수 없습니다. 환경 검증 스크립트를 실행하세요.")
-                return False
-
-            # psutil 설치 확인
-            if not PSUTIL_AVAILABLE:
-                logging.warning("psutil 모듈이 설치되지 않았습니다. 프로세스 종료 기능이 제한됩니다.")
-
-            # 디스크 공간 확인
-            try:
-                disk_usage = shutil.disk_usage(base_path)
-                free_space_gb = disk_usage.free / (1024**3)
-                if free_space_gb < 1.0:  # 1GB 미만
-                    logging.warning("디스크 공간 부족: %.2f GB", free_space_gb)
-                else:
-                    logging.info("디스크 공간 확인: %.2f GB 사용 가능", free_space_gb)
-            except Exception as e:
-                logging.warning("디스크 공간 확인 실패: %s", e)
-
-            logging.info("업그레이드 환경 검증 완료")
-            return True
+            def check_python():
+                return bool(sys.executable), sys.executable or "Python 실행 파일을 찾을 수 없음"
+            
+            def check_base_path():
+                return base_path.exists(), str(base_path)
+            
+            def check_main_script():
+                # 메인 스크립트 존재 및 무결성 검증
+                if not main_script.exists():
+                    return False, f"메인 스크립트를 찾을 수 없음: {main_script}"
+                return self._validate_file_integrity(main_script)
+            
+            def check_install_integrity():
+                # 매니페스트가 있을 때만, 불일치는 업그레이드로 복구되므로 경고만
+                install_dir = self._installed_exe_path().parent
+                if not install_dir.exists():
+                    return True, "설치 폴더 없음"
+                result = integrity.verify_installation(install_dir, self._digest_cache)
+                return result is None or result["ok"]
+            
+            def check_tkinter():
+                try:
+                    import tkinter  # noqa: F401
+                    return True
+                except ImportError:
+                    return False, "tkinter 모듈을 찾을 수 없습니다. 환경 검증 스크립트를 실행하세요."
+            
+            def check_psutil():
+                return psutil.available, "프로세스 종료 기능이 제한됩니다" if not psutil.available else ""
+            
+            def check_disk_space():
+                free_space_gb = shutil.disk_usage(base_path).free / (1024**3)
+                return free_space_gb >= 1.0, f"{free_space_gb:.2f} GB 사용 가능"
+            
+            checks = [
+                verification.Check("Python 설치", check_python),
+                verification.Check("기본 경로", check_base_path, cacheable=False),
+                verification.Check("메인 스크립트", check_main_script, requires=["기본 경로"], cacheable=False),
+                verification.Check("설치 무결성", check_install_integrity, requires=["기본 경로"],
+                                   cacheable=False, required=False),
+                verification.Check("tkinter 모듈", check_tkinter, requires=["Python 설치"]),
+                verification.Check("psutil 모듈", check_psutil, requires=["Python 설치"], required=False),
+                verification.Check("디스크 공간", check_disk_space, requires=["기본 경로"],
+                                   cacheable=False, required=False),
+            ]
+            results = verification.run_checks(checks, cache_file=self._verification_cache_file())
+            self._digest_cache.save()
+            
+            passed = verification.summarize(checks, results)
+            logging.info("업그레이드 환경 검증 %s (%.0fms)", "완료" if passed else "실패",
+                         (time.perf_counter() - started) * 1000)
+            return passed
             
         except Exception as e:
             logging.error("업그레이드 환경 검증 실패: %s", e)
             return False
 
+    def _verification_cache_file(self) -> Path:
+        return get_user_data_path() / "cache" / "upgrade_verify.json"
+
     def run_environment_verification(self) -> bool:
         """환경 검증 스크립트 실행"""
         try:
@@ -1335,9 +1248,13 @@ try:
             logging.info("build.bat 업그레이드 성공")
             logging.info(f"출력: {{result.stdout}}")
             
-            # 새 프로그램 실행 시도
-            time.sleep(2)
+            # 새 프로그램 실행 시도 (빌드 결과가 보일 때까지 최대 10초, 백오프)
             new_exe = os.path.join(project_root, "dist", "text_cleaner.exe")
+            deadline = time.monotonic() + 10
+            delay = 0.05
+            while not os.path.exists(new_exe) and time.monotonic() < deadline:
+                time.sleep(delay)
+                delay = min(delay * 2, 1.0)
             if os.path.exists(new_exe):
                 try:
                     subprocess.Popen([new_exe], cwd=project_root)
@@ -1426,18 +1343,45 @@ finally:
 
 if __name__ == "__main__":
     import argparse
+    from src.utils.environment import bootstrap_environment, ensure_tkinter_available
+    
+    # 스크립트로 실행될 때만 환경 설정 및 tkinter 확인 (임포트 시에는 부작용 없음)
+    bootstrap_environment()
+    ensure_tkinter_available()
+    
     parser = argparse.ArgumentParser(description="text_cleaner 업그레이드 매니저")
     parser.add_argument("--upgrade-and-restart", action="store_true", help="업그레이드 후 새 exe 실행")
+    parser.add_argument("--apply-package", type=Path, metavar="PATH",
+                        help="미리 빌드된 델타 패키지(폴더 또는 zip)를 적용하고 새 exe 실행")
+    parser.add_argument("--write-manifest", type=Path, metavar="DIR",
+                        help="빌드 결과 폴더에 델타 패키지용 manifest.json 작성")
+    parser.add_argument("--package-version", help="--write-manifest에 기록할 버전")
     args = parser.parse_args()
 
+    if args.write_manifest or args.apply_package:
+        logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    if args.write_manifest:
+        from src import __version__
+        delta_upgrade.write_manifest(args.write_manifest, args.package_version or __version__)
+        sys.exit(0)
+
+    if args.apply_package:
+        manager = UpgradeManager(guideline_manager=None)
+        if not manager.apply_delta_package(args.apply_package):
+            print("[업그레이드 매니저] 델타 패키지 적용 실패")
+            sys.exit(1)
+        print("[업그레이드 매니저] 델타 패키지 적용 완료 - 새 프로그램 실행")
+        manager.launch_new_program()
+        sys.exit(0)
+
     if args.upgrade_and_restart:
         # 프로젝트 루트를 sys.path에 추가
         import sys
         from pathlib import Path
         
-        # 현재 파일의 위치를 기준으로 프로젝트 루트 찾기
-        current_file = Path(__file__)
-        project_root = current_file.parent.parent.parent  # src/core/upgrade_manager.py -> src/core -> src -> project_root
+        # 프로젝트 루트 (exe/스크립트 실행 여부는 resource_paths가 판단)
+        project_root = resource_paths.project_root()
         sys.path.insert(0, str(project_root))
         
         # 로깅 설정 강화
@@ -1462,16 +1406,22 @@ if __name__ == "__main__":
             manager = UpgradeManager(guideline_manager=None)
             logging.info("업그레이드 매니저 인스턴스 생성 완료")
             
-            # 업그레이드 실행(자동)
+            # 업그레이드 실행(자동) - 작업 스레드에서 실행하며 진행 창 표시
             logging.info("업그레이드 실행 시작")
-            result = manager.execute_upgrade(auto_upgrade=True)
+            from src.ui.upgrade_progress import run_with_progress_window
+            
+            def run_upgrade(progress):
+                manager.progress_callback = progress
+                return manager.execute_upgrade(auto_upgrade=True)
+            
+            result = run_with_progress_window(run_upgrade)
             
             if result:
                 logging.info("업그레이드 성공 - 새 프로그램 실행 시도")
                 print("[업그레이드 매니저] 업그레이드 성공 - 새 프로그램 실행 시도")
                 
-                # 빌드 완료 후 잠시 대기
-                time.sleep(2)
+                # 빌드 결과가 보일 때까지 대기 (이미 있으면 즉시 진행)
+                wait_until(manager._installed_exe_path().exists, manager.FILE_RELEASE_TIMEOUT)
                 
                 # 새 프로그램 실행 시도 (한 번만 실행)
                 launch_result = manager.launch_new_program()
@@ -1479,10 +1429,9 @@ if __name__ == "__main__":
                     logging.info("새 프로그램 실행 성공")
                     print("[업그레이드 매니저] 새 프로그램 실행 성공")
                     
-                    # 새 프로그램 실행 후 충분한 대기 시간
-                    logging.info("새 프로그램 실행 완료 - 3초 대기 후 업그레이드 매니저 종료")
-                    print("[업그레이드 매니저] 새 프로그램 실행 완료 - 3초 대기 후 업그레이드 매니저 종료")
-                    time.sleep(3)
+                    # launch_new_program이 새 프로세스 시작까지 확인함
+                    logging.info("새 프로그램 실행 완료 - 업그레이드 매니저 종료")
+                    print("[업그레이드 매니저] 새 프로그램 실행 완료 - 업그레이드 매니저 종료")
                     
                     # 업그레이드 매니저 완료
                     logging.info("업그레이드 매니저 완료")
@@ -5,36 +5,94 @@ Text Cleaner 메인 애플리케이션
 리팩토링된 구조로 개선된 메인 진입점
 """
 
+import logging
 import sys
 import os
+import threading
 # 프로젝트 루트(src의 상위)만 sys.path에 추가 (임포트 경로 일관성)
 sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+# 시작 시간 기록기는 가장 먼저 임포트 (기준 시각)
+from src.utils.startup_profiler import startup, is_startup_profiling_requested
+
+# 이미 실행 중인 인스턴스가 있으면 인자만 넘기고 종료 (tkinter/앱 임포트 전에 확인)
+if __name__ == "__main__":
+    from src.utils.single_instance import forward_to_running_instance
+    if forward_to_running_instance(sys.argv[1:]):
+        sys.exit(0)
+
 import tkinter as tk
 from pathlib import Path
 
 # src/utils, src/ui 등 내부 모듈은 절대 경로로 임포트
 try:
-    from src.utils.environment import setup_tcl_tk_environment, setup_tkinter_environment
-    from src.utils.logging_utils import setup_logging
-    from src.ui.app import TextCleanerApp
+    from src.utils.environment import bootstrap_environment
+    from src.utils.logging_utils import setup_logging, get_user_data_path
+    from src.utils.sampling_profiler import is_profiling_requested, start_profiling
+    from src.utils import process_registry, resource_paths
+    from src.utils.single_instance import InstanceServer, forward_to_running_instance
+    with startup.phase("import.core"):
+        from src.core import TextProcessor, GuidelineManager  # noqa: F401
+    with startup.phase("import.app"):
+        from src.ui.app import TextCleanerApp
 except ImportError as e:
     print("필수 모듈을 찾을 수 없습니다. 경로 및 파일 구성을 확인하세요.")
     print(f"ImportError: {e}")
     sys.exit(1)
 
 
+def _on_first_paint() -> None:
+    """첫 화면 표시 시각 기록 및 시작 시간 보고서 출력"""
+    startup.mark("first_paint")
+    first_paint_ms = startup.phases["first_paint"]["duration_ms"]
+    logging.info(f"Startup: first paint at {first_paint_ms:.0f}ms")
+    if is_startup_profiling_requested():
+        path = startup.report(get_user_data_path() / "logs")
+        if path:
+            logging.info(f"Startup report saved: {path}")
+
+
+def _start_integrity_check() -> None:
+    """배포(exe) 실행 시 설치 폴더를 매니페스트와 백그라운드에서 비교 (결과는 로그에 기록)"""
+    if not hasattr(sys, 'frozen'):
+        return
+
+    def worker() -> None:
+        from src.core import integrity
+        cache = integrity.DigestCache(get_user_data_path() / "cache" / integrity.CACHE_FILE)
+        integrity.verify_installation(resource_paths.executable_dir(), cache)
+
+    threading.Thread(target=worker, name="integrity-check", daemon=True).start()
+
+
 def main():
     """메인 함수 - 리팩토링된 구조"""
-    # 환경 설정
-    setup_tcl_tk_environment()
-    setup_tkinter_environment()
+    # 환경 설정 (Tcl/Tk 경로 탐색 결과는 캐시되어 다음 실행부터 재사용)
+    with startup.phase("env.bootstrap"):
+        bootstrap_environment()
     
     # 로깅 설정
-    user_action_logger = setup_logging()
+    with startup.phase("logging.setup"):
+        user_action_logger = setup_logging()
+    
+    # UI를 만드는 동안 들어온 다른 실행의 요청도 받도록 IPC 수신기를 먼저 염
+    # (요청은 앱이 준비될 때까지 쌓아 둠)
+    instance_server = InstanceServer()
+    if not instance_server.start() and forward_to_running_instance(sys.argv[1:]):
+        # 동시에 실행된 다른 인스턴스가 먼저 수신기를 열었음 - 인자를 넘기고 종료
+        return
+    
+    # 업그레이드 매니저가 이 인스턴스만 정확히 종료할 수 있도록 등록
+    process_registry.register()
+    
+    # 현장 진단용 프로파일링 (TEXT_CLEANER_PROFILE=1, 종료 시 logs 폴더에 저장)
+    if is_profiling_requested():
+        start_profiling()
     
     try:
         # Tkinter 루트 윈도우 생성
-        root = tk.Tk()
+        with startup.phase("tk.root"):
+            root = tk.Tk()
         
         # 애플리케이션 인스턴스 생성
         app = TextCleanerApp(root, user_action_logger)
@@ -42,12 +100,23 @@ def main():
         # 윈도우 종료 이벤트 바인딩
         root.protocol("WM_DELETE_WINDOW", app.on_closing)
         
+        # 이후 실행의 인자는 Tk 스레드로 넘겨 처리 (쌓인 요청도 이때 전달)
+        instance_server.set_handler(lambda request: root.after(0, app.handle_instance_request, request))
+        if len(sys.argv) > 1:
+            root.after(0, app.handle_instance_request, {"args": sys.argv[1:], "cwd": os.getcwd()})
+        
         # 윈도우 중앙 정렬
         root.update_idletasks()
         x = (root.winfo_screenwidth() // 2) - (root.winfo_width() // 2)
         y = (root.winfo_screenheight() // 2) - (root.winfo_height() // 2)
         root.geometry(f"+{x}+{y}")
         
+        # 메인 루프가 첫 이벤트를 처리하는 시점을 첫 화면 표시로 기록
+        root.after(0, _on_first_paint)
+        
+        # 첫 화면 이후 설치 무결성 검증 (캐시 덕분에 바뀐 파일만 다시 해시)
+        root.after(0, _start_integrity_check)
+        
         # 메인 루프 시작
         root.mainloop()
         
@@ -56,6 +125,8 @@ def main():
         print(error_msg)
         if user_action_logger:
             user_action_logger.error(error_msg)
+    finally:
+        instance_server.close()
 
 
 if __name__ == "__main__":
@@ -6,50 +6,87 @@ OCR 처리 모듈
 타입 안전성과 오류 처리를 강화했습니다.
 """
 
+from __future__ import annotations
+
 import logging
-from typing import Optional, List, Union, Any
+import re
+import shlex
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, Optional, List, Tuple, Union, Any
 from pathlib import Path
 
-try:
-    import pytesseract  # type: ignore
-    PYTESSERACT_AVAILABLE = True
-except ImportError:
-    pytesseract = None
-    PYTESSERACT_AVAILABLE = False
-    logging.warning("pytesseract module is not installed. OCR functionality is disabled.")
+from src.utils.clipboard_service import clipboard_service
+from src.utils.lazy_import import OptionalModule
+from src.utils.perf_metrics import metrics
+
+if TYPE_CHECKING:
+    from PIL import Image as PILImage  # type: ignore
+
+# 무거운 의존성은 처음 사용할 때 임포트 (특히 OpenCV/NumPy 임포트가 시작 시간의 대부분을 차지)
+pytesseract = OptionalModule(
+    "pytesseract", "pytesseract module is not installed. OCR functionality is disabled."
+)
+Image = OptionalModule(
+    "PIL.Image", "PIL module is not installed. Image processing functionality is disabled."
+)
+ImageGrab = OptionalModule("PIL.ImageGrab")
+ImageEnhance = OptionalModule("PIL.ImageEnhance")
+ImageFilter = OptionalModule("PIL.ImageFilter")
+
+# OpenCV와 numpy도 조건부로 지연 import
+cv2_module = OptionalModule(
+    "cv2", "OpenCV module is not installed. Advanced image processing is disabled."
+)
+np_module = OptionalModule("numpy")
+
+
+def _opencv_available() -> bool:
+    return cv2_module.available and np_module.available
+
 
-try:
-    from PIL import Image, ImageGrab, ImageEnhance, ImageFilter  # type: ignore
-    from PIL import Image as PILImage
-    PIL_AVAILABLE = True
-except ImportError:
-    Image = None  # type: ignore
-    ImageGrab = None  # type: ignore
-    PIL_AVAILABLE = False
-    logging.warning("PIL module is not installed. Image processing functionality is disabled.")
+def preload_modules() -> None:
+    """OCR 의존성을 미리 임포트 (백그라운드 워밍업용)"""
+    for module in (pytesseract, Image, ImageGrab, ImageEnhance, ImageFilter, np_module, cv2_module):
+        module.load()
 
-# OpenCV와 numpy를 조건부로 import
-OPENCV_AVAILABLE = False
-cv2_module = None
-np_module = None
 
-try:
-    import cv2  # type: ignore
-    import numpy as np  # type: ignore
-    OPENCV_AVAILABLE = True
-    cv2_module = cv2
-    np_module = np
-except ImportError:
-    logging.warning("OpenCV module is not installed. Advanced image processing is disabled.")
+def __getattr__(name: str) -> Any:
+    """기존 *_AVAILABLE 상수 호환 (접근 시점에 임포트)"""
+    if name == "PYTESSERACT_AVAILABLE":
+        return pytesseract.available
+    if name == "PIL_AVAILABLE":
+        return Image.available
+    if name == "OPENCV_AVAILABLE":
+        return _opencv_available()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class OCRProcessor:
     """OCR 처리 클래스 - 타입 안전성 강화"""
     
+    # 필요한 Tesseract 언어 데이터
+    REQUIRED_LANGUAGES: Tuple[str, ...] = ("kor", "eng")
+    # 화이트리스트/설정 문자열은 모든 인스턴스가 공유 (클래스당 한 번만 생성)
+    _shared_settings: Optional[Tuple[str, str, List[str]]] = None
+    
     def __init__(self):
-        self.emoji_chars = self._generate_emoji_chars()
-        self.char_whitelist = self._generate_char_whitelist()
-        self.config_options = self._generate_config_options()
+        settings = OCRProcessor._shared_settings
+        if settings is None:
+            self.emoji_chars = self._generate_emoji_chars()
+            self.char_whitelist = self._generate_char_whitelist()
+            self.config_options = self._generate_config_options()
+            OCRProcessor._shared_settings = (self.emoji_chars, self.char_whitelist, self.config_options)
+        else:
+            self.emoji_chars, self.char_whitelist, config_options = settings
+            self.config_options = list(config_options)
+        # 계측용 설정 이름 (예: oem1_psm6)
+        self.config_labels = [self._config_label(config) for config in self.config_options]
+        
+        # 백그라운드 워밍업 상태
+        self.warm_up_status: Dict[str, Any] = {}
+        self._warm_up_lock = threading.Lock()
     
     def _generate_emoji_chars(self) -> str:
         """이모지 문자 범위 생성"""
@@ -66,37 +103,92 @@ class OCRProcessor:
     
     def _generate_config_options(self) -> List[str]:
         """Tesseract 설정 옵션 생성"""
+        whitelist = self._config_variable("tessedit_char_whitelist", self.char_whitelist)
         return [
-            f'--oem 1 --psm 6 -c tessedit_char_whitelist="{self.char_whitelist}" --preserve_interword_spaces=1',
-            f'--oem 1 --psm 3 -c tessedit_char_whitelist="{self.char_whitelist}" --preserve_interword_spaces=1',
-            f'--oem 1 --psm 11 -c tessedit_char_whitelist="{self.char_whitelist}" --preserve_interword_spaces=1',
-            f'--oem 3 --psm 6 -c tessedit_char_whitelist="{self.char_whitelist}" --preserve_interword_spaces=1',
-            f'--oem 3 --psm 3 -c tessedit_char_whitelist="{self.char_whitelist}" --preserve_interword_spaces=1'
+            f'--oem {oem} --psm {psm} -c {whitelist} -c preserve_interword_spaces=1'
+            for oem, psm in ((1, 6), (1, 3), (1, 11), (3, 6), (3, 3))
         ]
     
+    @staticmethod
+    def _config_variable(name: str, value: str) -> str:
+        """-c 변수 인자 (pytesseract가 shlex로 나눌 때 하나의 인자로 남도록 작성)
+        
+        pytesseract는 Windows에서 비POSIX 방식으로 나누므로 따옴표로 감쌀 수 없고 공백이 인자를
+        나눕니다. 공백은 Tesseract 문자 집합에 없으므로 값에서 빼고, 그 외 플랫폼은 shlex로 인용합니다.
+        """
+        argument = f"{name}={''.join(value.split())}"
+        return argument if sys.platform == 'win32' else shlex.quote(argument)
+    
+    @staticmethod
+    def _config_label(config: str) -> str:
+        """Tesseract 설정 문자열을 짧은 이름으로 변환"""
+        oem = re.search(r'--oem (\d+)', config)
+        psm = re.search(r'--psm (\d+)', config)
+        return f"oem{oem.group(1) if oem else '?'}_psm{psm.group(1) if psm else '?'}"
+    
     def is_available(self) -> bool:
         """OCR 기능 사용 가능 여부 확인"""
-        return PYTESSERACT_AVAILABLE and PIL_AVAILABLE
+        return pytesseract.available and Image.available
+    
+    def warm_up(self) -> Dict[str, Any]:
+        """OCR 첫 사용 지연을 없애기 위한 사전 준비 (백그라운드 스레드용)
+        
+        의존성 임포트, tesseract 실행 파일/언어 데이터 확인, 작은 더미 이미지 인식까지 수행합니다.
+        여러 번 호출해도 한 번만 실행됩니다.
+        """
+        with self._warm_up_lock:
+            if self.warm_up_status:
+                return self.warm_up_status
+            
+            started = time.perf_counter()
+            status: Dict[str, Any] = {"available": False}
+            
+            # 의존성 임포트 (OpenCV/NumPy 포함)
+            preload_modules()
+            status["opencv"] = _opencv_available()
+            
+            if self.is_available():
+                try:
+                    # tesseract 실행 파일 확인
+                    status["tesseract_version"] = str(pytesseract.get_tesseract_version())
+                    
+                    # 언어 데이터 확인 (get_languages는 pytesseract 0.3.7 이상)
+                    if hasattr(pytesseract, 'get_languages'):
+                        languages = set(pytesseract.get_languages(config=''))
+                        missing = [lang for lang in self.REQUIRED_LANGUAGES if lang not in languages]
+                        status["missing_languages"] = missing
+                        if missing:
+                            logging.warning(f"Tesseract 언어 데이터 누락: {', '.join(missing)}")
+                    
+                    # 더미 이미지로 전처리 + 실제 첫 번째 설정으로 인식 한 번 실행
+                    # (코드 경로와 언어 데이터 캐시 예열, 성공하면 실제 설정도 Tesseract가 받아들임)
+                    dummy = Image.new('RGB', (96, 32), color='white')
+                    variants = self.preprocess_image(dummy)
+                    pytesseract.image_to_string(variants[-1], lang='kor+eng', config=self.config_options[0])
+                    status["available"] = True
+                except Exception as e:
+                    status["error"] = str(e)
+                    logging.warning(f"OCR 워밍업 실패: {e}")
+            
+            status["seconds"] = round(time.perf_counter() - started, 3)
+            self.warm_up_status = status
+            logging.info(f"OCR 워밍업 완료: {status}")
+            return status
     
     def get_clipboard_image(self) -> Optional[PILImage.Image]:
         """클립보드에서 이미지 가져오기"""
-        if not PIL_AVAILABLE or ImageGrab is None:
-            return None
-        
-        try:
-            image = ImageGrab.grabclipboard()
-            if isinstance(image, PILImage.Image):
-                return image
-            return None
-        except Exception as e:
-            logging.error(f"클립보드 이미지 가져오기 실패: {e}")
-            return None
+        return clipboard_service.get_image()
     
     def preprocess_image(self, image: PILImage.Image) -> List[PILImage.Image]:
         """이미지 전처리 - 타입 안전성 강화"""
-        if not isinstance(image, PILImage.Image):
+        if not Image.available or not isinstance(image, Image.Image):
             return []
         
+        with metrics.timer("ocr.preprocess"):
+            return self._preprocess_steps(image)
+    
+    def _preprocess_steps(self, image: PILImage.Image) -> List[PILImage.Image]:
+        """전처리 단계별 실행 (단계마다 계측)"""
         img_list: List[PILImage.Image] = []
         
         # 원본 이미지 추가
@@ -104,24 +196,27 @@ class OCRProcessor:
         
         # 그레이스케일 변환
         try:
-            img_gray = image.convert('L')
+            with metrics.timer("ocr.preprocess.grayscale"):
+                img_gray = image.convert('L')
             img_list.append(img_gray)
         except Exception as e:
             logging.warning(f"그레이스케일 변환 실패: {e}")
             return img_list
 
         # OpenCV 이진화 (타입 안전성 강화)
-        if OPENCV_AVAILABLE and (cv2_module is not None) and (np_module is not None):
+        if _opencv_available():
             try:
-                img_bin = self._opencv_binarization(img_gray)
-                if img_bin is not None and isinstance(img_bin, PILImage.Image):
+                with metrics.timer("ocr.preprocess.opencv_binarization"):
+                    img_bin = self._opencv_binarization(img_gray)
+                if img_bin is not None and isinstance(img_bin, Image.Image):
                     img_list.append(img_bin)
             except Exception as e:
                 logging.warning(f"OpenCV 이진화 실패: {e}")
         
         # PIL 기반 이진화 (fallback)
         try:
-            img_bin_pil = self._pil_binarization(img_gray)
+            with metrics.timer("ocr.preprocess.pil_binarization"):
+                img_bin_pil = self._pil_binarization(img_gray)
             if img_bin_pil is not None:
                 img_list.append(img_bin_pil)
         except Exception as e:
@@ -129,20 +224,22 @@ class OCRProcessor:
         
         # 이미지 향상
         try:
-            img_enhanced = self._enhance_image(img_gray)
+            with metrics.timer("ocr.preprocess.enhance"):
+                img_enhanced = self._enhance_image(img_gray)
             if img_enhanced is not None:
                 img_list.append(img_enhanced)
         except Exception as e:
             logging.warning(f"이미지 향상 실패: {e}")
         
         # 크기 조정
-        img_list = self._resize_images(img_list)
+        with metrics.timer("ocr.preprocess.resize"):
+            img_list = self._resize_images(img_list)
         
         return img_list
     
     def _opencv_binarization(self, img_gray: PILImage.Image) -> Optional[PILImage.Image]:
         """OpenCV를 사용한 이진화 - 타입 안전성 강화"""
-        if not OPENCV_AVAILABLE or cv2_module is None or np_module is None:
+        if not _opencv_available():
             return None
         
         try:
@@ -170,7 +267,7 @@ class OCRProcessor:
                     threshold_flag |= cv2_module.THRESH_OTSU
                 
                 _, img_bin = cv2_module.threshold(img_cv_gray, 0, 255, threshold_flag)
-                return PILImage.fromarray(img_bin)
+                return Image.fromarray(img_bin)
             
         except Exception as e:
             logging.warning(f"OpenCV 이진화 처리 중 오류: {e}")
@@ -180,10 +277,10 @@ class OCRProcessor:
     def _pil_binarization(self, img_gray: PILImage.Image) -> Optional[PILImage.Image]:
         """PIL을 사용한 이진화"""
         try:
-            if np_module is not None:
+            if np_module.available:
                 arr = np_module.array(img_gray)
                 arr_bin = (arr < 128).astype('uint8') * 255
-                return PILImage.fromarray(arr_bin)
+                return Image.fromarray(arr_bin)
         except Exception as e:
             logging.warning(f"PIL 이진화 처리 중 오류: {e}")
         
@@ -221,7 +318,7 @@ class OCRProcessor:
                 if hasattr(img, 'size') and (img.size[0] < 200 or img.size[1] < 200):
                     scale_factor = max(2, 300 // min(img.size))
                     new_size = (img.size[0] * scale_factor, img.size[1] * scale_factor)
-                    resample = getattr(PILImage, 'LANCZOS', getattr(PILImage, 'ANTIALIAS', 1))
+                    resample = getattr(Image, 'LANCZOS', getattr(Image, 'ANTIALIAS', 1))
                     resized_img = img.resize(new_size, resample)
                     resized_list.append(resized_img)
                 else:
@@ -234,43 +331,49 @@ class OCRProcessor:
     
     def extract_text_from_images(self, img_list: List[PILImage.Image]) -> str:
         """이미지 리스트에서 텍스트 추출"""
-        if not PYTESSERACT_AVAILABLE or pytesseract is None:
+        if not pytesseract.available:
             return ""
         
+        with metrics.timer("ocr.extract"):
+            results = self._run_tesseract_attempts(img_list)
+        
+        # 가장 긴 결과 반환
+        if results:
+            return max(results, key=len)
+        
+        return ""
+    
+    def _run_tesseract_attempts(self, img_list: List[PILImage.Image]) -> List[str]:
+        """이미지 변형 × 설정 조합마다 tesseract 호출 (호출마다 계측)"""
         results: List[str] = []
         
-        for img in img_list:
-            if not isinstance(img, PILImage.Image):
+        for variant_index, img in enumerate(img_list):
+            if not isinstance(img, Image.Image):
                 continue
             
-            for config in self.config_options:
+            for config, label in zip(self.config_options, self.config_labels):
                 try:
-                    text = pytesseract.image_to_string(
-                        img, 
-                        lang='kor+eng', 
-                        config=config
-                    )
+                    with metrics.timer(f"ocr.tesseract.v{variant_index}.{label}"):
+                        text = pytesseract.image_to_string(
+                            img, 
+                            lang='kor+eng', 
+                            config=config
+                        )
                     if text.strip():
                         results.append(text.strip())
+                    else:
+                        metrics.increment("ocr.tesseract.empty")
                 except Exception as e:
+                    metrics.increment("ocr.tesseract.failed")
                     logging.warning(f"OCR 처리 실패 (config: {config[:50]}...): {e}")
         
-        # 가장 긴 결과 반환
-        if results:
-            return max(results, key=len)
-        
-        return ""
+        return results
     
-    def process_clipboard_image(self) -> str:
-        """클립보드 이미지 처리"""
+    def process_image(self, image: PILImage.Image) -> str:
+        """이미 디코딩된 이미지 처리 (클립보드 이미지를 다시 가져오지 않음)"""
         if not self.is_available():
             return ""
         
-        # 클립보드에서 이미지 가져오기
-        image = self.get_clipboard_image()
-        if image is None:
-            return ""
-        
         # 이미지 전처리
         img_list = self.preprocess_image(image)
         if not img_list:
@@ -279,6 +382,19 @@ class OCRProcessor:
         # 텍스트 추출
         return self.extract_text_from_images(img_list)
     
+    def process_clipboard_image(self, image: Optional[PILImage.Image] = None) -> str:
+        """클립보드 이미지 처리 (이미 가져온 이미지가 있으면 그대로 사용)"""
+        if not self.is_available():
+            return ""
+        
+        # 클립보드에서 이미지 가져오기 (한 번만)
+        if image is None:
+            image = self.get_clipboard_image()
+        if image is None:
+            return ""
+        
+        return self.process_image(image)
+    
     def process_image_file(self, file_path: Union[str, Path]) -> str:
         """이미지 파일 처리"""
         if not self.is_available():
@@ -286,19 +402,11 @@ class OCRProcessor:
         
         try:
             # 이미지 파일 로드
-            if Image is None:
-                return ""
             image = Image.open(str(file_path))
-            if not isinstance(image, PILImage.Image):
-                return ""
-            
-            # 이미지 전처리
-            img_list = self.preprocess_image(image)
-            if not img_list:
+            if not isinstance(image, Image.Image):
                 return ""
             
-            # 텍스트 추출
-            return self.extract_text_from_images(img_list)
+            return self.process_image(image)
             
         except Exception as e:
             logging.error(f"이미지 파일 처리 실패: {e}")
@@ -5,24 +5,38 @@ Text Cleaner 메인 애플리케이션 UI
 리팩토링된 구조로 개선된 사용자 인터페이스
 """
 
+import datetime
 import logging
 import subprocess
 import sys
 import threading
+import time
 import tkinter as tk
 from pathlib import Path
 from tkinter import messagebox, scrolledtext, ttk, filedialog
-from typing import Dict, Any, Optional, Tuple, List, Union, Callable
+from typing import TYPE_CHECKING, Dict, Any, Optional, Tuple, List, Union, Callable
 from functools import lru_cache
 import weakref
 
 # 절대 경로 import로 수정
 from src.core.text_processor import TextProcessor
 from src.core.guideline_manager import GuidelineManager
-from src.core.upgrade_manager import UpgradeManager
-from src.ocr.ocr_processor import OCRProcessor
+from src.core.document import Document
+from src.core import tabular_paste
 from src.utils.logging_utils import log_user_action, get_user_data_path
+from src.utils import resource_paths
 from src.utils.locale_utils import get_ui_text, format_ui_text
+from src.ui.virtual_text import VirtualTextView
+from src.utils.clipboard_service import clipboard_service
+from src.utils.clipboard_watcher import ClipboardWatcher
+from src.utils.perf_metrics import metrics
+from src.utils.sampling_profiler import is_profiling, start_profiling, stop_profiling
+from src.utils.startup_profiler import startup
+
+if TYPE_CHECKING:
+    # OCR/업그레이드 모듈은 무거운 의존성이 있어 처음 사용할 때 임포트
+    from src.core.upgrade_manager import UpgradeManager
+    from src.ocr.ocr_processor import OCRProcessor
 
 
 class TextCleanerApp:
@@ -46,7 +60,9 @@ class TextCleanerApp:
     # 성능 최적화 설정
     MAX_TEXT_LENGTH: int = 100000  # 최대 텍스트 길이 제한
     BATCH_SIZE: int = 1000  # 배치 처리 크기
-    DEBOUNCE_DELAY: int = 300  # 디바운스 지연 시간 (ms)
+    WARM_UP_DELAY: int = 500  # 창 표시 후 백그라운드 워밍업까지 지연 시간 (ms)
+    PASTE_CHUNK_LINES: int = 2000  # 변환된 붙여넣기를 한 번에 삽입할 줄 수
+    IMAGE_FILE_SUFFIXES: Tuple[str, ...] = (".png", ".jpg", ".jpeg", ".bmp", ".tiff", ".tif", ".gif", ".webp")
 
     def __init__(self, root: tk.Tk, user_action_logger: Optional[logging.Logger] = None) -> None:
         """애플리케이션 초기화"""
@@ -57,25 +73,39 @@ class TextCleanerApp:
         self.text: Dict[str, str] = get_ui_text()
         
         # 성능 최적화를 위한 변수들
-        self._debounce_timer: Optional[str] = None
         self._text_cache: Dict[str, str] = {}
         self._processing_lock: threading.Lock = threading.Lock()
         
+        # 클립보드 자동 정리 (선택 기능)
+        self._clipboard_watcher: Optional[ClipboardWatcher] = None
+        self._watch_generation: int = 0
+        self._watch_lock: threading.Lock = threading.Lock()
+        
+        # 붙여넣기 변환 세대 (새 붙여넣기가 시작되면 이전 변환 결과는 버림)
+        self._paste_generation: int = 0
+        # 붙여넣기를 시작할 때의 문서 버전 (변환 중에 입력이 바뀌면 결과로 덮어쓰지 않음)
+        self._paste_document_version: int = 0
+        
         # 윈도우 설정
         self._setup_window()
         
         # 모듈 초기화
-        self._initialize_modules()
+        with startup.phase("app.modules"):
+            self._initialize_modules()
         
         # 아이콘 설정
         self._setup_icon()
 
         # UI 구성
-        self._setup_ui()
+        with startup.phase("ui.setup"):
+            self._setup_ui()
         
         # 상태 변수
         self.processing: bool = False
         
+        # 창이 표시된 뒤 OCR 의존성을 백그라운드에서 미리 로드
+        self.root.after(self.WARM_UP_DELAY, self._start_background_warm_up)
+        
         logging.info("Application initialization completed")
 
     def _setup_window(self) -> None:
@@ -89,19 +119,61 @@ class TextCleanerApp:
         user_data_path: Path = get_user_data_path()
         self.text_processor: TextProcessor = TextProcessor()
         self.guideline_manager: GuidelineManager = GuidelineManager(user_data_path)
-        self.upgrade_manager: UpgradeManager = UpgradeManager(self.guideline_manager)
-        self.ocr_processor: OCRProcessor = OCRProcessor()
+        # OCR/업그레이드 처리기는 처음 사용할 때 생성 (ocr_processor, upgrade_manager 속성)
+        self._ocr_processor: Optional["OCRProcessor"] = None
+        self._upgrade_manager: Optional["UpgradeManager"] = None
+        self._lazy_init_lock: threading.Lock = threading.Lock()
         self.current_guideline: Optional[str] = None
 
         # 가이드라인 로드
-        self.guideline_manager.load_guidelines()
+        with startup.phase("guidelines.load"):
+            self.guideline_manager.load_guidelines()
         self.guidelines: Dict[str, Any] = self.guideline_manager.guidelines
 
+    @property
+    def ocr_processor(self) -> "OCRProcessor":
+        """OCR 처리기 (처음 사용할 때 임포트/생성)"""
+        if self._ocr_processor is None:
+            with self._lazy_init_lock:
+                if self._ocr_processor is None:
+                    with startup.phase("import.OCRProcessor"):
+                        from src.ocr.ocr_processor import OCRProcessor
+                        self._ocr_processor = OCRProcessor()
+        return self._ocr_processor
+
+    @property
+    def upgrade_manager(self) -> "UpgradeManager":
+        """업그레이드 관리자 (처음 사용할 때 임포트/생성)"""
+        if self._upgrade_manager is None:
+            with self._lazy_init_lock:
+                if self._upgrade_manager is None:
+                    with startup.phase("import.UpgradeManager"):
+                        from src.core.upgrade_manager import UpgradeManager
+                        self._upgrade_manager = UpgradeManager(self.guideline_manager)
+        return self._upgrade_manager
+
+    def _start_background_warm_up(self) -> None:
+        """첫 화면 표시 후 OCR 서브시스템 백그라운드 워밍업
+        
+        의존성 임포트, tesseract/언어 데이터 확인, 더미 인식까지 미리 실행해
+        첫 클립보드 OCR에서 초기화 지연이 생기지 않도록 합니다.
+        """
+        def warm_up():
+            try:
+                with startup.phase("warm_up.ocr"):
+                    status = self.ocr_processor.warm_up()
+                logging.info(f"Background warm-up completed in {status.get('seconds', 0):.2f}s "
+                             f"(OCR available: {status.get('available')})")
+            except Exception as e:
+                logging.warning(f"Background warm-up failed: {e}")
+        
+        threading.Thread(target=warm_up, name="warm-up", daemon=self.THREAD_DAEMON).start()
+
     def _setup_icon(self) -> None:
         """아이콘 설정"""
         try:
-            icon_path: Path = Path(__file__).parent.parent.parent / "icon.ico"
-            if icon_path.exists():
+            icon_path: Optional[Path] = resource_paths.icon_path()
+            if icon_path is not None:
                 self.root.iconbitmap(str(icon_path))
                 logging.info("Icon set successfully")
             else:
@@ -130,6 +202,10 @@ class TextCleanerApp:
         # ESC 키 바인딩 (메인 창 종료)
         self.root.bind('<Escape>', self._on_escape_main)
         self.root.bind('<Key-Escape>', self._on_escape_main)
+        
+        # 진단 창 (숨은 단축키)
+        self.root.bind('<Control-Shift-D>', self._show_diagnostics_window)
+        self.root.bind('<Control-Shift-P>', self._toggle_profiling)
 
     def _create_title(self) -> None:
         """제목 생성"""
@@ -159,10 +235,10 @@ class TextCleanerApp:
         default_config.update(kwargs)
         return default_config
 
-    def _create_text_widget(self, parent: tk.Widget, **kwargs: Any) -> scrolledtext.ScrolledText:
-        """텍스트 위젯 생성 헬퍼 함수 (최적화됨)"""
+    def _create_virtual_text_widget(self, parent: tk.Widget, **kwargs: Any) -> VirtualTextView:
+        """큰 문서는 보이는 줄만 그리는 텍스트 뷰 생성"""
         config = self._create_text_widget_config(**kwargs)
-        return scrolledtext.ScrolledText(parent, **config)
+        return VirtualTextView(parent, **config)
 
     def _setup_input_area(self) -> None:
         """입력 영역 설정"""
@@ -178,9 +254,6 @@ class TextCleanerApp:
 
         # 리스트 입력 영역
         self._create_list_input_area(input_frame)
-        
-        # 숨겨진 입력 텍스트 영역
-        self._create_hidden_input_area(input_frame)
 
     def _create_guideline_selector(self, parent: tk.Widget) -> None:
         """가이드라인 선택기 생성"""
@@ -211,37 +284,38 @@ class TextCleanerApp:
         list_frame.grid(row=1, column=0, sticky="nsew")
         list_frame.columnconfigure(0, weight=1)
         
-        # 리스트 입력 영역
-        self.list_text: scrolledtext.ScrolledText = self._create_text_widget(list_frame)
+        # 리스트 입력 영역 (큰 문서는 보이는 줄만 그리고 편집 내용은 줄 저장소에 반영)
+        self.list_text: VirtualTextView = self._create_virtual_text_widget(list_frame)
         self.list_text.grid(row=0, column=0, sticky="nsew")
         
-        # 이벤트 바인딩 (디바운스 적용)
+        # 입력 문서 모델: 리스트 위젯이 원본이며, 정리할 때만 텍스트를 읽음
+        self.document: Document = Document()
+        self.document.bind_source(self._read_list_input)
+        
+        # 이벤트 바인딩
         self._bind_list_events()
 
     def _bind_list_events(self) -> None:
-        """리스트 텍스트 위젯 이벤트 바인딩 (디바운스 적용)"""
+        """리스트 텍스트 위젯 이벤트 바인딩"""
         self.list_text.bind("<<Paste>>", self._on_list_paste)
         self.list_text.bind("<Control-v>", self._on_list_paste)
         self.list_text.bind("<Command-v>", self._on_list_paste)
-        self.list_text.bind("<KeyRelease>", self._debounced_key_release)
-
-    def _debounced_key_release(self, event: Optional[tk.Event] = None) -> None:
-        """디바운스된 키 릴리즈 이벤트"""
-        if self._debounce_timer:
-            self.root.after_cancel(self._debounce_timer)
-        
-        self._debounce_timer = self.root.after(self.DEBOUNCE_DELAY, self._on_list_key_release)
-
-    def _create_hidden_input_area(self, parent: tk.Widget) -> None:
-        """숨겨진 입력 텍스트 영역 생성"""
-        self.input_text: scrolledtext.ScrolledText = self._create_text_widget(parent, height=12)
-        self.input_text.grid(row=2, column=0, sticky="nsew")
-        self.input_text.insert(1.0, self.text['input_hint'])
-        self.input_text.bind("<FocusIn>", self._clear_hint)
-        self.input_text.bind("<FocusOut>", self._restore_hint)
-        
-        # 숨김 처리
-        self.input_text.grid_remove()
+        # 키 입력, 붙여넣기, 실행 취소, 코드에서의 삽입 등 모든 변경을 한 곳에서 감지
+        self.list_text.bind("<<Modified>>", self._on_list_modified)
+
+    def _on_list_modified(self, event: Optional[tk.Event] = None) -> None:
+        """리스트 내용 변경 시 문서 버전만 올림 (텍스트 복사 없음)"""
+        if self.list_text.edit_modified():
+            self.document.invalidate()
+            # 다음 변경에서도 <<Modified>>가 발생하도록 플래그 초기화
+            self.list_text.edit_modified(False)
+
+    def _read_list_input(self) -> str:
+        """정리할 입력 텍스트 (#으로 시작하는 내용은 입력으로 보지 않음)"""
+        list_data = self.list_text.get(1.0, "end-1c").strip()
+        if list_data.startswith("#"):
+            return ""
+        return list_data
 
     def _optimize_text_processing(self, text: str) -> str:
         """텍스트 처리 최적화"""
@@ -277,13 +351,21 @@ class TextCleanerApp:
         log_user_action("Paste into list")
         logging.info("=== 리스트 붙여넣기 시작 ===")
         
-        # 먼저 클립보드에서 이미지 확인
-        if self.ocr_processor.is_available():
-            clipboard_image = self.ocr_processor.get_clipboard_image()
-            if clipboard_image is not None:
+        # 먼저 클립보드 형식만 확인 (텍스트 붙여넣기는 이미지 디코딩 비용 없음)
+        has_image = clipboard_service.has_image()
+        if has_image is not False and self.ocr_processor.is_available():
+            if has_image:
+                # 이미지는 OCR 스레드에서 한 번만 가져와 디코딩
                 logging.info("클립보드에서 이미지 감지 - OCR 처리 시작")
                 self._process_clipboard_image_ocr()
                 return "break"
+            
+            # 형식 확인을 지원하지 않는 플랫폼: 한 번 가져온 이미지를 그대로 OCR에 전달
+            clipboard_image = clipboard_service.get_image()
+            if clipboard_image is not None:
+                logging.info("클립보드에서 이미지 감지 - OCR 처리 시작")
+                self._process_clipboard_image_ocr(clipboard_image)
+                return "break"
         
         # 이미지가 없으면 기존 텍스트 처리 로직 실행
         try:
@@ -294,97 +376,84 @@ class TextCleanerApp:
             logging.error(f"클립보드 가져오기 실패: {e}")
             return
         
-        if '\t' in pasted or ',' in pasted:
-            # 엑셀 데이터를 리스트 형식으로 변환
-            logging.info("엑셀 형식 데이터 감지 - 변환 시작")
-            converted_data = self._convert_excel_to_list_format(pasted)
-            logging.info(f"변환된 데이터 길이: {len(converted_data)} 문자")
-            logging.info("변환된 데이터 미리보기:")
-            for i, line in enumerate(converted_data.splitlines(), 1):
-                if line.strip():
-                    logging.info(f"변환 라인 {i}: {repr(line)}")
-            
-            self.list_text.delete(1.0, tk.END)
-            self.list_text.insert(1.0, converted_data)
-            logging.info("리스트 텍스트에 변환된 데이터 삽입 완료")
+        # 형식 감지는 앞부분 표본만 보므로 Tk 스레드에서 바로 확인
+        dialect = tabular_paste.sniff_dialect(pasted)
+        if dialect is not None:
+            # 엑셀 데이터 변환은 작업 스레드에서, 삽입은 나눠서 Tk 스레드에서
+            logging.info("엑셀 형식 데이터 감지 - 변환 시작 (구분자: %r)", dialect.delimiter)
+            self._paste_generation += 1
+            # 아직 처리되지 않은 변경을 먼저 반영한 뒤 기준 버전 기록
+            self._on_list_modified()
+            self._paste_document_version = self.document.version
+            self.status_var.set(self.text['paste_converting'])
+            threading.Thread(target=self._convert_paste_in_thread,
+                             args=(self._paste_generation, pasted, dialect),
+                             name="paste-convert", daemon=self.THREAD_DAEMON).start()
             return "break"
         else:
             logging.info("일반 텍스트 붙여넣기 - 변환 없이 처리")
-            # 일반 텍스트는 그대로 붙여넣기 (기본 동작)
-            pass
+            # 일반 텍스트도 뷰를 거쳐 붙여넣기 (기본 Tk 바인딩은 큰 텍스트를 가상 모드로 넘기지 않음)
+            self.list_text.insert_at_cursor(pasted)
+            return "break"
 
-    def _on_list_key_release(self, event=None):
-        """리스트 키 입력 시 호출"""
-        # 리스트 데이터를 숨겨진 input_text에 저장
-        list_data = self.list_text.get(1.0, tk.END).strip()
-        if list_data and not list_data.startswith("#"):
-            self.input_text.delete(1.0, tk.END)
-            self.input_text.insert(1.0, list_data)
+    def _convert_paste_in_thread(self, generation: int, pasted: str, dialect: Any) -> None:
+        """붙여넣은 표 데이터를 작업 스레드에서 변환하고 삽입 단위로 분할"""
+        try:
+            with metrics.timer("ui.paste_convert"):
+                converted_data = tabular_paste.convert_to_list_format(pasted, dialect)
+                lines = converted_data.split('\n') if converted_data else []
+                chunks = ['\n'.join(lines[i:i + self.PASTE_CHUNK_LINES])
+                          for i in range(0, len(lines), self.PASTE_CHUNK_LINES)]
+            logging.info(f"변환된 데이터 길이: {len(converted_data)} 문자, {len(lines)} 줄")
+            logging.info(f"변환된 데이터 미리보기: {repr(converted_data[:200])}...")
+            self.root.after(0, self._begin_paste_insert, generation, chunks, len(lines))
+        except Exception as e:
+            logging.error(f"붙여넣기 변환 실패: {e}")
+            self.root.after(0, self.status_var.set, "Error occurred")
+
+    def _begin_paste_insert(self, generation: int, chunks: List[str], total_lines: int) -> None:
+        """변환 결과 삽입 시작 (Tk 스레드)"""
+        if generation != self._paste_generation:
+            logging.info("이전 붙여넣기 변환 결과 무시 (새 붙여넣기 시작됨)")
+            return
+        self._on_list_modified()
+        if self.document.version != self._paste_document_version:
+            # 변환하는 동안 사용자가 입력을 편집함 - 그 내용을 지우지 않고 붙여넣기 취소
+            logging.info("붙여넣기 변환 중 입력이 변경되어 변환 결과를 버림")
+            self._paste_generation += 1
+            self.status_var.set(self.text['paste_cancelled'])
+            return
+        self.list_text.delete(1.0, tk.END)
+        self._insert_paste_chunk(generation, chunks, 0, total_lines)
+
+    def _insert_paste_chunk(self, generation: int, chunks: List[str], index: int,
+                            total_lines: int) -> None:
+        """한 번에 한 덩어리씩 삽입하고 나머지는 다음 이벤트 루프 차례로 미룸"""
+        if generation != self._paste_generation:
+            return
+        if index < len(chunks):
+            text = chunks[index] if index == 0 else '\n' + chunks[index]
+            self.list_text.insert(tk.END + "-1c", text)
+            done = min((index + 1) * self.PASTE_CHUNK_LINES, total_lines)
+            self.status_var.set(format_ui_text('paste_inserting', done=done, total=total_lines))
+            self.root.after(1, self._insert_paste_chunk, generation, chunks, index + 1, total_lines)
+            return
+
+        self.status_var.set(format_ui_text('paste_converted', count=total_lines))
+        logging.info("리스트 텍스트에 변환된 데이터 삽입 완료")
 
     def _convert_excel_to_list_format(self, text):
         """엑셀 데이터를 리스트 형식으로 변환"""
-        lines = []
-        
-        for row in text.splitlines():
-            if not row.strip():
-                continue
-                
-            # 셀 분리 (탭/쉼표)
-            if '\t' in row:
-                cells = row.split('\t')
-            else:
-                cells = row.split(',')
-            
-            # 3개 컬럼에 맞게 처리
-            processed_cells = []
-            for i, cell in enumerate(cells[:3]):  # 최대 3개 컬럼만 처리
-                cell = cell.strip()
-                if not cell:
-                    cell = ""
-                
-                # 첫 번째 컬럼(체크박스) 처리
-                if i == 0:
-                    cell = self._process_checkbox_value(cell)
-                
-                # 두 번째 컬럼(숫자) 처리
-                elif i == 1:
-                    cell = self._process_number_value(cell)
-                
-                processed_cells.append(cell)
-            
-            # 빈 셀이 아닌 경우만 라인에 추가
-            if any(cell.strip() for cell in processed_cells):
-                # 리스트 형식으로 변환 (빈 셀은 공백으로 처리)
-                line = " | ".join(processed_cells)
-                lines.append(line)
-        
-        return '\n'.join(lines)
+        return tabular_paste.convert_to_list_format(text)
 
     def _process_checkbox_value(self, value):
         """체크박스 값 처리"""
-        value_lower = value.lower().strip()
         # 패턴이 없으면 원본 값 반환
         return value
 
     def _process_number_value(self, value):
         """숫자 값 처리"""
-        import re
-        
-        # 숫자 패턴 찾기
-        number_pattern = r'^(\d+(?:\.\d+)?)'
-        match = re.match(number_pattern, value.strip())
-        
-        if match:
-            return match.group(1)
-        
-        # 숫자가 뒤에 있는 경우
-        number_pattern_end = r'(\d+(?:\.\d+)?)$'
-        match = re.search(number_pattern_end, value.strip())
-        
-        if match:
-            return match.group(1)
-        
-        return value
+        return tabular_paste.extract_number(value)
 
     def _setup_buttons(self) -> None:
         """버튼 영역 설정"""
@@ -393,6 +462,12 @@ class TextCleanerApp:
         
         # 버튼 생성 및 배치
         self._create_action_buttons(button_frame)
+        
+        # 클립보드 자동 정리 토글 (기본 꺼짐)
+        self.clipboard_watch_var: tk.BooleanVar = tk.BooleanVar(value=False)
+        ttk.Checkbutton(button_frame, text=self.text['clipboard_watch'],
+                        variable=self.clipboard_watch_var,
+                        command=self._toggle_clipboard_watch).pack(side=tk.LEFT, padx=self.BUTTON_PADDING)
 
     def _create_action_buttons(self, parent: tk.Widget) -> None:
         """액션 버튼들 생성"""
@@ -434,7 +509,7 @@ class TextCleanerApp:
         output_frame.columnconfigure(0, weight=1)
         output_frame.rowconfigure(0, weight=1)
         
-        self.output_text: scrolledtext.ScrolledText = self._create_text_widget(output_frame)
+        self.output_text: VirtualTextView = self._create_virtual_text_widget(output_frame)
         self.output_text.grid(row=0, column=0, sticky="nsew")
 
     def _setup_statusbar(self) -> None:
@@ -457,22 +532,19 @@ class TextCleanerApp:
             self.guideline_combo.set("No Guidelines")
             self.guideline_combo.config(state="disabled")
             self.current_guideline = None
+        self._apply_guideline_replacements()
 
-    def _clear_hint(self, event: Optional[tk.Event] = None) -> None:
-        """힌트 텍스트 지우기"""
-        if self.input_text.get(1.0, tk.END).strip() == self.text['input_hint']:
-            self.input_text.delete(1.0, tk.END)
-
-    def _restore_hint(self, event: Optional[tk.Event] = None) -> None:
-        """힌트 텍스트 복원"""
-        if not self.input_text.get(1.0, tk.END).strip():
-            self.input_text.insert(1.0, self.text['input_hint'])
+    def _apply_guideline_replacements(self) -> None:
+        """현재 가이드라인의 문구 치환 테이블을 텍스트 처리기에 반영"""
+        replacements = self.guideline_manager.get_replacements(self.current_guideline)
+        self.text_processor.set_custom_replacements(replacements)
 
     def _on_guideline_selected(self, event: Optional[tk.Event] = None) -> None:
         """가이드라인 선택 이벤트"""
         selected: str = self.guideline_var.get()
         if selected in self.guidelines:
             self.current_guideline = selected
+            self._apply_guideline_replacements()
             logging.info("Guideline selected: %s", selected)
             log_user_action("Guideline selected", f"Selected guideline: {selected}")
             self.status_var.set(format_ui_text('select_guideline', name=selected))
@@ -496,8 +568,9 @@ class TextCleanerApp:
             logging.info("Starting text cleaning")
             self._start_processing()
             
-            input_content: str = self.input_text.get(1.0, tk.END)
-            logging.info("Input text length: %d characters", len(input_content))
+            version, input_content = self.document.snapshot()
+            logging.info("Input text length: %d characters (document version %d)",
+                         len(input_content), version)
             
             # 텍스트 처리 최적화
             input_content = self._optimize_text_processing(input_content)
@@ -548,7 +621,8 @@ class TextCleanerApp:
         """처리 스레드 시작"""
         processing_thread: threading.Thread = threading.Thread(
             target=self._process_text_in_thread,
-            args=(input_content,)
+            args=(input_content,),
+            name="text-processing"
         )
         processing_thread.daemon = self.THREAD_DAEMON
         processing_thread.start()
@@ -576,25 +650,13 @@ class TextCleanerApp:
             # 입력 텍스트 미리보기 로그
             logging.info(f"입력 텍스트 미리보기: {repr(input_content[:200])}...")
             
-            # 배치 처리 적용
-            if len(input_lines) > self.BATCH_SIZE:
-                logging.info(f"Large text detected ({len(input_lines)} lines), using batch processing")
-                result_text = self._process_large_text(input_content)
-            else:
-                # 일반 처리
-                cleaned_lines: List[str]
-                total_youtube_links_removed: int
-                cleaned_lines, total_youtube_links_removed = self.text_processor.process_text(input_content)
-                result_text = '\n'.join(cleaned_lines)
+            # 정리 + 가이드라인 적용
+            result_text, applied_rules = self._run_clean_pipeline(input_content)
             
             # 처리 결과 로그
             logging.info(f"Original lines: {len(input_lines)}, Cleaned lines: {len(result_text.splitlines())}")
-            
-            # 가이드라인 적용
-            if self.current_guideline and self.current_guideline in self.guidelines:
-                logging.info(f"Applying guideline '{self.current_guideline}'")
-                result_text, applied_rules = self._apply_guideline_rules(result_text)
-                logging.info(f"Applied rules: {applied_rules}")
+            if applied_rules:
+                logging.info(f"Applied guideline '{self.current_guideline}' rules: {applied_rules}")
             
             # 결과 캐싱
             cache_key = f"{hash(input_content)}_{self.current_guideline}"
@@ -617,6 +679,19 @@ class TextCleanerApp:
             logging.error(error_msg)
             self.root.after(0, self._show_error_and_reset, error_msg)
 
+    def _run_clean_pipeline(self, text: str) -> Tuple[str, List[str]]:
+        """텍스트 정리 + 가이드라인 규칙 적용 (작업 스레드용, 라인별 로그 없음)"""
+        if text.count('\n') >= self.BATCH_SIZE:
+            logging.info("Large text detected, using batch processing")
+            result_text = self._process_large_text(text)
+        else:
+            cleaned_lines, _ = self.text_processor.process_text(text)
+            result_text = '\n'.join(cleaned_lines)
+        
+        if self.current_guideline and self.current_guideline in self.guidelines:
+            return self._apply_guideline_rules(result_text)
+        return result_text, []
+
     def _log_output_text(self, result_text: str) -> None:
         """출력 텍스트 로깅"""
         logging.info("=== 처리된 출력 텍스트 ===")
@@ -654,6 +729,7 @@ class TextCleanerApp:
     def _update_gui_with_result(self, result_text: str, original_lines: int, 
                                cleaned_lines: List[str], youtube_links_removed: int) -> None:
         """GUI 결과 업데이트"""
+        update_started = time.perf_counter()
         try:
             logging.info("Updating output area")
             self.output_text.delete(1.0, tk.END)
@@ -699,6 +775,7 @@ class TextCleanerApp:
         finally:
             self.processing = False
             self.clean_button.config(state='normal')
+            metrics.observe("ui.update_result", time.perf_counter() - update_started)
             logging.info("Processing state reset")
 
     def _update_status(self, original_lines: int, cleaned_lines: List[str], 
@@ -797,7 +874,6 @@ class TextCleanerApp:
         if input_content and not input_content.startswith("#"):
             logging.info("Clearing input text after clipboard copy")
             self.list_text.delete(1.0, tk.END)
-            self.input_text.delete(1.0, tk.END)
             copy_message: str = f"{self.text['clipboard_copied']} - 입력 텍스트 자동 지워짐"
             self.status_var.set(copy_message)
             log_user_action("Clear Input", "Auto-cleared after clipboard copy")
@@ -892,7 +968,7 @@ class TextCleanerApp:
                 self.root.after(0, self._handle_ocr_error, str(e))
         
         # OCR 스레드 시작
-        ocr_thread = threading.Thread(target=ocr_processing)
+        ocr_thread = threading.Thread(target=ocr_processing, name="ocr-file")
         ocr_thread.daemon = True
         ocr_thread.start()
 
@@ -900,10 +976,12 @@ class TextCleanerApp:
         """대용량 텍스트 배치 처리"""
         batches = self._batch_process_text(text)
         results = []
+        # 모든 배치가 같은 기준 날짜를 사용하도록 한 번만 계산
+        reference_time = datetime.datetime.now()
         
         for i, batch in enumerate(batches):
             logging.info(f"Processing batch {i+1}/{len(batches)}")
-            cleaned_lines, _ = self.text_processor.process_text(batch)
+            cleaned_lines, _ = self.text_processor.process_text(batch, reference_time)
             results.extend(cleaned_lines)
         
         return '\n'.join(results)
@@ -937,8 +1015,8 @@ class TextCleanerApp:
         self.status_var.set(error_msg)
         messagebox.showerror("OCR Error", f"Failed to extract text from image: {error}")
     
-    def _process_clipboard_image_ocr(self) -> None:
-        """클립보드 이미지 자동 OCR 처리"""
+    def _process_clipboard_image_ocr(self, image: Optional[Any] = None) -> None:
+        """클립보드 이미지 자동 OCR 처리 (이미 가져온 이미지가 있으면 재사용)"""
         log_user_action("Auto OCR from clipboard image")
         logging.info("=== 클립보드 이미지 자동 OCR 처리 시작 ===")
         
@@ -949,8 +1027,8 @@ class TextCleanerApp:
         # 별도 스레드에서 OCR 처리
         def ocr_processing():
             try:
-                # 클립보드 이미지에서 텍스트 추출
-                extracted_text = self.ocr_processor.process_clipboard_image()
+                # 클립보드 이미지에서 텍스트 추출 (이미지는 한 번만 가져옴)
+                extracted_text = self.ocr_processor.process_clipboard_image(image)
                 
                 if extracted_text.strip():
                     logging.info(f"OCR 추출 성공: {len(extracted_text)} 문자")
@@ -968,20 +1046,17 @@ class TextCleanerApp:
                 self.root.after(0, lambda: self._handle_ocr_error(error_msg))
         
         # 백그라운드 스레드에서 실행
-        ocr_thread = threading.Thread(target=ocr_processing, daemon=self.THREAD_DAEMON)
+        ocr_thread = threading.Thread(target=ocr_processing, name="ocr-clipboard",
+                                      daemon=self.THREAD_DAEMON)
         ocr_thread.start()
     
     def _update_clipboard_ocr_result(self, extracted_text: str) -> None:
         """클립보드 OCR 결과를 입력 텍스트에 업데이트"""
         try:
-            # 입력 텍스트 영역에 추출된 텍스트 삽입
+            # 입력 텍스트 영역에 추출된 텍스트 삽입 (문서 모델은 <<Modified>>로 갱신)
             self.list_text.delete(1.0, tk.END)
             self.list_text.insert(1.0, extracted_text)
             
-            # 숨겨진 입력 텍스트에도 동일하게 삽입
-            self.input_text.delete(1.0, tk.END)
-            self.input_text.insert(1.0, extracted_text)
-            
             # 상태 업데이트
             self.status_var.set(f"이미지에서 {len(extracted_text)} 문자 추출 완료")
             
@@ -1011,7 +1086,7 @@ class TextCleanerApp:
 
     def _execute_upgrade_manager(self) -> None:
         """업그레이드 매니저 실행"""
-        project_root: Path = Path(__file__).parent.parent.parent
+        project_root: Path = resource_paths.project_root()
         batch_file: Path = project_root / "run_upgrade.bat"
         upgrade_script: Path = project_root / "upgrade_manager.py"
         
@@ -1820,6 +1895,108 @@ Clean special characters"""
             return result
         return None
 
+    def _show_diagnostics_window(self, event=None) -> str:
+        """성능 진단 창 (단계별 카운터/지연 시간)"""
+        diag_window = tk.Toplevel(self.root)
+        diag_window.title("성능 진단")
+        diag_window.geometry("720x520")
+        diag_window.transient(self.root)
+        
+        main_frame = ttk.Frame(diag_window, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        enabled_var = tk.BooleanVar(value=metrics.enabled)
+        
+        def on_toggle():
+            if enabled_var.get():
+                metrics.enable()
+            else:
+                metrics.disable()
+            log_user_action("Diagnostics", f"Metrics enabled: {metrics.enabled}")
+            refresh()
+        
+        ttk.Checkbutton(main_frame, text="계측 사용", variable=enabled_var,
+                        command=on_toggle).pack(anchor="w")
+        
+        report_text = scrolledtext.ScrolledText(main_frame, wrap=tk.NONE, font=("Consolas", 9))
+        report_text.pack(fill=tk.BOTH, expand=True, pady=10)
+        
+        def refresh():
+            report_text.config(state='normal')
+            report_text.delete(1.0, tk.END)
+            report_text.insert(1.0, self._format_metrics_report(metrics.snapshot()))
+            report_text.config(state='disabled')
+        
+        def reset():
+            metrics.reset()
+            refresh()
+        
+        def save_json():
+            try:
+                path = metrics.dump_json(get_user_data_path() / "logs")
+                log_user_action("Diagnostics", f"Metrics saved: {path}")
+                messagebox.showinfo("성능 진단", f"저장되었습니다:\n{path}", parent=diag_window)
+            except Exception as e:
+                logging.error(f"Metrics save failed: {e}")
+                messagebox.showerror("성능 진단", f"저장 실패: {e}", parent=diag_window)
+        
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill=tk.X)
+        ttk.Button(button_frame, text="새로고침", command=refresh).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="초기화", command=reset).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="JSON 저장", command=save_json).pack(side=tk.LEFT, padx=5)
+        
+        profile_button = ttk.Button(button_frame)
+        
+        def toggle_profiling():
+            self._toggle_profiling()
+            profile_button.config(text="프로파일링 중지" if is_profiling() else "프로파일링 시작")
+        
+        profile_button.config(text="프로파일링 중지" if is_profiling() else "프로파일링 시작",
+                              command=toggle_profiling)
+        profile_button.pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="닫기", command=diag_window.destroy).pack(side=tk.RIGHT, padx=5)
+        
+        diag_window.bind('<Escape>', lambda e: diag_window.destroy())
+        refresh()
+        return "break"
+
+    @staticmethod
+    def _format_metrics_report(snapshot: Dict[str, Any]) -> str:
+        """진단 창에 표시할 표 형식 문자열 생성"""
+        lines = [f"계측: {'켜짐' if snapshot['enabled'] else '꺼짐'} (시작: {snapshot['since']})", ""]
+        if not snapshot['enabled'] and not snapshot['histograms']:
+            lines.append("계측을 켜면 이후 작업부터 수집됩니다.")
+            lines.append("(시작 시 켜려면 TEXT_CLEANER_METRICS=1 환경 변수 설정)")
+            return "\n".join(lines)
+        
+        lines.append(f"{'stage':<40}{'count':>8}{'total ms':>12}{'mean':>10}{'p50':>10}{'p99':>10}{'max':>10}")
+        for name, hist in snapshot['histograms'].items():
+            lines.append(f"{name:<40}{hist['count']:>8}{hist['total_ms']:>12.1f}{hist['mean_ms']:>10.3f}"
+                         f"{hist['p50_ms']:>10.3f}{hist['p99_ms']:>10.3f}{hist['max_ms']:>10.3f}")
+        if snapshot['counters']:
+            lines.append("")
+            for name, value in snapshot['counters'].items():
+                lines.append(f"{name:<40}{value:>8}")
+        return "\n".join(lines)
+
+    def _toggle_profiling(self, event=None) -> str:
+        """샘플링 프로파일러 시작/중지 (결과는 logs 폴더에 저장)"""
+        if not is_profiling():
+            start_profiling()
+            log_user_action("Profiling", "Started")
+            self.status_var.set("프로파일링 중... (Ctrl+Shift+P로 중지)")
+            return "break"
+        
+        try:
+            path = stop_profiling(get_user_data_path() / "logs")
+            log_user_action("Profiling", f"Saved: {path}")
+            self.status_var.set(f"프로파일 저장됨: {path.name if path else '-'}")
+        except Exception as e:
+            logging.error(f"Profile save failed: {e}")
+            self.status_var.set(f"프로파일 저장 실패: {e}")
+        return "break"
+
     def _on_escape_main(self, event=None) -> None:
         """메인 창 ESC 키 이벤트"""
         logging.info("ESC key pressed in main window")
@@ -1828,6 +2005,9 @@ Clean special characters"""
     def on_closing(self) -> None:
         """프로그램 종료"""
         logging.info("Program termination requested")
+        if self._clipboard_watcher is not None:
+            self._clipboard_watcher.stop()
+        self._dump_metrics_on_exit()
         if self.processing:
             if messagebox.askokcancel("Terminate", "Processing in progress. Do you want to terminate?"):
                 logging.info("User confirmation for program termination")
@@ -1836,48 +2016,144 @@ Clean special characters"""
             logging.info("Program terminated normally")
             self.root.destroy() 
 
+    def handle_instance_request(self, request: Dict[str, Any]) -> None:
+        """다른 실행에서 넘어온 요청 처리 (Tk 스레드) - 창을 앞으로 가져오고 인자로 받은 파일을 엶"""
+        try:
+            self.root.deiconify()
+            self.root.lift()
+            self.root.focus_force()
+        except tk.TclError:
+            return
+        cwd = Path(request.get("cwd") or ".")
+        for arg in request.get("args") or []:
+            path = cwd / arg
+            if path.is_file():
+                self.open_file(path)
+                break
+
+    def open_file(self, path: Path) -> None:
+        """파일을 입력으로 열기 (이미지는 OCR, 그 외는 텍스트)"""
+        log_user_action("Open file", path.name)
+        if path.suffix.lower() in self.IMAGE_FILE_SUFFIXES:
+            if not self.ocr_processor.is_available():
+                self._show_ocr_unavailable_error()
+                return
+            self._process_ocr_file(str(path))
+            return
+        try:
+            text = path.read_text(encoding='utf-8', errors='replace')
+        except OSError as e:
+            logging.error(f"Failed to open file: {e}")
+            self.status_var.set(f"Error: {e}")
+            return
+        if len(text) > self.MAX_TEXT_LENGTH:
+            text = text[:self.MAX_TEXT_LENGTH]
+            logging.warning(f"Opened file truncated to {self.MAX_TEXT_LENGTH} characters")
+        # 문서 모델은 <<Modified>>로 갱신
+        self.list_text.delete(1.0, tk.END)
+        self.list_text.insert(1.0, text)
+        logging.info(f"Opened file: {path} ({len(text)} characters)")
+
+    def _toggle_clipboard_watch(self) -> None:
+        """클립보드 자동 정리 켜기/끄기"""
+        enabled = self.clipboard_watch_var.get()
+        log_user_action("Clipboard watch toggled", f"Enabled: {enabled}")
+        if enabled:
+            if self._clipboard_watcher is None:
+                self._clipboard_watcher = ClipboardWatcher(
+                    self.root, self._on_watched_clipboard_text, self._on_watched_clipboard_image)
+            self._clipboard_watcher.start()
+            self.status_var.set(self.text['clipboard_watch_on'])
+        else:
+            if self._clipboard_watcher is not None:
+                self._clipboard_watcher.stop()
+            # 진행 중인 작업 결과는 클립보드에 쓰지 않음
+            self._watch_generation += 1
+            self.status_var.set(self.text['clipboard_watch_off'])
+
+    def _on_watched_clipboard_text(self, text: str) -> None:
+        """감시 중 새 클립보드 텍스트 (Tk 스레드) - 정리는 작업 스레드에서"""
+        self._watch_generation += 1
+        generation = self._watch_generation
+        logging.info(f"Clipboard change detected: {len(text)} characters")
+        self.status_var.set(self.text['clipboard_watch_busy'])
+        threading.Thread(target=self._watch_clean_worker, args=(generation, text),
+                         name="clipboard-watch", daemon=self.THREAD_DAEMON).start()
+
+    def _on_watched_clipboard_image(self) -> None:
+        """감시 중 새 클립보드 이미지 (Tk 스레드) - OCR과 정리는 작업 스레드에서"""
+        self._watch_generation += 1
+        generation = self._watch_generation
+        logging.info("Clipboard image detected")
+        self.status_var.set(self.text['clipboard_watch_busy'])
+        threading.Thread(target=self._watch_clean_worker, args=(generation, None),
+                         name="clipboard-watch", daemon=self.THREAD_DAEMON).start()
+
+    def _watch_clean_worker(self, generation: int, text: Optional[str]) -> None:
+        """클립보드 내용 정리 (text가 None이면 클립보드 이미지를 OCR)"""
+        try:
+            with self._watch_lock:
+                # 대기하는 동안 클립보드가 다시 바뀌었으면 건너뜀
+                if generation != self._watch_generation:
+                    return
+                if text is None:
+                    text = self.ocr_processor.process_clipboard_image()
+                    if not text.strip():
+                        logging.warning("Clipboard watch: no text extracted from image")
+                        self.root.after(0, self.status_var.set, "이미지에서 텍스트를 추출하지 못했습니다")
+                        return
+                with metrics.timer("ui.clipboard_watch"):
+                    result_text, _ = self._run_clean_pipeline(text)
+            self.root.after(0, self._write_watch_result, generation, result_text)
+        except Exception as e:
+            logging.error(f"Clipboard watch processing error: {e}")
+            self.root.after(0, self.status_var.set, "Error occurred")
+
+    def _write_watch_result(self, generation: int, result_text: str) -> None:
+        """정리 결과를 클립보드에 다시 쓰기 (Tk 스레드)"""
+        watcher = self._clipboard_watcher
+        if watcher is None or not watcher.running or generation != self._watch_generation:
+            logging.info("Clipboard watch result discarded (clipboard changed or watch stopped)")
+            return
+        self.root.clipboard_clear()
+        self.root.clipboard_append(result_text)
+        watcher.note_own_write(result_text)
+        self.status_var.set(format_ui_text('clipboard_watch_done', count=len(result_text)))
+        log_user_action("Clipboard auto-clean", f"Result: {len(result_text)} characters")
+
+    def _dump_metrics_on_exit(self) -> None:
+        """계측/프로파일링이 켜져 있으면 종료 시 로그 폴더에 저장"""
+        log_dir = get_user_data_path() / "logs"
+        if is_profiling():
+            try:
+                stop_profiling(log_dir)
+            except Exception as e:
+                logging.warning(f"Profile save failed: {e}")
+        if not metrics.enabled:
+            return
+        try:
+            path = metrics.dump_json(log_dir)
+            logging.info(f"Metrics saved: {path}")
+        except Exception as e:
+            logging.warning(f"Metrics save failed: {e}")
+
     def _convert_excel_to_list(self, text):
         """엑셀 데이터를 리스트로 변환 (리스트 형식 처리)"""
-        lines = []
-        
-        for row in text.splitlines():
-            if not row.strip():
-                continue
-                
-            # 셀 분리 (탭/쉼표)
-            if '\t' in row:
-                cells = row.split('\t')
-            else:
-                cells = row.split(',')
-            
-            # 셀들을 함께 처리
-            processed_cells = []
-            for cell in cells:
-                cell = cell.strip()
-                if not cell:
-                    continue
-                processed_cells.append(cell)
-            
-            if processed_cells:
-                # 셀을 ' | '로 합치기
-                line = ' | '.join(processed_cells)
-                lines.append(line)
-        
-        # 자동 번호 매기기
-        numbered = [f"{i+1}. {line}" for i, line in enumerate(lines)]
-        result = '\n'.join(numbered)
+        # 빈 셀을 제외하고 ' | '로 합친 뒤 자동 번호 매기기
+        result = tabular_paste.convert_to_numbered_list(text)
             
-        self.input_text.delete(1.0, tk.END)
-        self.input_text.insert(tk.END, result)
+        self.list_text.delete(1.0, tk.END)
+        self.list_text.insert(tk.END, result)
 
     def _on_paste(self, event=None):
         try:
             pasted = self.root.clipboard_get()
         except Exception:
             return
-        if '\t' in pasted or ',' in pasted:
+        dialect = tabular_paste.sniff_dialect(pasted)
+        if dialect is not None:
             # 리스트 형식으로 변환
-            converted_data = self._convert_excel_to_list_format(pasted)
+            converted_data = tabular_paste.convert_to_list_format(pasted, dialect)
             self.list_text.delete(1.0, tk.END)
             self.list_text.insert(1.0, converted_data)
             return "break"
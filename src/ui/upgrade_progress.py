@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+업그레이드 진행 창
+작업 스레드에서 실행되는 업그레이드의 진행 이벤트를 큐로 받아 진행률, 단계, 최근 출력을 표시합니다.
+"""
+
+import logging
+import queue
+import threading
+import tkinter as tk
+from tkinter import ttk
+from typing import Any, Callable, Dict, Optional
+
+# 한 번의 폴링에서 처리할 최대 이벤트 수 (출력이 몰려도 UI가 멈추지 않도록)
+MAX_EVENTS_PER_POLL = 200
+
+
+class UpgradeProgressWindow:
+    """진행 이벤트 큐를 폴링해 표시하는 창
+
+    put()은 어느 스레드에서나 호출할 수 있고, 화면 갱신은 Tk 스레드의 after 루프에서만 합니다.
+    """
+
+    POLL_INTERVAL_MS: int = 100
+    LOG_LINES: int = 8
+
+    def __init__(self, root: tk.Tk, title: str = "업그레이드"):
+        self.root = root
+        self.events: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self.root.title(title)
+        self.root.resizable(False, False)
+
+        frame = ttk.Frame(root, padding="15")
+        frame.grid(row=0, column=0, sticky="nsew")
+        self.phase_var = tk.StringVar(value="준비 중...")
+        ttk.Label(frame, textvariable=self.phase_var, width=60).grid(row=0, column=0, sticky="w")
+        self.progress = ttk.Progressbar(frame, length=460, maximum=100, mode="determinate")
+        self.progress.grid(row=1, column=0, pady=(8, 8), sticky="ew")
+        self.log_text = tk.Text(frame, height=self.LOG_LINES, width=70, state=tk.DISABLED,
+                                font=("Consolas", 8), wrap=tk.NONE)
+        self.log_text.grid(row=2, column=0, sticky="nsew")
+        self._poll()
+
+    def put(self, event: Dict[str, Any]) -> None:
+        """진행 이벤트 추가 (UpgradeManager.progress_callback으로 사용)"""
+        self.events.put(event)
+
+    def _poll(self) -> None:
+        last: Optional[Dict[str, Any]] = None
+        lines = []
+        for _ in range(MAX_EVENTS_PER_POLL):
+            try:
+                event = self.events.get_nowait()
+            except queue.Empty:
+                break
+            if "done" in event:
+                # 작업 종료 - mainloop를 끝내 호출한 쪽으로 돌아감
+                self.root.destroy()
+                return
+            last = event
+            if event.get("line"):
+                lines.append(event["line"])
+
+        if last is not None:
+            self.progress["value"] = last.get("percent", 0)
+            phase = last.get("phase", "")
+            self.phase_var.set(f"{phase} ({last.get('percent', 0):.0f}%)")
+        if lines:
+            self._append_lines(lines)
+        self.root.after(self.POLL_INTERVAL_MS, self._poll)
+
+    def _append_lines(self, lines: list) -> None:
+        """최근 출력만 남기기"""
+        self.log_text.config(state=tk.NORMAL)
+        self.log_text.insert(tk.END, "\n".join(lines[-self.LOG_LINES:]) + "\n")
+        excess = int(self.log_text.index("end-1c").split(".")[0]) - self.LOG_LINES - 1
+        if excess > 0:
+            self.log_text.delete("1.0", f"{excess + 1}.0")
+        self.log_text.see(tk.END)
+        self.log_text.config(state=tk.DISABLED)
+
+
+def run_with_progress_window(task: Callable[[Callable[[Dict[str, Any]], None]], Any],
+                             title: str = "업그레이드") -> Any:
+    """task(progress_callback)를 작업 스레드에서 실행하며 진행 창을 표시하고 결과 반환
+
+    Tk를 사용할 수 없으면 창 없이 현재 스레드에서 실행합니다.
+    """
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        logging.warning("진행 창을 열 수 없어 창 없이 실행: %s", e)
+        return task(lambda event: None)
+
+    window = UpgradeProgressWindow(root, title)
+    result: Dict[str, Any] = {}
+
+    def worker() -> None:
+        try:
+            result["value"] = task(window.put)
+        except Exception as e:
+            logging.error("업그레이드 작업 실패: %s", e)
+            result["value"] = False
+        finally:
+            window.put({"done": result.get("value")})
+
+    thread = threading.Thread(target=worker, name="upgrade-worker", daemon=True)
+    thread.start()
+    # 진행 중에는 창을 닫지 않음 (빌드를 중간에 끊지 않도록)
+    root.protocol("WM_DELETE_WINDOW", lambda: None)
+    root.mainloop()
+    thread.join()
+    return result.get("value")
@@ -0,0 +1,481 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+가상화 텍스트 뷰
+큰 문서를 줄 저장소에 보관하고 화면에 보이는 줄만 Text 위젯에 그려 편집합니다.
+"""
+
+import bisect
+import re
+import tkinter as tk
+import tkinter.font as tkfont
+from tkinter import ttk
+from typing import Any, List, Optional, Tuple
+
+
+class LineStore:
+    """블록 단위 줄 저장소
+
+    줄을 BLOCK_SIZE개씩 블록으로 나눠 보관하고 블록 시작 줄 번호로 이분 탐색합니다.
+    덧붙이기는 마지막 블록만, 줄 교체(편집)는 해당 범위의 블록만 다시 나누므로
+    문서 크기와 관계없이 바뀐 분량만큼만 비용이 듭니다 (블록 시작 번호 갱신은 블록 수에 비례).
+    Tk Text처럼 빈 문서도 빈 줄 하나로 취급합니다.
+    """
+
+    BLOCK_SIZE: int = 1024
+
+    def __init__(self, text: str = ""):
+        self._blocks: List[List[str]] = [[""]]
+        self._starts: List[int] = [0]
+        self._line_count = 1
+        self._char_count = 0
+        if text:
+            self.append(text)
+
+    @property
+    def line_count(self) -> int:
+        return self._line_count
+
+    @property
+    def char_count(self) -> int:
+        """줄바꿈을 포함한 문자 수"""
+        return self._char_count
+
+    def clear(self) -> None:
+        self._blocks = [[""]]
+        self._starts = [0]
+        self._line_count = 1
+        self._char_count = 0
+
+    def set_text(self, text: str) -> None:
+        self.clear()
+        self.append(text)
+
+    def append(self, text: str) -> None:
+        """문서 끝에 텍스트 덧붙이기 (첫 조각은 마지막 줄에 이어 붙음)"""
+        if not text:
+            return
+        parts = text.split('\n')
+        last_block = self._blocks[-1]
+        last_block[-1] += parts[0]
+        remaining = parts[1:]
+        while remaining:
+            room = self.BLOCK_SIZE - len(last_block)
+            if room <= 0:
+                last_block = []
+                self._starts.append(self._line_count)
+                self._blocks.append(last_block)
+                room = self.BLOCK_SIZE
+            last_block.extend(remaining[:room])
+            self._line_count += min(room, len(remaining))
+            remaining = remaining[room:]
+        self._char_count += len(text)
+
+    def prepend(self, text: str) -> None:
+        """문서 앞에 텍스트 삽입 (첫 블록만 다시 나눔)"""
+        self.insert_text(0, 0, text)
+
+    def line(self, index: int) -> str:
+        return self.get_lines(index, 1)[0]
+
+    def insert_text(self, line: int, column: int, text: str) -> Tuple[int, int]:
+        """line 줄 column 위치에 텍스트 삽입 후 삽입한 텍스트 끝 위치 반환"""
+        current = self.line(line)
+        parts = text.split('\n')
+        end = (line + len(parts) - 1, (column if len(parts) == 1 else 0) + len(parts[-1]))
+        parts[0] = current[:column] + parts[0]
+        parts[-1] += current[column:]
+        self.replace_lines(line, 1, parts)
+        return end
+
+    def delete_range(self, start: Tuple[int, int], end: Tuple[int, int]) -> None:
+        """start부터 end 앞까지 삭제 (위치는 (줄, 열), 줄은 0부터)"""
+        if end <= start:
+            return
+        merged = self.line(start[0])[:start[1]] + self.line(end[0])[end[1]:]
+        self.replace_lines(start[0], end[0] - start[0] + 1, [merged])
+
+    def replace_lines(self, start: int, count: int, lines: List[str]) -> None:
+        """start 줄(0부터)부터 count개의 줄을 lines로 교체 (count=0이면 삽입, lines=[]이면 삭제)"""
+        start = max(0, min(start, self._line_count))
+        count = max(0, min(count, self._line_count - start))
+        first_block = self._block_index(start)
+        last_block = self._block_index(start + count - 1) if count else first_block
+        first_offset = start - self._starts[first_block]
+        last_offset = start + count - self._starts[last_block] if count else first_offset
+
+        removed = [line for block in self._blocks[first_block:last_block + 1] for line in block]
+        removed = removed[first_offset:len(removed) - (len(self._blocks[last_block]) - last_offset)]
+        merged = (self._blocks[first_block][:first_offset] + list(lines)
+                  + self._blocks[last_block][last_offset:])
+        self._blocks[first_block:last_block + 1] = [merged[i:i + self.BLOCK_SIZE]
+                                                    for i in range(0, len(merged), self.BLOCK_SIZE)]
+
+        self._line_count += len(lines) - count
+        self._char_count += (sum(map(len, lines)) - sum(map(len, removed))) + (len(lines) - count)
+        if not self._blocks:
+            # 모든 줄을 지움
+            self.clear()
+            return
+        # 교체한 블록부터 시작 줄 번호 다시 계산
+        del self._starts[first_block:]
+        line = self._starts[-1] + len(self._blocks[first_block - 1]) if first_block else 0
+        for block in self._blocks[first_block:]:
+            self._starts.append(line)
+            line += len(block)
+
+    def _block_index(self, line: int) -> int:
+        return max(0, min(bisect.bisect_right(self._starts, line) - 1, len(self._blocks) - 1))
+
+    def get_lines(self, start: int, count: int) -> List[str]:
+        """start 줄(0부터)부터 최대 count개의 줄 반환"""
+        if count <= 0 or start >= self._line_count:
+            return []
+        start = max(0, start)
+        block_index = self._block_index(start)
+        offset = start - self._starts[block_index]
+        lines: List[str] = []
+        while len(lines) < count and block_index < len(self._blocks):
+            block = self._blocks[block_index]
+            lines.extend(block[offset:offset + count - len(lines)])
+            block_index += 1
+            offset = 0
+        return lines
+
+    def text(self) -> str:
+        """전체 문서 문자열"""
+        return '\n'.join(line for block in self._blocks for line in block)
+
+
+class VirtualTextView(ttk.Frame):
+    """ScrolledText 대신 쓰는 텍스트 뷰
+
+    문서가 VIRTUALIZE_THRESHOLD 줄 이하이면 일반 Text 위젯처럼 전체를 담고,
+    그보다 커지면 LineStore로 옮겨 보이는 줄(창)만 Text 위젯에 그립니다.
+    가상 모드에서도 창 안에서는 그대로 편집할 수 있으며, 스크롤하거나 내용을 읽을 때
+    바뀐 창의 줄만 저장소에 다시 끼워 넣습니다. 선택과 실행 취소는 창 안에서만 동작하고,
+    전체 선택(Ctrl+A)은 문서 전체의 복사/잘라내기/삭제로 처리합니다.
+    get/insert/delete는 가상 모드에서도 "줄.열", "줄.end", insert, end, end-1c 인덱스를
+    문서 기준으로 처리하며, 그 밖의 인덱스는 ValueError를 발생시킵니다.
+    """
+
+    VIRTUALIZE_THRESHOLD: int = 5000
+    # 가상 모드에서 지원하는 인덱스 형식 ("줄.열", "줄.end")
+    _LINE_COLUMN_INDEX = re.compile(r"(\d+)\.(\d+|end)")
+    # 화면 밖에 미리 그려 둘 여유 줄 수 (줄바꿈된 긴 줄 대비)
+    OVERSCAN_LINES: int = 5
+    # 전체 선택 상태를 유지하는 수정키 (Shift, Control 등만 누른 경우)
+    MODIFIER_KEYS = ("Shift_L", "Shift_R", "Control_L", "Control_R", "Alt_L", "Alt_R")
+
+    def __init__(self, parent: tk.Misc, **text_options: Any):
+        super().__init__(parent)
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+
+        self.text = tk.Text(self, **text_options)
+        self.text.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+
+        self.store = LineStore()
+        self._virtual = False
+        self._first_line = 0
+        # 가상 모드에서 현재 위젯에 그린 줄 (편집 여부 비교용, 아직 그리지 않았으면 None)
+        self._window_lines: Optional[List[str]] = None
+        self._select_all = False
+        self._visible_lines = int(text_options.get('height', 24))
+        self._line_height = tkfont.Font(font=self.text.cget('font')).metrics('linespace') or 16
+
+        self._use_widget_scrolling()
+        self.text.bind("<Configure>", self._on_configure, add="+")
+        self.text.bind("<Key>", self._on_key, add="+")
+        self.text.bind("<Button-1>", self._on_click, add="+")
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.text.bind(sequence, self._on_mousewheel, add="+")
+
+    @property
+    def virtual(self) -> bool:
+        """보이는 줄만 그리는 모드 여부"""
+        return self._virtual
+
+    # --- Text 호환 API -------------------------------------------------
+
+    def get(self, start: Any = "1.0", end: Any = tk.END) -> str:
+        if not self._virtual:
+            return self.text.get(start, end)
+        self._sync_window()
+        first, last = self._document_index(start), self._document_index(end)
+        if first == (0, 0) and last == self._document_end():
+            text = self.store.text()
+        elif last <= first:
+            text = ""
+        else:
+            lines = self.store.get_lines(first[0], last[0] - first[0] + 1)
+            lines[-1] = lines[-1][:last[1]]
+            lines[0] = lines[0][first[1]:]
+            text = '\n'.join(lines)
+        return text + "\n" if str(end) == tk.END else text
+
+    def delete(self, start: Any = "1.0", end: Any = None) -> None:
+        if not self._virtual:
+            self.text.delete(start, end)
+            return
+        self._sync_window()
+        first = self._document_index(start)
+        if end is None:
+            # Text.delete(index)처럼 한 글자 삭제
+            line_length = len(self.store.line(first[0]))
+            last = (first[0], first[1] + 1) if first[1] < line_length else (first[0] + 1, 0)
+            if last[0] >= self.store.line_count:
+                return
+        else:
+            last = self._document_index(end)
+        if first == (0, 0) and last >= self._document_end():
+            self._clear_document()
+            return
+        self.store.delete_range(first, last)
+        self._render(modified=True, cursor=first)
+
+    def insert(self, index: Any, text: str, *tags: Any) -> None:
+        if not self._virtual:
+            current_lines = int(self.text.index("end-1c").split(".")[0])
+            if current_lines + text.count('\n') <= self.VIRTUALIZE_THRESHOLD:
+                self.text.insert(index, text, *tags)
+                return
+            # 큰 텍스트는 위젯에 넣지 않고 바로 줄 저장소로 (위젯 인덱스는 전환 전에 계산)
+            position, cursor = self._widget_position(index), self._widget_position(tk.INSERT)
+            self._enter_virtual_mode()
+        else:
+            self._sync_window()
+            position, cursor = self._document_index(index), self._cursor_position()
+        end = self.store.insert_text(position[0], position[1], text)
+        if str(index) == tk.INSERT:
+            # 커서 위치에 삽입하면 Text처럼 커서가 삽입한 텍스트 뒤로 이동
+            self._move_cursor(end[0], end[1], modified=True)
+        else:
+            self._render(modified=True, cursor=cursor)
+
+    def _widget_position(self, index: Any) -> Tuple[int, int]:
+        """위젯 인덱스를 (문서 줄, 칸)으로 (가상 모드 전환 전, 위젯이 문서 전체일 때)"""
+        line, column = self.text.index(index).split(".")
+        return int(line) - 1, int(column)
+
+    def insert_at_cursor(self, text: str) -> None:
+        """붙여넣기처럼 선택 영역을 지우고 커서 위치에 삽입 (큰 텍스트는 줄 저장소로)"""
+        if self._select_all:
+            self._clear_document()
+        if self.text.tag_ranges(tk.SEL):
+            self.text.delete(tk.SEL_FIRST, tk.SEL_LAST)
+        self.insert(tk.INSERT, text)
+        if not self._virtual:
+            self.text.see(tk.INSERT)
+
+    def see(self, index: Any) -> None:
+        if not self._virtual:
+            self.text.see(index)
+            return
+        self._move_cursor(self.store.line_count - 1 if index == tk.END else 0, 0)
+
+    def bind(self, sequence: Optional[str] = None, func: Any = None, add: Any = None) -> Any:
+        return self.text.bind(sequence, func, add)
+
+    def edit_modified(self, arg: Optional[bool] = None) -> Any:
+        return self.text.edit_modified(arg)
+
+    def focus_set(self) -> None:
+        self.text.focus_set()
+
+    # --- 모드 전환 ------------------------------------------------------
+
+    def _document_end(self) -> Tuple[int, int]:
+        last = self.store.line_count - 1
+        return last, len(self.store.line(last))
+
+    def _document_index(self, index: Any) -> Tuple[int, int]:
+        """가상 모드 인덱스를 문서 기준 (줄, 열)로 변환 (줄은 0부터)"""
+        index = str(index)
+        if index in (tk.END, "end-1c"):
+            return self._document_end()
+        if index == tk.INSERT:
+            return self._cursor_position()
+        match = self._LINE_COLUMN_INDEX.fullmatch(index)
+        if match is None:
+            raise ValueError(f"Unsupported index in virtual mode: {index}")
+        line = max(0, min(int(match.group(1)) - 1, self.store.line_count - 1))
+        length = len(self.store.line(line))
+        column = length if match.group(2) == "end" else min(int(match.group(2)), length)
+        return line, column
+
+    def _enter_virtual_mode(self) -> None:
+        """위젯 내용을 줄 저장소로 옮기고 보이는 줄만 그리기"""
+        self.store.set_text(self.text.get("1.0", "end-1c"))
+        self._virtual = True
+        self._first_line = 0
+        self._window_lines = None
+        self.scrollbar.config(command=self._on_scrollbar)
+        self.text.config(yscrollcommand="")
+        self._render(modified=True)
+
+    def _leave_virtual_mode(self) -> None:
+        self._virtual = False
+        self._first_line = 0
+        self._window_lines = None
+        self._select_all = False
+        self.text.delete("1.0", tk.END)
+        self.text.edit_reset()
+        self._use_widget_scrolling()
+
+    def _clear_document(self) -> None:
+        self.store.clear()
+        self._leave_virtual_mode()
+        self.text.edit_modified(True)
+
+    def _use_widget_scrolling(self) -> None:
+        self.scrollbar.config(command=self.text.yview)
+        self.text.config(yscrollcommand=self.scrollbar.set)
+
+    # --- 가상 모드 렌더링 -----------------------------------------------
+
+    def _sync_window(self) -> bool:
+        """창에서 편집한 줄을 저장소에 반영 (바뀐 것이 있으면 True)"""
+        if not self._virtual or self._window_lines is None:
+            return False
+        lines = self.text.get("1.0", "end-1c").split('\n')
+        if lines == self._window_lines:
+            return False
+        self.store.replace_lines(self._first_line, len(self._window_lines), lines)
+        self._window_lines = lines
+        return True
+
+    def _cursor_position(self) -> Tuple[int, int]:
+        """문서 기준 커서 위치 (줄은 0부터)"""
+        line, column = (int(part) for part in self.text.index(tk.INSERT).split("."))
+        return self._first_line + line - 1, column
+
+    def _render(self, modified: bool = False, cursor: Optional[Tuple[int, int]] = None) -> None:
+        """현재 위치의 보이는 줄만 Text 위젯에 그리기
+
+        다시 그리기 전에 창의 편집 내용을 저장소에 반영하고, 수정 플래그는 실제 변경이
+        있을 때만 켜서 스크롤만으로 <<Modified>> 처리가 일어나지 않게 합니다.
+        """
+        if self._window_lines is not None and cursor is None:
+            cursor = self._cursor_position()
+        modified = self._sync_window() or modified or self.text.edit_modified()
+
+        total = self.store.line_count
+        self._first_line = max(0, min(self._first_line, total - self._visible_lines))
+        lines = self.store.get_lines(self._first_line, self._visible_lines + self.OVERSCAN_LINES)
+        self.text.delete("1.0", tk.END)
+        self.text.insert("1.0", '\n'.join(lines))
+        self._window_lines = lines
+        # 창이 바뀌면 이전 창 기준의 실행 취소 기록은 의미가 없음
+        self.text.edit_reset()
+        self.text.edit_modified(modified)
+
+        if cursor is not None:
+            line = max(0, min(cursor[0] - self._first_line, len(lines) - 1))
+            self.text.mark_set(tk.INSERT, f"{line + 1}.{cursor[1]}")
+        if self._select_all:
+            self.text.tag_add(tk.SEL, "1.0", tk.END)
+        first = self._first_line / total
+        last = min(1.0, (self._first_line + self._visible_lines) / total)
+        self.scrollbar.set(first, last)
+
+    def _scroll_to(self, line: int) -> None:
+        # 창 위치를 바꾸기 전에 현재 창의 편집 내용과 커서를 기존 위치 기준으로 반영
+        cursor = self._cursor_position() if self._window_lines is not None else None
+        modified = self._sync_window()
+        self._first_line = line
+        self._render(modified=modified, cursor=cursor)
+
+    def _move_cursor(self, line: int, column: int, modified: bool = False) -> None:
+        """커서를 문서의 line 줄로 옮기고 필요하면 창을 스크롤"""
+        modified = self._sync_window() or modified
+        line = max(0, min(line, self.store.line_count - 1))
+        if line < self._first_line:
+            self._first_line = line
+        elif line >= self._first_line + self._visible_lines:
+            self._first_line = line - self._visible_lines + 1
+        self._render(modified=modified, cursor=(line, column))
+        self.text.see(tk.INSERT)
+
+    def _on_scrollbar(self, action: str, *args: str) -> None:
+        if action == "moveto":
+            self._scroll_to(int(float(args[0]) * self.store.line_count))
+        elif action == "scroll":
+            amount, unit = int(args[0]), args[1]
+            step = self._visible_lines if unit == "pages" else 1
+            self._scroll_to(self._first_line + amount * step)
+
+    def _on_mousewheel(self, event: tk.Event) -> Optional[str]:
+        if not self._virtual:
+            return None
+        if getattr(event, 'num', None) == 4:
+            delta = -3
+        elif getattr(event, 'num', None) == 5:
+            delta = 3
+        else:
+            delta = -3 if event.delta > 0 else 3
+        self._scroll_to(self._first_line + delta)
+        return "break"
+
+    def _on_configure(self, event: tk.Event) -> None:
+        visible = max(1, event.height // self._line_height)
+        if visible != self._visible_lines:
+            self._visible_lines = visible
+            if self._virtual:
+                self._render()
+
+    # --- 가상 모드 편집 -------------------------------------------------
+
+    def _on_click(self, event: tk.Event) -> None:
+        self._select_all = False
+
+    def _on_key(self, event: tk.Event) -> Optional[str]:
+        """창 경계를 넘는 커서 이동과 문서 전체 선택 처리 (일반 입력은 Text 기본 동작)"""
+        if not self._virtual:
+            return None
+        control = bool(event.state & 0x0004)
+        keysym = event.keysym
+
+        if control and keysym.lower() == "a":
+            self._select_all = True
+            self.text.tag_add(tk.SEL, "1.0", tk.END)
+            return "break"
+        if self._select_all:
+            if control and keysym.lower() in ("c", "x"):
+                self.clipboard_clear()
+                self.clipboard_append(self.get("1.0", "end-1c"))
+                if keysym.lower() == "x":
+                    self._clear_document()
+                return "break"
+            if keysym in ("Delete", "BackSpace"):
+                self._clear_document()
+                return "break"
+            if keysym in self.MODIFIER_KEYS:
+                return None
+            self._select_all = False
+            if event.char and event.char.isprintable() and not control:
+                # 입력한 글자로 문서 전체를 바꿈 (글자 삽입은 Text 기본 동작)
+                self._clear_document()
+                return None
+
+        line, column = self._cursor_position()
+        window_line = line - self._first_line
+        if keysym == "Up" and window_line == 0 and self._first_line > 0:
+            self._move_cursor(line - 1, column)
+        elif keysym == "Down" and window_line == len(self._window_lines) - 1 \
+                and line < self.store.line_count - 1:
+            self._move_cursor(line + 1, column)
+        elif keysym == "Prior":
+            self._move_cursor(line - self._visible_lines, column)
+        elif keysym == "Next":
+            self._move_cursor(line + self._visible_lines, column)
+        elif control and keysym == "Home":
+            self._move_cursor(0, 0)
+        elif control and keysym == "End":
+            last = self.store.line_count - 1
+            self._move_cursor(last, len(self.store.get_lines(last, 1)[0]))
+        else:
+            return None
+        return "break"
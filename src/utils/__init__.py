@@ -3,15 +3,31 @@ Utility functions package
 공통 유틸리티 함수들
 """
 
-from .environment import setup_tcl_tk_environment, setup_tkinter_environment
+from .environment import setup_tcl_tk_environment, setup_tkinter_environment, bootstrap_environment
 from .logging_utils import setup_logging, log_user_action
 from .locale_utils import get_system_language, UI_TEXT
+from .perf_metrics import metrics, PerfMetrics
+from .sampling_profiler import SamplingProfiler, start_profiling, stop_profiling
+from .clipboard_service import ClipboardService, clipboard_service
+from .clipboard_watcher import ClipboardWatcher
+from .wait_utils import wait_until, retry_call
 
 __all__ = [
     'setup_tcl_tk_environment', 
     'setup_tkinter_environment',
+    'bootstrap_environment',
     'setup_logging', 
     'log_user_action',
     'get_system_language', 
-    'UI_TEXT'
+    'UI_TEXT',
+    'metrics',
+    'PerfMetrics',
+    'SamplingProfiler',
+    'start_profiling',
+    'stop_profiling',
+    'ClipboardService',
+    'clipboard_service',
+    'ClipboardWatcher',
+    'wait_until',
+    'retry_call'
 ] 
\ No newline at end of file
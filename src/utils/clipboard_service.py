@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+클립보드 서비스
+이미지 디코딩 없이 클립보드 형식을 먼저 확인하고, 이미지는 한 번만 가져옵니다.
+"""
+
+import logging
+import shutil
+import subprocess
+import sys
+from typing import Any, List, Optional
+
+from src.utils.lazy_import import OptionalModule
+
+Image = OptionalModule("PIL.Image")
+ImageGrab = OptionalModule("PIL.ImageGrab")
+
+# Windows 클립보드 비트맵 형식
+CF_BITMAP = 2
+CF_DIB = 8
+CF_DIBV5 = 17
+
+
+class ClipboardService:
+    """클립보드 이미지 확인/가져오기"""
+
+    # 형식 확인용 외부 도구 실행 제한 시간 (초)
+    TOOL_TIMEOUT: float = 1.0
+
+    def __init__(self):
+        self._windows_formats: Optional[List[int]] = None
+        self._linux_tool: Optional[List[str]] = None
+        self._linux_tool_checked = False
+
+    def has_image(self) -> Optional[bool]:
+        """클립보드에 이미지가 있는지 디코딩 없이 확인
+
+        True/False를 반환하고, 플랫폼에서 확인할 방법이 없으면 None을 반환합니다.
+        (None이면 호출자가 get_image()로 직접 확인)
+        """
+        try:
+            if sys.platform == 'win32':
+                return self._windows_has_image()
+            if sys.platform.startswith('linux'):
+                return self._linux_has_image()
+        except Exception as e:
+            logging.debug(f"클립보드 형식 확인 실패: {e}")
+        return None
+
+    def _windows_has_image(self) -> bool:
+        """IsClipboardFormatAvailable로 비트맵/PNG 형식 확인 (클립보드를 열지 않음)"""
+        import ctypes
+
+        user32 = ctypes.windll.user32  # type: ignore[attr-defined]
+        if self._windows_formats is None:
+            formats = [CF_DIB, CF_DIBV5, CF_BITMAP]
+            png_format = user32.RegisterClipboardFormatW("PNG")
+            if png_format:
+                formats.append(png_format)
+            self._windows_formats = formats
+        return any(user32.IsClipboardFormatAvailable(fmt) for fmt in self._windows_formats)
+
+    def _linux_has_image(self) -> Optional[bool]:
+        """wl-paste/xclip으로 클립보드 형식 목록만 조회"""
+        if not self._linux_tool_checked:
+            if shutil.which("wl-paste"):
+                self._linux_tool = ["wl-paste", "--list-types"]
+            elif shutil.which("xclip"):
+                self._linux_tool = ["xclip", "-selection", "clipboard", "-t", "TARGETS", "-o"]
+            self._linux_tool_checked = True
+        if self._linux_tool is None:
+            return None
+
+        completed = subprocess.run(self._linux_tool, capture_output=True, text=True,
+                                   timeout=self.TOOL_TIMEOUT)
+        if completed.returncode != 0:
+            return False
+        return any(line.strip().startswith("image/") for line in completed.stdout.splitlines())
+
+    def get_image(self) -> Optional[Any]:
+        """클립보드 이미지를 한 번 가져와 디코딩 (이미지가 아니면 None)"""
+        if not Image.available or not ImageGrab.available:
+            return None
+        try:
+            image = ImageGrab.grabclipboard()
+            if isinstance(image, Image.Image):
+                return image
+            return None
+        except Exception as e:
+            logging.error(f"클립보드 이미지 가져오기 실패: {e}")
+            return None
+
+
+# 애플리케이션 공용 인스턴스
+clipboard_service = ClipboardService()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+클립보드 감시기
+클립보드 변경을 가볍게 감지해 새 텍스트/이미지가 들어왔을 때 콜백을 호출합니다.
+"""
+
+import hashlib
+import logging
+import sys
+import tkinter as tk
+from typing import Callable, Optional
+
+from src.utils.clipboard_service import ClipboardService, clipboard_service
+
+
+def _digest(text: str) -> bytes:
+    """클립보드 텍스트 해시 (내용 전체를 보관하지 않고 비교)"""
+    return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+
+class ClipboardWatcher:
+    """Tk after 루프로 클립보드 변경을 감시
+
+    Windows에서는 GetClipboardSequenceNumber만 확인하고 번호가 바뀌었을 때만 내용을 읽습니다.
+    그 외 플랫폼에서는 텍스트 해시를 비교하고, 텍스트가 사라진 순간에만 이미지 형식을 확인합니다.
+    Tk 클립보드는 Tk 스레드에서만 접근할 수 있으므로 확인은 Tk 스레드에서 하고,
+    실제 정리/OCR은 콜백을 받은 쪽에서 작업 스레드로 넘깁니다.
+    """
+
+    # 클립보드 확인 주기 (ms)
+    POLL_INTERVAL_MS: int = 400
+
+    def __init__(self, root: tk.Misc,
+                 on_text: Callable[[str], None],
+                 on_image: Callable[[], None],
+                 service: Optional[ClipboardService] = None,
+                 interval_ms: Optional[int] = None):
+        self.root = root
+        self.on_text = on_text
+        self.on_image = on_image
+        self.service = service or clipboard_service
+        self.interval_ms = interval_ms or self.POLL_INTERVAL_MS
+        self._after_id: Optional[str] = None
+        self._last_sequence: Optional[int] = None
+        self._last_digest: Optional[bytes] = None
+        self._had_text = False
+        self._get_sequence = self._load_sequence_function()
+
+    @staticmethod
+    def _load_sequence_function() -> Optional[Callable[[], int]]:
+        """Windows 클립보드 순번 함수 (다른 플랫폼은 None)"""
+        if sys.platform != 'win32':
+            return None
+        try:
+            import ctypes
+            return ctypes.windll.user32.GetClipboardSequenceNumber  # type: ignore[attr-defined]
+        except Exception as e:
+            logging.debug(f"GetClipboardSequenceNumber unavailable: {e}")
+            return None
+
+    @property
+    def running(self) -> bool:
+        return self._after_id is not None
+
+    def start(self) -> None:
+        """감시 시작 (현재 클립보드 내용은 처리하지 않고 기준으로만 기록)"""
+        if self.running:
+            return
+        self._remember_current()
+        self._after_id = self.root.after(self.interval_ms, self._poll)
+        logging.info("Clipboard watcher started (%s)",
+                     "sequence number" if self._get_sequence else "text hash")
+
+    def stop(self) -> None:
+        """감시 중지"""
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+            logging.info("Clipboard watcher stopped")
+
+    def note_own_write(self, text: str) -> None:
+        """앱이 클립보드에 쓴 내용을 기준으로 기록 (자기 결과를 다시 처리하지 않도록)"""
+        self._last_digest = _digest(text)
+        self._had_text = True
+        if self._get_sequence is not None:
+            self._last_sequence = self._get_sequence()
+
+    def _remember_current(self) -> None:
+        """현재 클립보드 상태를 기준으로 기록"""
+        if self._get_sequence is not None:
+            self._last_sequence = self._get_sequence()
+        text = self._read_text()
+        self._last_digest = _digest(text) if text is not None else None
+        self._had_text = text is not None
+
+    def _read_text(self) -> Optional[str]:
+        """클립보드 텍스트 (없거나 텍스트가 아니면 None)"""
+        try:
+            return self.root.clipboard_get()
+        except tk.TclError:
+            return None
+
+    def _poll(self) -> None:
+        """주기적 확인 (Tk 스레드)"""
+        try:
+            self._check()
+        except Exception as e:
+            logging.warning(f"Clipboard watch error: {e}")
+        finally:
+            if self._after_id is not None:
+                self._after_id = self.root.after(self.interval_ms, self._poll)
+
+    def _check(self) -> None:
+        """변경이 있을 때만 콜백 호출"""
+        if self._get_sequence is not None:
+            sequence = self._get_sequence()
+            if sequence == self._last_sequence:
+                return
+            self._last_sequence = sequence
+
+        text = self._read_text()
+        if text is not None:
+            digest = _digest(text)
+            if digest == self._last_digest:
+                return
+            self._last_digest = digest
+            self._had_text = True
+            if text.strip():
+                self.on_text(text)
+            return
+
+        # 텍스트가 없는 상태: 순번이 바뀌었거나 텍스트가 막 사라졌을 때만 이미지 형식 확인
+        if self._get_sequence is None and not self._had_text:
+            return
+        self._had_text = False
+        self._last_digest = None
+        if self.service.has_image():
+            self.on_image()
@@ -5,68 +5,89 @@
 Tcl/Tk 및 tkinter 환경 설정을 담당합니다.
 """
 
+import json
 import logging
 import os
 import sys
 from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# 환경 캐시 형식이 바뀌면 올려서 기존 캐시를 무효화
+ENVIRONMENT_CACHE_VERSION = 1
+ENVIRONMENT_CACHE_FILE = "environment.json"
+
+# 프로세스당 한 번만 부트스트랩
+_bootstrap_result: Optional[Dict[str, Any]] = None
+
+
+def find_tcl_tk_paths() -> Dict[str, Optional[str]]:
+    """Tcl/Tk 라이브러리 경로 탐색 (디렉터리 glob)"""
+    if hasattr(sys, 'frozen'):
+        # PyInstaller로 빌드된 환경
+        tcl_path = Path(getattr(sys, '_MEIPASS', '')) / "tcl"
+    else:
+        # 일반 Python 환경
+        tcl_path = Path(sys.base_prefix) / "tcl"
+
+    paths: Dict[str, Optional[str]] = {"TCL_LIBRARY": None, "TK_LIBRARY": None}
+    if not tcl_path.exists():
+        return paths
+
+    # Tcl 라이브러리 찾기
+    for init_tcl in tcl_path.glob("tcl*/init.tcl"):
+        paths["TCL_LIBRARY"] = str(init_tcl.parent)
+        break
+
+    # Tk 라이브러리 찾기
+    for pkg_index in tcl_path.glob("tk*/pkgIndex.tcl"):
+        paths["TK_LIBRARY"] = str(pkg_index.parent)
+        break
+
+    return paths
+
+
+def find_tkinter_search_paths() -> List[str]:
+    """tkinter 관련 Python 설치 경로 중 존재하는 것 반환"""
+    python_dir = os.path.dirname(sys.executable)
+    python_paths = [
+        sys.prefix,
+        sys.base_prefix,
+        python_dir,
+        os.path.join(python_dir, 'Lib', 'site-packages'),
+        os.path.join(python_dir, 'DLLs'),
+        os.path.join(python_dir, 'tcl'),
+        os.path.join(python_dir, 'tk'),
+    ]
+    existing: List[str] = []
+    for path in python_paths:
+        if path not in existing and os.path.exists(path):
+            existing.append(path)
+    return existing
+
+
+def _apply_tcl_tk_paths(paths: Dict[str, Optional[str]]) -> None:
+    """TCL_LIBRARY / TK_LIBRARY 환경 변수 설정"""
+    for name, value in paths.items():
+        if value:
+            os.environ[name] = value
+            logging.info(f"{name} set: {value}")
+
+
+def _apply_search_paths(search_paths: List[str]) -> None:
+    """PATH / PYTHONPATH 앞쪽에 경로 추가 (이미 있으면 건너뜀)"""
+    for variable in ('PATH', 'PYTHONPATH'):
+        current = os.environ.get(variable, '')
+        for path in search_paths:
+            if path not in current:
+                current = path + os.pathsep + current
+                os.environ[variable] = current
+                logging.info(f"{variable}에 추가됨: {path}")
 
 
 def setup_tcl_tk_environment():
     """Tcl/Tk 라이브러리 환경 설정"""
     try:
-        if hasattr(sys, 'frozen'):
-            # PyInstaller로 빌드된 환경
-            base_path = Path(getattr(sys, '_MEIPASS', ''))
-            tcl_path = base_path / "tcl"
-            
-            if tcl_path.exists():
-                # Tcl/Tk 라이브러리 경로 설정
-                tcl_lib_path = None
-                tk_lib_path = None
-                
-                # Tcl 라이브러리 찾기
-                for tcl_dir in tcl_path.glob("tcl*"):
-                    init_tcl = tcl_dir / "init.tcl"
-                    if init_tcl.exists():
-                        tcl_lib_path = str(tcl_dir)
-                        break
-                
-                # Tk 라이브러리 찾기
-                for tk_dir in tcl_path.glob("tk*"):
-                    pkg_index = tk_dir / "pkgIndex.tcl"
-                    if pkg_index.exists():
-                        tk_lib_path = str(tk_dir)
-                        break
-                
-                # 환경 변수 설정
-                if tcl_lib_path:
-                    os.environ["TCL_LIBRARY"] = tcl_lib_path
-                    logging.info(f"TCL_LIBRARY set: {tcl_lib_path}")
-                
-                if tk_lib_path:
-                    os.environ["TK_LIBRARY"] = tk_lib_path
-                    logging.info(f"TK_LIBRARY set: {tk_lib_path}")
-                    
-        else:
-            # 일반 Python 환경
-            base_prefix = Path(sys.base_prefix)
-            tcl_path = base_prefix / "tcl"
-            
-            if tcl_path.exists():
-                # Tcl 라이브러리 찾기
-                tcl_patterns = list(tcl_path.glob("tcl*/init.tcl"))
-                if tcl_patterns:
-                    tcl_lib_path = str(tcl_patterns[0].parent)
-                    os.environ["TCL_LIBRARY"] = tcl_lib_path
-                    logging.info(f"TCL_LIBRARY set: {tcl_lib_path}")
-                
-                # Tk 라이브러리 찾기
-                tk_patterns = list(tcl_path.glob("tk*/pkgIndex.tcl"))
-                if tk_patterns:
-                    tk_lib_path = str(tk_patterns[0].parent)
-                    os.environ["TK_LIBRARY"] = tk_lib_path
-                    logging.info(f"TK_LIBRARY set: {tk_lib_path}")
-                    
+        _apply_tcl_tk_paths(find_tcl_tk_paths())
     except Exception as e:
         logging.warning(f"Tcl/Tk environment setup failed: {e}")
 
@@ -74,32 +95,128 @@ def setup_tcl_tk_environment():
 def setup_tkinter_environment():
     """tkinter 모듈 환경 설정"""
     try:
-        # Python 설치 경로에서 tkinter 찾기
-        python_paths = [
-            sys.prefix,
-            sys.base_prefix,
-            os.path.dirname(sys.executable),
-            os.path.join(os.path.dirname(sys.executable), 'Lib', 'site-packages'),
-            os.path.join(os.path.dirname(sys.executable), 'DLLs'),
-            os.path.join(os.path.dirname(sys.executable), 'tcl'),
-            os.path.join(os.path.dirname(sys.executable), 'tk'),
-        ]
-        
-        # 환경 변수에 Python 경로 추가
-        current_path = os.environ.get('PATH', '')
-        for path in python_paths:
-            if os.path.exists(path) and path not in current_path:
-                os.environ['PATH'] = path + os.pathsep + current_path
-                logging.info(f"PATH에 추가됨: {path}")
-        
-        # PYTHONPATH 설정
-        python_path = os.environ.get('PYTHONPATH', '')
-        for path in python_paths:
-            if os.path.exists(path) and path not in python_path:
-                os.environ['PYTHONPATH'] = path + os.pathsep + python_path
-                logging.info(f"PYTHONPATH에 추가됨: {path}")
-        
+        _apply_search_paths(find_tkinter_search_paths())
         return True
     except Exception as e:
         logging.error(f"tkinter 환경 설정 실패: {e}")
-        return False 
\ No newline at end of file
+        return False
+
+
+def _environment_cache_key() -> Dict[str, str]:
+    """캐시 유효성 키 (실행 파일 경로, Python/앱 버전)"""
+    from src import __version__
+
+    return {
+        "cache_version": str(ENVIRONMENT_CACHE_VERSION),
+        "executable": sys.executable,
+        "python": sys.version,
+        "app_version": __version__,
+        "frozen_base": str(getattr(sys, '_MEIPASS', '')),
+    }
+
+
+def _load_environment_cache(cache_file: Path, key: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    """키가 일치하고 경로가 아직 존재하는 캐시만 반환"""
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(cached, dict) or cached.get("key") != key:
+        return None
+    tcl_tk = cached.get("tcl_tk", {})
+    search_paths = cached.get("search_paths", [])
+    if not isinstance(tcl_tk, dict) or not isinstance(search_paths, list):
+        return None
+    # 설치 폴더가 옮겨진 경우를 대비해 캐시된 Tcl/Tk 경로만 가볍게 확인
+    if any(value and not os.path.isdir(value) for value in tcl_tk.values()):
+        return None
+    return cached
+
+
+def _save_environment_cache(cache_file: Path, data: Dict[str, Any]) -> None:
+    """캐시 파일 저장 (임시 파일에 쓴 뒤 교체)"""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = cache_file.with_suffix('.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(temp_file, cache_file)
+    except OSError as e:
+        logging.warning(f"Environment cache save failed: {e}")
+
+
+def bootstrap_environment(cache_dir: Optional[Path] = None) -> Dict[str, Any]:
+    """Tcl/Tk + tkinter 환경을 한 번만 설정
+
+    탐색 결과는 user_data/cache/environment.json에 실행 파일 경로와 버전을 키로 저장하고,
+    이후 실행에서는 디렉터리 탐색 없이 캐시된 값을 적용합니다.
+    """
+    global _bootstrap_result
+    if _bootstrap_result is not None:
+        return _bootstrap_result
+
+    if cache_dir is None:
+        from .logging_utils import get_user_data_path
+        cache_dir = get_user_data_path() / "cache"
+    cache_file = cache_dir / ENVIRONMENT_CACHE_FILE
+
+    try:
+        key = _environment_cache_key()
+        cached = _load_environment_cache(cache_file, key)
+        if cached is not None:
+            result = {"tcl_tk": cached["tcl_tk"], "search_paths": cached["search_paths"], "cached": True}
+        else:
+            result = {"tcl_tk": find_tcl_tk_paths(), "search_paths": find_tkinter_search_paths(), "cached": False}
+            _save_environment_cache(cache_file, {
+                "key": key,
+                "tcl_tk": result["tcl_tk"],
+                "search_paths": result["search_paths"],
+            })
+
+        _apply_tcl_tk_paths(result["tcl_tk"])
+        _apply_search_paths(result["search_paths"])
+    except Exception as e:
+        # 캐시 처리에 실패해도 기존 방식으로 설정
+        logging.warning(f"Environment bootstrap failed, falling back to full setup: {e}")
+        setup_tcl_tk_environment()
+        setup_tkinter_environment()
+        result = {"tcl_tk": {}, "search_paths": [], "cached": False}
+
+    _bootstrap_result = result
+    return result
+
+
+def ensure_tkinter_available() -> None:
+    """tkinter 임포트 확인 (없으면 설치 안내 후 종료)"""
+    try:
+        import tkinter  # noqa: F401
+        logging.info("tkinter 모듈 로드 성공")
+        return
+    except ImportError:
+        pass
+
+    # 추가 시도: 직접 경로에서 import
+    tkinter_path = os.path.join(os.path.dirname(sys.executable), 'Lib', 'tkinter')
+    if os.path.exists(tkinter_path):
+        sys.path.insert(0, tkinter_path)
+        try:
+            import tkinter  # noqa: F401
+            logging.info("tkinter 모듈 직접 경로에서 로드 성공")
+            return
+        except ImportError:
+            pass
+
+    print("""[오류] Python에 tkinter 모듈이 설치되어 있지 않습니다.
+This program requires the tkinter module for GUI.
+
+설치 방법(Windows):
+    py -m pip install tk
+    또는
+    py -m pip install tkinter
+
+설치 후 프로그램을 다시 실행해 주세요.
+Please install tkinter and restart the program.
+""")
+    sys.exit(1)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+지연 임포트 유틸리티
+무거운 선택 의존성(OpenCV, NumPy, PIL, pytesseract 등)을 처음 사용할 때 임포트합니다.
+"""
+
+import importlib
+import logging
+import threading
+from types import ModuleType
+from typing import Any, Optional
+
+
+class OptionalModule:
+    """처음 접근할 때 임포트되는 선택 의존성 모듈
+
+    속성 접근은 실제 모듈로 위임됩니다. 모듈이 설치되어 있지 않으면
+    available이 False가 되고, 경고는 처음 확인할 때 한 번만 기록됩니다.
+    """
+
+    def __init__(self, module_name: str, missing_message: Optional[str] = None):
+        self._module_name = module_name
+        self._missing_message = missing_message
+        self._module: Optional[ModuleType] = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def load(self) -> Optional[ModuleType]:
+        """모듈 임포트 (결과는 캐시되며 실패하면 None)"""
+        if self._loaded:
+            return self._module
+        with self._lock:
+            if not self._loaded:
+                try:
+                    self._module = importlib.import_module(self._module_name)
+                except ImportError:
+                    self._module = None
+                    if self._missing_message:
+                        logging.warning(self._missing_message)
+                self._loaded = True
+        return self._module
+
+    @property
+    def available(self) -> bool:
+        """모듈 사용 가능 여부 (필요하면 이 시점에 임포트)"""
+        return self.load() is not None
+
+    @property
+    def loaded(self) -> bool:
+        """이미 임포트를 시도했는지 여부 (임포트를 일으키지 않음)"""
+        return self._loaded
+
+    def __getattr__(self, name: str) -> Any:
+        module = self.load()
+        if module is None:
+            raise AttributeError(f"optional module '{self._module_name}' is not installed (accessing '{name}')")
+        return getattr(module, name)
+
+    def __repr__(self) -> str:
+        state = "not loaded" if not self._loaded else ("loaded" if self._module else "missing")
+        return f"<OptionalModule {self._module_name} ({state})>"
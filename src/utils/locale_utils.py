@@ -39,6 +39,15 @@ UI_TEXT: Dict[str, Dict[str, str]] = {
         'warning': '경고',
         'success': '성공',
         'close': '닫기',
+        'clipboard_watch': '클립보드 자동 정리',
+        'clipboard_watch_on': '클립보드 자동 정리 켜짐 - 복사한 텍스트/이미지를 정리해 다시 클립보드에 넣습니다.',
+        'clipboard_watch_off': '클립보드 자동 정리 꺼짐',
+        'clipboard_watch_busy': '클립보드 내용 자동 정리 중...',
+        'clipboard_watch_done': '클립보드 자동 정리 완료 ({count} 문자)',
+        'paste_converting': '변환 중…',
+        'paste_inserting': '변환 중… ({done}/{total} 줄)',
+        'paste_converted': '붙여넣기 변환 완료 ({count} 줄)',
+        'paste_cancelled': '변환 중 입력이 바뀌어 붙여넣기를 취소했습니다',
     },
     'en': {
         'title': 'Text Cleaner v2.0',
@@ -68,6 +77,15 @@ UI_TEXT: Dict[str, Dict[str, str]] = {
         'warning': 'Warning',
         'success': 'Success',
         'close': 'Close',
+        'clipboard_watch': 'Auto-clean clipboard',
+        'clipboard_watch_on': 'Clipboard auto-clean on - copied text/images are cleaned and put back on the clipboard.',
+        'clipboard_watch_off': 'Clipboard auto-clean off',
+        'clipboard_watch_busy': 'Auto-cleaning clipboard content...',
+        'clipboard_watch_done': 'Clipboard auto-clean completed ({count} characters)',
+        'paste_converting': 'Converting…',
+        'paste_inserting': 'Converting… ({done}/{total} lines)',
+        'paste_converted': 'Paste converted ({count} lines)',
+        'paste_cancelled': 'Paste cancelled - the input changed while converting',
     }
 }
 
@@ -7,16 +7,15 @@
 
 import datetime
 import logging
-import sys
 from pathlib import Path
 from typing import Optional
 
+from . import resource_paths
+
 
 def get_user_data_path() -> Path:
     """사용자 데이터 폴더 경로 반환"""
-    if hasattr(sys, 'frozen'):
-        return Path.home() / "AppData" / "Local" / "text_cleaner"
-    return Path(__file__).parent.parent.parent
+    return resource_paths.user_data_dir()
 
 
 def setup_logging() -> logging.Logger:
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+성능 계측 유틸리티
+처리 단계별 카운터와 지연 시간 히스토그램을 수집합니다.
+비활성화 상태에서는 플래그 확인만 하므로 비용이 거의 없습니다.
+"""
+
+import bisect
+import datetime
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+# 환경 변수로 시작 시 계측 활성화 (TEXT_CLEANER_METRICS=1)
+METRICS_ENV_VAR = "TEXT_CLEANER_METRICS"
+
+# 히스토그램 버킷 상한 (ms)
+BUCKET_BOUNDS_MS: List[float] = [
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50,
+    100, 250, 500, 1000, 2500, 5000, 10000, 30000,
+]
+
+
+class Histogram:
+    """고정 버킷 지연 시간 히스토그램"""
+
+    def __init__(self) -> None:
+        self.counts: List[int] = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count: int = 0
+        self.total_ms: float = 0.0
+        self.min_ms: float = float('inf')
+        self.max_ms: float = 0.0
+
+    def observe(self, value_ms: float) -> None:
+        """값 기록"""
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS_MS, value_ms)] += 1
+        self.count += 1
+        self.total_ms += value_ms
+        if value_ms < self.min_ms:
+            self.min_ms = value_ms
+        if value_ms > self.max_ms:
+            self.max_ms = value_ms
+
+    def percentile(self, fraction: float) -> float:
+        """버킷 상한 기준 백분위수 추정"""
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target:
+                if index < len(BUCKET_BOUNDS_MS):
+                    return min(BUCKET_BOUNDS_MS[index], self.max_ms)
+                return self.max_ms
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.count, 4) if self.count else 0.0,
+            "min_ms": round(self.min_ms, 4) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 4),
+            "p50_ms": self.percentile(0.50),
+            "p90_ms": self.percentile(0.90),
+            "p99_ms": self.percentile(0.99),
+        }
+
+
+class _NullTimer:
+    """비활성화 상태에서 사용하는 빈 타이머"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullTimer":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _StageTimer:
+    """단계 실행 시간을 측정해 히스토그램에 기록하는 타이머"""
+
+    __slots__ = ("_metrics", "_name", "_started")
+
+    def __init__(self, metrics: "PerfMetrics", name: str) -> None:
+        self._metrics = metrics
+        self._name = name
+        self._started = 0.0
+
+    def __enter__(self) -> "_StageTimer":
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._metrics.observe(self._name, time.perf_counter() - self._started)
+
+
+class _NullStageClock:
+    """비활성화 상태에서 사용하는 빈 구간 측정기"""
+
+    __slots__ = ()
+
+    def lap(self, stage: str) -> None:
+        return None
+
+    def finish(self, name: str) -> None:
+        return None
+
+
+_NULL_STAGE_CLOCK = _NullStageClock()
+
+
+class _StageClock:
+    """연속된 단계를 구간(lap)으로 나눠 기록하는 측정기
+
+    핫 패스에서 with 문을 단계마다 여는 대신 단계가 끝날 때 lap()만 호출합니다.
+    """
+
+    __slots__ = ("_metrics", "_prefix", "_started", "_last")
+
+    def __init__(self, metrics: "PerfMetrics", prefix: str) -> None:
+        self._metrics = metrics
+        self._prefix = prefix
+        self._started = self._last = time.perf_counter()
+
+    def lap(self, stage: str) -> None:
+        """직전 lap 이후 경과 시간을 stage로 기록"""
+        now = time.perf_counter()
+        self._metrics.observe(f"{self._prefix}.{stage}", now - self._last)
+        self._last = now
+
+    def finish(self, name: str) -> None:
+        """시작 이후 전체 경과 시간을 name으로 기록"""
+        self._metrics.observe(name, time.perf_counter() - self._started)
+
+
+class PerfMetrics:
+    """단계별 카운터/히스토그램 저장소"""
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled: bool = enabled
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = {}
+        self._histograms: Dict[str, Histogram] = {}
+        self._started_at = datetime.datetime.now()
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        """수집한 값 초기화"""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self._started_at = datetime.datetime.now()
+
+    def increment(self, name: str, value: int = 1) -> None:
+        """카운터 증가"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, seconds: float) -> None:
+        """지연 시간 기록 (초 단위)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram()
+            histogram.observe(seconds * 1000)
+
+    def timer(self, name: str) -> Union[_StageTimer, _NullTimer]:
+        """with 문으로 단계 시간 측정"""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _StageTimer(self, name)
+
+    def stage_clock(self, prefix: str) -> Union[_StageClock, _NullStageClock]:
+        """단계별 구간 측정기 생성 (라인 단위 핫 패스용)"""
+        if not self.enabled:
+            return _NULL_STAGE_CLOCK
+        return _StageClock(self, prefix)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 값의 사본 반환"""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "since": self._started_at.isoformat(timespec="seconds"),
+                "counters": dict(sorted(self._counters.items())),
+                "histograms": {
+                    name: histogram.to_dict()
+                    for name, histogram in sorted(self._histograms.items())
+                },
+            }
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), ensure_ascii=False, indent=2)
+
+    def dump_json(self, directory: Path, file_name: Optional[str] = None) -> Path:
+        """JSON 파일로 저장"""
+        directory.mkdir(parents=True, exist_ok=True)
+        if file_name is None:
+            file_name = f"metrics_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        path = directory / file_name
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.to_json())
+        return path
+
+
+# 애플리케이션 전역 계측 인스턴스
+metrics = PerfMetrics(enabled=os.environ.get(METRICS_ENV_VAR) == "1")
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+프로세스 등록부
+실행 중인 앱 인스턴스가 PID, 시작 시각, 역할을 사용자별 run 폴더에 기록하고,
+업그레이드 매니저는 시스템 전체를 훑는 대신 등록된 인스턴스만 찾아 종료합니다.
+"""
+
+import atexit
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from src.utils import resource_paths
+from src.utils.lazy_import import OptionalModule
+
+psutil = OptionalModule("psutil")
+
+APP_ROLE = "app"
+# 등록부가 비어 있을 때(이전 버전 실행 중 등) 이름으로 찾을 실행 파일
+APP_EXECUTABLES = ("text_cleaner.exe", "text_cleaner")
+# psutil create_time과 기록된 시작 시각의 허용 오차 (초)
+CREATE_TIME_TOLERANCE = 1.0
+
+_registered_file: Optional[Path] = None
+
+
+def get_registry_dir() -> Path:
+    """사용자별 등록부 폴더 (exe/스크립트 실행 여부와 관계없이 같은 위치)"""
+    return resource_paths.run_dir()
+
+
+def _process_create_time(pid: int) -> Optional[float]:
+    if not psutil.available:
+        return None
+    try:
+        return psutil.Process(pid).create_time()
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return None
+
+
+def register(role: str = APP_ROLE, directory: Optional[Path] = None) -> Optional[Path]:
+    """현재 프로세스를 등록 (종료 시 자동 해제) - 실패해도 앱 실행에는 영향 없음"""
+    global _registered_file
+    directory = directory or get_registry_dir()
+    pid = os.getpid()
+    record = {
+        "pid": pid,
+        "role": role,
+        "create_time": _process_create_time(pid),
+        "executable": sys.executable,
+        "registered_at": time.time(),
+    }
+    path = directory / f"{role}-{pid}.json"
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        temp_file = path.with_suffix('.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(record, f)
+        os.replace(temp_file, path)
+    except OSError as e:
+        logging.warning(f"Process registration failed: {e}")
+        return None
+
+    _registered_file = path
+    atexit.register(unregister)
+    return path
+
+
+def unregister() -> None:
+    """현재 프로세스 등록 해제"""
+    global _registered_file
+    if _registered_file is None:
+        return
+    try:
+        _registered_file.unlink()
+    except OSError:
+        pass
+    _registered_file = None
+
+
+def read_records(role: Optional[str] = None, directory: Optional[Path] = None) -> List[Dict[str, Any]]:
+    """등록 파일 목록 (읽을 수 없는 파일은 건너뜀)"""
+    directory = directory or get_registry_dir()
+    pattern = f"{role}-*.json" if role else "*.json"
+    records = []
+    for path in directory.glob(pattern):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                record = json.load(f)
+            record["_path"] = path
+            records.append(record)
+        except (OSError, ValueError):
+            continue
+    return records
+
+
+def _live_process(record: Dict[str, Any]) -> Optional[Any]:
+    """기록과 일치하는 살아 있는 프로세스 (PID 재사용은 시작 시각으로 구분)"""
+    try:
+        proc = psutil.Process(int(record["pid"]))
+        created = record.get("create_time")
+        if created is not None and abs(proc.create_time() - float(created)) > CREATE_TIME_TOLERANCE:
+            return None
+        return proc if proc.is_running() else None
+    except (psutil.NoSuchProcess, psutil.ZombieProcess, KeyError, ValueError, TypeError):
+        return None
+    except psutil.AccessDenied:
+        # 시작 시각을 확인할 수 없으면 PID만으로 판단하지 않음
+        return None
+
+
+def registered_processes(role: Optional[str] = APP_ROLE, exclude_pids: Iterable[int] = (),
+                         directory: Optional[Path] = None) -> List[Any]:
+    """등록된 살아 있는 프로세스 (psutil 필요, 죽은 프로세스의 등록 파일은 정리)"""
+    if not psutil.available:
+        return []
+    excluded = set(exclude_pids)
+    processes = []
+    for record in read_records(role, directory):
+        proc = _live_process(record)
+        if proc is None:
+            try:
+                record["_path"].unlink()
+            except OSError:
+                pass
+            continue
+        if proc.pid not in excluded:
+            processes.append(proc)
+    return processes
+
+
+def find_app_processes(exclude_pids: Optional[Iterable[int]] = None, fallback: bool = True,
+                       directory: Optional[Path] = None) -> List[Any]:
+    """종료 대상 앱 프로세스
+
+    등록된 인스턴스를 우선 사용하고, 등록부가 비어 있으면 이름만 가져오는
+    process_iter 한 번으로 앱 실행 파일(text_cleaner.exe)을 찾습니다.
+    이름에 python이 들어간 임의의 프로세스는 대상으로 삼지 않습니다.
+    """
+    if not psutil.available:
+        return []
+    excluded = set(exclude_pids) if exclude_pids is not None else {os.getpid()}
+    processes = registered_processes(APP_ROLE, excluded, directory)
+    if processes or not fallback:
+        return processes
+
+    for proc in psutil.process_iter(attrs=['pid', 'name']):
+        name = (proc.info.get('name') or '').lower()
+        if name in APP_EXECUTABLES and proc.pid not in excluded:
+            processes.append(proc)
+    return processes
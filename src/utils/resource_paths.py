@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+리소스 경로 모듈
+exe/스크립트 실행 여부에 따라 달라지는 애플리케이션 경로를 프로세스마다 한 번만 계산해 보관합니다.
+파일 존재 확인이 필요한 경로(가이드라인 파일, 아이콘)도 처음 찾은 결과를 재사용합니다.
+"""
+
+import logging
+import os
+import sys
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+GUIDELINES_FILE = "guidelines.json"
+ICON_FILE = "icon.ico"
+APP_EXECUTABLE = "text_cleaner.exe"
+
+# src/utils/resource_paths.py -> src
+_SOURCE_DIR = Path(__file__).resolve().parent.parent
+
+_lock = threading.Lock()
+# 사용자 데이터 경로별로 찾은 가이드라인 파일
+_guidelines_files: Dict[Path, Path] = {}
+
+
+def is_frozen() -> bool:
+    """PyInstaller exe로 실행 중인지 여부"""
+    return hasattr(sys, 'frozen')
+
+
+@lru_cache(maxsize=None)
+def executable_dir() -> Path:
+    """실행 파일(exe 또는 python) 폴더"""
+    return Path(sys.executable).resolve().parent
+
+
+@lru_cache(maxsize=None)
+def bundle_dir() -> Path:
+    """번들 리소스 폴더 (exe는 _MEIPASS, 스크립트는 프로젝트 루트)"""
+    if is_frozen():
+        return Path(getattr(sys, '_MEIPASS', executable_dir()))
+    return project_root()
+
+
+@lru_cache(maxsize=None)
+def project_root() -> Path:
+    """프로젝트 기본 경로 (빌드 스크립트, dist, backups가 있는 곳)"""
+    if not is_frozen():
+        return _SOURCE_DIR.parent
+
+    exe_path = Path(sys.executable).resolve()
+    if exe_path.name == APP_EXECUTABLE:
+        # dist/text_cleaner/text_cleaner.exe -> 프로젝트 루트
+        if exe_path.parent.name == "text_cleaner":
+            return exe_path.parent.parent.parent
+        return exe_path.parent
+    # upgrade_manager.exe인 경우
+    return exe_path.parent
+
+
+@lru_cache(maxsize=None)
+def installed_data_dir() -> Path:
+    """설치된 exe의 사용자 데이터 폴더 (스크립트로 실행해도 같은 위치)"""
+    if is_frozen() or os.name == 'nt':
+        return Path.home() / "AppData" / "Local" / "text_cleaner"
+    return Path.home() / ".text_cleaner"
+
+
+@lru_cache(maxsize=None)
+def user_data_dir() -> Path:
+    """사용자 데이터 폴더 (로그, 캐시, 가이드라인)"""
+    if is_frozen():
+        return installed_data_dir()
+    return project_root()
+
+
+@lru_cache(maxsize=None)
+def run_dir() -> Path:
+    """실행 중인 인스턴스 등록부 폴더
+
+    exe로 실행한 앱과 스크립트로 실행한 업그레이드 매니저가 같은 폴더를 봐야 하므로
+    실행 방식에 따라 바뀌는 user_data_dir() 대신 설치된 exe의 데이터 폴더 아래에 둡니다.
+    """
+    return installed_data_dir() / "run"
+
+
+@lru_cache(maxsize=None)
+def icon_path() -> Optional[Path]:
+    """창 아이콘 파일 (없으면 None)"""
+    for path in (project_root() / ICON_FILE, bundle_dir() / ICON_FILE):
+        if path.exists():
+            return path
+    return None
+
+
+@lru_cache(maxsize=None)
+def guidelines_backup_base() -> Path:
+    """가이드라인 백업(guidelines_backup 폴더)을 찾는 기준 경로"""
+    if is_frozen():
+        return executable_dir().parent
+    return _SOURCE_DIR / "core"
+
+
+def guidelines_candidates(user_data_path: Path) -> Tuple[Path, ...]:
+    """가이드라인 파일 후보 (우선순위 순)"""
+    if is_frozen():
+        exe_dir = executable_dir()
+        return (
+            exe_dir / GUIDELINES_FILE,  # exe와 같은 디렉토리
+            exe_dir.parent / GUIDELINES_FILE,  # 상위 디렉토리
+            user_data_path / GUIDELINES_FILE,  # 사용자 데이터 경로
+        )
+    return (
+        _SOURCE_DIR / "core" / GUIDELINES_FILE,  # 가이드라인 모듈과 같은 디렉토리
+        user_data_path / GUIDELINES_FILE,  # 사용자 데이터 경로
+    )
+
+
+def find_guidelines_file(user_data_path: Path, refresh: bool = False) -> Optional[Path]:
+    """가이드라인 파일 위치 (처음 한 번만 후보를 확인하고 이후에는 기억한 경로 반환)
+
+    refresh=True이면 기억한 경로를 버리고 다시 찾습니다 (파일이 지워진 경우 등).
+    """
+    with _lock:
+        if not refresh and user_data_path in _guidelines_files:
+            return _guidelines_files[user_data_path]
+
+    for path in guidelines_candidates(user_data_path):
+        logging.info("가이드라인 파일 확인: %s", path)
+        if path.exists():
+            remember_guidelines_file(user_data_path, path)
+            return path
+    # 찾지 못한 결과는 기억하지 않음 (기본 가이드라인을 저장하면 그 경로를 기억)
+    return None
+
+
+def remember_guidelines_file(user_data_path: Path, path: Optional[Path]) -> None:
+    """가이드라인 파일 위치 갱신 (새로 저장했으면 그 경로, 읽기에 실패했으면 None으로 잊음)"""
+    with _lock:
+        if path is None:
+            _guidelines_files.pop(user_data_path, None)
+        else:
+            _guidelines_files[user_data_path] = path
+
+
+def clear_cache() -> None:
+    """기억한 경로를 모두 버림 (업그레이드로 파일 배치가 바뀐 뒤 등)"""
+    for func in (executable_dir, bundle_dir, project_root, installed_data_dir, user_data_dir, run_dir,
+                 icon_path, guidelines_backup_base):
+        func.cache_clear()
+    with _lock:
+        _guidelines_files.clear()
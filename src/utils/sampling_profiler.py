@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+샘플링 프로파일러
+실행 중인 스레드의 호출 스택을 주기적으로 수집해 collapsed stack 파일로 저장합니다.
+개발 도구 없이 현장에서 병목 구간을 수집하기 위한 용도입니다.
+"""
+
+import collections
+import datetime
+import logging
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Counter, Dict, Iterable, List, Optional
+
+# 환경 변수로 시작 시 프로파일링 활성화 (TEXT_CLEANER_PROFILE=1)
+PROFILE_ENV_VAR = "TEXT_CLEANER_PROFILE"
+
+# 기본 샘플링 간격 (초)과 스택 최대 깊이
+DEFAULT_INTERVAL = 0.01
+MAX_STACK_DEPTH = 128
+
+# 기본 수집 대상: Tk 이벤트 루프(MainThread)와 처리/OCR/워밍업 작업 스레드
+DEFAULT_THREAD_PREFIXES = ("MainThread", "text-processing", "ocr-", "warm-up")
+
+
+class SamplingProfiler:
+    """sys._current_frames 기반 저오버헤드 샘플링 프로파일러"""
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL,
+                 thread_prefixes: Iterable[str] = DEFAULT_THREAD_PREFIXES):
+        self.interval = interval
+        self.thread_prefixes = tuple(thread_prefixes)
+        self.samples: Counter[str] = collections.Counter()
+        self.sample_count = 0
+        self.started_at: Optional[datetime.datetime] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_names: Dict[int, str] = {}
+        self._frame_labels: Dict[object, str] = {}
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """샘플링 스레드 시작"""
+        if self.running:
+            return
+        self._stop_event.clear()
+        self.started_at = datetime.datetime.now()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        logging.info(f"Sampling profiler started (interval: {self.interval * 1000:.0f}ms)")
+
+    def stop(self) -> None:
+        """샘플링 중지"""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join(timeout=2)
+        self._thread = None
+        logging.info(f"Sampling profiler stopped ({self.sample_count} samples)")
+
+    def _run(self) -> None:
+        """주기적으로 스택 수집"""
+        own_id = threading.get_ident()
+        while not self._stop_event.wait(self.interval):
+            frames = sys._current_frames()
+            # 새 스레드가 보이면 이름 테이블 갱신
+            if any(thread_id not in self._thread_names for thread_id in frames):
+                self._thread_names = {t.ident: t.name for t in threading.enumerate() if t.ident}
+            for thread_id, frame in frames.items():
+                if thread_id == own_id:
+                    continue
+                thread_name = self._thread_names.get(thread_id, f"thread-{thread_id}")
+                if not thread_name.startswith(self.thread_prefixes):
+                    continue
+                self.samples[self._collapse(thread_name, frame)] += 1
+            self.sample_count += 1
+
+    def _frame_label(self, code) -> str:
+        """코드 객체를 'func (file:line)' 형식으로 변환 (캐시)"""
+        label = self._frame_labels.get(code)
+        if label is None:
+            label = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+            label = label.replace(';', ':')
+            self._frame_labels[code] = label
+        return label
+
+    def _collapse(self, thread_name: str, frame) -> str:
+        """프레임 체인을 'thread;outer;...;inner' 문자열로 변환"""
+        stack: List[str] = []
+        while frame is not None and len(stack) < MAX_STACK_DEPTH:
+            stack.append(self._frame_label(frame.f_code))
+            frame = frame.f_back
+        stack.append(thread_name.replace(';', ':'))
+        stack.reverse()
+        return ';'.join(stack)
+
+    def top_functions(self, limit: int = 15) -> List[str]:
+        """가장 많이 샘플된 함수 (self 기준) 요약"""
+        self_counts: Counter[str] = collections.Counter()
+        for stack, count in self.samples.items():
+            self_counts[stack.rsplit(';', 1)[-1]] += count
+        total = sum(self_counts.values()) or 1
+        return [f"{count * 100 / total:5.1f}%  {label}"
+                for label, count in self_counts.most_common(limit)]
+
+    def write_collapsed(self, directory: Path) -> Path:
+        """collapsed stack 파일 저장 (flamegraph.pl, speedscope에서 사용 가능)"""
+        directory.mkdir(parents=True, exist_ok=True)
+        stamp = (self.started_at or datetime.datetime.now()).strftime('%Y%m%d_%H%M%S')
+        path = directory / f"profile_{stamp}.collapsed"
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in sorted(self.samples.items()):
+                f.write(f"{stack} {count}\n")
+        return path
+
+
+_active_profiler: Optional[SamplingProfiler] = None
+_active_lock = threading.Lock()
+
+
+def is_profiling_requested() -> bool:
+    """환경 변수로 프로파일링이 요청되었는지 확인"""
+    return os.environ.get(PROFILE_ENV_VAR) == "1"
+
+
+def is_profiling() -> bool:
+    """프로파일러 실행 여부"""
+    return _active_profiler is not None and _active_profiler.running
+
+
+def start_profiling(interval: float = DEFAULT_INTERVAL) -> None:
+    """전역 프로파일러 시작"""
+    global _active_profiler
+    with _active_lock:
+        if _active_profiler is not None and _active_profiler.running:
+            return
+        _active_profiler = SamplingProfiler(interval)
+        _active_profiler.start()
+
+
+def stop_profiling(directory: Path) -> Optional[Path]:
+    """전역 프로파일러를 중지하고 결과 파일 경로 반환"""
+    global _active_profiler
+    with _active_lock:
+        profiler, _active_profiler = _active_profiler, None
+    if profiler is None:
+        return None
+
+    profiler.stop()
+    path = profiler.write_collapsed(directory)
+    logging.info(f"Profile saved: {path}")
+    for line in profiler.top_functions():
+        logging.info(f"Profile top: {line}")
+    return path
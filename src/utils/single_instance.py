@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+단일 인스턴스 유틸리티
+사용자별 로컬 IPC 채널(Windows 명명된 파이프, 그 외 Unix 소켓)로 이미 실행 중인 앱을 찾아
+두 번째 실행의 인자를 넘기고 바로 종료합니다. tkinter 등 무거운 모듈을 임포트하지 않습니다.
+"""
+
+import hashlib
+import logging
+import os
+import secrets
+import threading
+import time
+from multiprocessing.connection import Client, Connection, Listener
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from src.utils.process_registry import get_registry_dir
+
+# 1이면 단일 인스턴스 모드를 끄고 매번 새로 실행
+MULTI_INSTANCE_ENV = "TEXT_CLEANER_MULTI_INSTANCE"
+
+AUTHKEY_FILE = "instance.key"
+SOCKET_FILE = "instance.sock"
+PROTOCOL_VERSION = 1
+AUTHKEY_SIZE = 32
+# 다른 프로세스가 막 만든 키 파일을 다시 읽을 때 기다리는 횟수와 간격 (초)
+AUTHKEY_READ_ATTEMPTS = 20
+AUTHKEY_READ_INTERVAL = 0.05
+
+InstanceHandler = Callable[[Dict[str, Any]], None]
+
+
+def is_enabled() -> bool:
+    return os.environ.get(MULTI_INSTANCE_ENV, "").strip() not in ("1", "true", "yes")
+
+
+def _address(directory: Path) -> str:
+    """사용자별 IPC 주소 (파이프 이름은 등록부 경로 해시로 사용자마다 다르게)"""
+    if os.name == 'nt':
+        suffix = hashlib.sha256(str(directory).lower().encode('utf-8')).hexdigest()[:16]
+        return rf"\\.\pipe\text_cleaner-{suffix}"
+    return str(directory / SOCKET_FILE)
+
+
+def _family() -> str:
+    return 'AF_PIPE' if os.name == 'nt' else 'AF_UNIX'
+
+
+def _read_authkey(path: Path, attempts: int = 1) -> Optional[bytes]:
+    """키 파일 읽기 (비어 있으면 만든 프로세스가 쓰는 중일 수 있어 attempts번까지 다시 읽음)"""
+    for attempt in range(attempts):
+        if attempt:
+            time.sleep(AUTHKEY_READ_INTERVAL)
+        try:
+            key = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        if len(key) >= AUTHKEY_SIZE:
+            return key
+    return None
+
+
+def _authkey(directory: Path) -> bytes:
+    """연결 인증 키 (사용자 폴더에 처음 한 번 생성, 같은 사용자만 읽을 수 있게)
+
+    두 프로세스가 동시에 시작해도 키가 하나만 생기도록 O_EXCL로 만들고,
+    이미 있으면 덮어쓰지 않고 다른 프로세스가 쓴 키를 다시 읽습니다.
+    """
+    path = directory / AUTHKEY_FILE
+    key = _read_authkey(path)
+    if key:
+        return key
+    directory.mkdir(parents=True, exist_ok=True)
+    key = secrets.token_bytes(AUTHKEY_SIZE)
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        existing = _read_authkey(path, AUTHKEY_READ_ATTEMPTS)
+        if existing is None:
+            raise OSError(f"Instance key is not readable: {path}")
+        return existing
+    with os.fdopen(fd, 'wb') as f:
+        f.write(key)
+    return key
+
+
+def _send(request: Dict[str, Any], directory: Path) -> bool:
+    """실행 중인 인스턴스에 요청을 보내고 수락 여부 반환 (인스턴스가 없으면 False)"""
+    try:
+        connection = Client(_address(directory), family=_family(), authkey=_authkey(directory))
+    except (OSError, EOFError):
+        # 실행 중인 인스턴스가 없음 (또는 남은 소켓 파일)
+        return False
+    except Exception as e:
+        logging.debug("Instance handoff failed: %s", e)
+        return False
+
+    try:
+        connection.send(dict(request, version=PROTOCOL_VERSION))
+        return bool(connection.poll(5) and connection.recv() == "ok")
+    except (OSError, EOFError) as e:
+        logging.debug("Instance handoff failed: %s", e)
+        return False
+    finally:
+        connection.close()
+
+
+def forward_to_running_instance(args: List[str], directory: Optional[Path] = None) -> bool:
+    """실행 중인 인스턴스에 인자 전달 (전달했으면 True - 호출한 쪽은 바로 종료)"""
+    if not is_enabled():
+        return False
+    return _send({"args": list(args), "cwd": os.getcwd()}, directory or get_registry_dir())
+
+
+class InstanceServer:
+    """첫 인스턴스가 여는 IPC 수신기
+
+    다른 실행에서 받은 요청은 수신 스레드에서 handler로 전달되므로, Tk를 다루는
+    handler는 root.after로 UI 스레드에 넘겨야 합니다.
+    UI를 만들기 전에 수신을 시작할 수 있도록 handler가 없으면 요청을 쌓아 두었다가
+    set_handler()에서 순서대로 전달합니다.
+    """
+
+    def __init__(self, handler: Optional[InstanceHandler] = None, directory: Optional[Path] = None):
+        self.handler = handler
+        self.directory = directory or get_registry_dir()
+        self._listener: Optional[Listener] = None
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._lock = threading.Lock()
+        self._pending: List[Dict[str, Any]] = []
+
+    def set_handler(self, handler: InstanceHandler) -> None:
+        """요청 처리 함수 연결 (그동안 쌓인 요청을 먼저 전달)"""
+        with self._lock:
+            self.handler = handler
+            pending, self._pending = self._pending, []
+            # 쌓인 요청을 넘기는 동안 새 요청이 끼어들지 않도록 잠금 안에서 전달
+            for request in pending:
+                self._dispatch(handler, request)
+
+    def _dispatch(self, handler: InstanceHandler, request: Dict[str, Any]) -> None:
+        try:
+            handler(request)
+        except Exception as e:
+            logging.error(f"Instance request handler error: {e}")
+
+    def start(self) -> bool:
+        """수신 시작 (다른 인스턴스가 이미 수신 중이면 False)"""
+        if not is_enabled():
+            return False
+        address = _address(self.directory)
+        try:
+            authkey = _authkey(self.directory)
+            if os.name != 'nt' and os.path.exists(address):
+                # 연결되지 않는 소켓 파일은 비정상 종료로 남은 것
+                if _send({"ping": True}, self.directory):
+                    return False
+                os.unlink(address)
+            self._listener = Listener(address, family=_family(), authkey=authkey)
+        except OSError as e:
+            logging.warning(f"Single-instance listener not started: {e}")
+            return False
+
+        self._thread = threading.Thread(target=self._serve, name="instance-server", daemon=True)
+        self._thread.start()
+        return True
+
+    def close(self) -> None:
+        self._closed = True
+        if self._listener is not None:
+            try:
+                self._listener.close()
+            except OSError:
+                pass
+            self._listener = None
+
+    def _serve(self) -> None:
+        while not self._closed:
+            try:
+                connection = self._listener.accept()
+            except Exception as e:
+                # close() 또는 인증 실패한 연결
+                if self._closed:
+                    return
+                logging.warning(f"Instance connection rejected: {e}")
+                continue
+            self._handle(connection)
+
+    def _handle(self, connection: Connection) -> None:
+        try:
+            if not connection.poll(5):
+                return
+            request = connection.recv()
+            if not isinstance(request, dict) or request.get("version") != PROTOCOL_VERSION:
+                connection.send("unsupported")
+                return
+            connection.send("ok")
+        except Exception as e:
+            # 연결 끊김, 읽을 수 없는 요청 등 - 수신 스레드는 계속 동작
+            logging.warning(f"Instance request failed: {e}")
+            return
+        finally:
+            connection.close()
+        if request.get("args") is None:
+            return
+        with self._lock:
+            if self.handler is None:
+                # 아직 UI가 준비되지 않음 - set_handler()에서 전달
+                self._pending.append(request)
+            else:
+                self._dispatch(self.handler, request)
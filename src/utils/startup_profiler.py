@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+시작 시간 측정 유틸리티
+프로세스 시작부터 첫 화면 표시까지 단계별 시간을 기록하고 예산표로 출력합니다.
+"""
+
+import datetime
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+# 환경 변수로 시작 시간 보고서 활성화 (TEXT_CLEANER_STARTUP_PROFILE=1)
+STARTUP_PROFILE_ENV_VAR = "TEXT_CLEANER_STARTUP_PROFILE"
+
+# 단계별 시간 예산 (ms). 초과하면 보고서에 OVER로 표시
+STARTUP_BUDGETS_MS: Dict[str, float] = {
+    "env.bootstrap": 50,
+    "logging.setup": 50,
+    "import.core": 100,
+    "import.app": 300,
+    "tk.root": 300,
+    "app.modules": 100,
+    "guidelines.load": 50,
+    "ui.setup": 300,
+    "first_paint": 1500,
+    "import.OCRProcessor": 150,
+    "import.UpgradeManager": 150,
+    "warm_up.ocr": 3000,
+}
+
+# 이 모듈이 처음 임포트된 시각 (main.py에서 가장 먼저 임포트)
+_PROCESS_ORIGIN = time.perf_counter()
+
+
+class StartupProfiler:
+    """시작 단계 시간 기록기"""
+
+    def __init__(self, origin: float = _PROCESS_ORIGIN,
+                 budgets: Optional[Dict[str, float]] = None):
+        self.origin = origin
+        self.budgets = dict(STARTUP_BUDGETS_MS if budgets is None else budgets)
+        self.phases: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """with 문으로 단계 시간 기록 (예외로 끝난 단계는 기록하지 않음)"""
+        started = time.perf_counter()
+        yield
+        self.record(name, started, time.perf_counter())
+
+    def record(self, name: str, started: float, ended: float) -> None:
+        """단계 시작/종료 시각 기록 (같은 이름은 누적)"""
+        with self._lock:
+            entry = self.phases.get(name)
+            if entry is None:
+                self.phases[name] = {"start_ms": (started - self.origin) * 1000,
+                                     "duration_ms": (ended - started) * 1000}
+            else:
+                entry["duration_ms"] += (ended - started) * 1000
+
+    def mark(self, name: str) -> None:
+        """시작 이후 경과 시간으로 이정표 기록 (예: first_paint)"""
+        now = time.perf_counter()
+        self.record(name, self.origin, now)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            phases = {
+                name: {
+                    "start_ms": round(entry["start_ms"], 2),
+                    "duration_ms": round(entry["duration_ms"], 2),
+                    "budget_ms": self.budgets.get(name),
+                }
+                for name, entry in sorted(self.phases.items(), key=lambda item: item[1]["start_ms"])
+            }
+        return {"timestamp": datetime.datetime.now().isoformat(timespec="seconds"), "phases": phases}
+
+    def budget_table(self) -> List[str]:
+        """단계별 시간/예산 표"""
+        rows = [f"{'phase':<26}{'start ms':>10}{'took ms':>10}{'budget':>10}  status"]
+        for name, entry in self.to_dict()["phases"].items():
+            budget = entry["budget_ms"]
+            if budget is None:
+                budget_text, status = "-", ""
+            else:
+                budget_text = f"{budget:.0f}"
+                status = "OVER" if entry["duration_ms"] > budget else "ok"
+            rows.append(f"{name:<26}{entry['start_ms']:>10.1f}{entry['duration_ms']:>10.1f}"
+                        f"{budget_text:>10}  {status}")
+        return rows
+
+    def report(self, log_dir: Optional[Path] = None) -> Optional[Path]:
+        """예산표를 로그에 기록하고, 경로가 주어지면 JSON으로 저장"""
+        logging.info("=== 시작 시간 보고서 ===")
+        for row in self.budget_table():
+            logging.info(row)
+        if log_dir is None:
+            return None
+        try:
+            log_dir.mkdir(parents=True, exist_ok=True)
+            path = log_dir / f"startup_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+            return path
+        except OSError as e:
+            logging.warning(f"Startup report save failed: {e}")
+            return None
+
+
+def is_startup_profiling_requested() -> bool:
+    """환경 변수로 시작 시간 보고서가 요청되었는지 확인"""
+    return os.environ.get(STARTUP_PROFILE_ENV_VAR) == "1"
+
+
+# 애플리케이션 전역 시작 시간 기록기 (기록 비용은 단계당 perf_counter 두 번)
+startup = StartupProfiler()
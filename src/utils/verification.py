@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+환경 검증 프레임워크
+검사 항목이 의존 관계를 선언하면 서로 독립인 검사는 병렬로 실행하고,
+성공한 결과는 인터프리터/패키지 상태를 키로 TTL 동안 캐시해 바뀐 것이 없으면 다시 실행하지 않습니다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import site
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple, Union
+
+CACHE_VERSION = 1
+DEFAULT_TTL = 24 * 60 * 60
+MAX_WORKERS = 8
+
+CheckResult = Union[bool, Tuple[bool, str]]
+
+
+class Check:
+    """검사 항목
+
+    func는 bool 또는 (성공 여부, 설명)을 반환합니다. requires에 적은 검사가 모두 성공해야 실행되며,
+    cacheable이면 성공 결과를 환경 키와 함께 캐시합니다. required=False인 검사는 실패해도
+    전체 결과를 실패로 만들지 않으며(선택 기능 확인용), 실패 결과도 캐시합니다.
+    main_thread인 검사(Tk 창 생성 등)는 작업 스레드 대신 호출한 스레드에서 실행합니다.
+    """
+
+    def __init__(self, name: str, func: Callable[[], CheckResult], requires: Sequence[str] = (),
+                 cacheable: bool = True, required: bool = True, main_thread: bool = False):
+        self.name = name
+        self.func = func
+        self.requires = tuple(requires)
+        self.cacheable = cacheable
+        self.required = required
+        self.main_thread = main_thread
+
+
+def environment_key(extra: Iterable[str] = ()) -> str:
+    """인터프리터와 설치 패키지 상태 키
+
+    패키지를 설치/삭제/업그레이드하면 site-packages 폴더의 수정 시각이 바뀌므로
+    패키지마다 메타데이터를 읽지 않고도 변경을 알 수 있습니다.
+    """
+    digest = hashlib.sha256()
+    digest.update(sys.executable.encode('utf-8', errors='replace'))
+    digest.update(sys.version.encode('utf-8'))
+    paths = set(site.getsitepackages() if hasattr(site, 'getsitepackages') else [])
+    paths.add(site.getusersitepackages())
+    for path in sorted(paths):
+        try:
+            digest.update(f"{path}:{os.stat(path).st_mtime_ns}".encode('utf-8', errors='replace'))
+        except OSError:
+            digest.update(f"{path}:missing".encode('utf-8', errors='replace'))
+    for value in extra:
+        digest.update(value.encode('utf-8', errors='replace'))
+    return digest.hexdigest()
+
+
+def _load_cache(cache_file: Optional[Path], key: str) -> Dict[str, Dict[str, Any]]:
+    if cache_file is None:
+        return {}
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get("version") == CACHE_VERSION and data.get("key") == key:
+            return data.get("results", {})
+    except (OSError, ValueError, AttributeError):
+        pass
+    return {}
+
+
+def _save_cache(cache_file: Optional[Path], key: str, results: Dict[str, Dict[str, Any]]) -> None:
+    if cache_file is None:
+        return
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = cache_file.with_suffix('.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump({"version": CACHE_VERSION, "key": key, "results": results}, f, ensure_ascii=False)
+        os.replace(temp_file, cache_file)
+    except OSError as e:
+        logging.warning(f"Verification cache save failed: {e}")
+
+
+def _run_one(check: Check) -> Dict[str, Any]:
+    started = time.perf_counter()
+    try:
+        outcome = check.func()
+    except Exception as e:
+        outcome = (False, f"{type(e).__name__}: {e}")
+    ok, detail = outcome if isinstance(outcome, tuple) else (bool(outcome), "")
+    return {"ok": bool(ok), "detail": detail, "cached": False,
+            "duration_ms": (time.perf_counter() - started) * 1000}
+
+
+def run_checks(checks: Sequence[Check], cache_file: Optional[Path] = None, ttl: float = DEFAULT_TTL,
+               use_cache: bool = True, max_workers: Optional[int] = None,
+               key_extra: Iterable[str] = ()) -> Dict[str, Dict[str, Any]]:
+    """검사 실행 (의존 관계 순서를 지키며 병렬)
+
+    반환값: {검사 이름: {"ok", "detail", "cached", "duration_ms"}} (선언 순서)
+    의존 검사가 실패한 항목은 실행하지 않고 실패로 기록합니다.
+    """
+    by_name = {check.name: check for check in checks}
+    for check in checks:
+        unknown = [name for name in check.requires if name not in by_name]
+        if unknown:
+            raise ValueError(f"Unknown check dependency for {check.name}: {unknown}")
+
+    key = environment_key(key_extra)
+    now = time.time()
+    cached = _load_cache(cache_file, key) if use_cache else {}
+    results: Dict[str, Dict[str, Any]] = {}
+
+    def reusable(check: Check, result: Dict[str, Any]) -> bool:
+        # 필수 검사의 실패는 캐시하지 않음 (고친 뒤 바로 다시 확인)
+        return check.cacheable and (result.get("ok") or not check.required)
+
+    # 빠른 경로: TTL 안의 캐시 결과는 그대로 사용
+    for check in checks:
+        entry = cached.get(check.name)
+        if entry and reusable(check, entry) and now - entry.get("checked_at", 0) < ttl:
+            results[check.name] = dict(entry, cached=True, duration_ms=0.0)
+
+    pending = [check for check in checks if check.name not in results]
+    running: Dict[Future, Check] = {}
+    workers = max_workers or min(MAX_WORKERS, len(pending) or 1)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="verify") as executor:
+        while pending or running:
+            inline = []
+            for check in list(pending):
+                if not all(name in results for name in check.requires):
+                    continue
+                pending.remove(check)
+                failed = [name for name in check.requires if not results[name]["ok"]]
+                if failed:
+                    results[check.name] = {"ok": False, "detail": f"선행 검사 실패: {', '.join(failed)}",
+                                           "cached": False, "duration_ms": 0.0}
+                    continue
+                if check.main_thread:
+                    inline.append(check)
+                else:
+                    running[executor.submit(_run_one, check)] = check
+
+            # 작업 스레드에 넘긴 검사가 도는 동안 호출한 스레드 전용 검사 실행
+            for check in inline:
+                results[check.name] = _run_one(check)
+            if inline:
+                continue
+
+            if not running:
+                if pending:
+                    # 순환 의존 - 남은 검사를 실패로 처리
+                    for check in pending:
+                        results[check.name] = {"ok": False, "detail": "순환 의존", "cached": False,
+                                               "duration_ms": 0.0}
+                    pending = []
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[running.pop(future).name] = future.result()
+
+    fresh = {name: dict(result, checked_at=now) for name, result in results.items()
+             if not result["cached"] and reusable(by_name[name], result)}
+    if fresh:
+        merged = {name: entry for name, entry in cached.items()
+                  if name in by_name and results[name]["cached"]}
+        merged.update(fresh)
+        _save_cache(cache_file, key, merged)
+
+    return {check.name: results[check.name] for check in checks}
+
+
+def summarize(checks: Sequence[Check], results: Dict[str, Dict[str, Any]]) -> bool:
+    """결과를 로그로 남기고 필수 검사가 모두 성공했는지 반환"""
+    all_passed = True
+    for check in checks:
+        result = results[check.name]
+        status = "성공" if result["ok"] else ("실패" if check.required else "사용 불가")
+        source = "캐시" if result["cached"] else f"{result['duration_ms']:.0f}ms"
+        detail = f" - {result['detail']}" if result["detail"] else ""
+        if result["ok"] or not check.required:
+            logging.info(f"{check.name}: {status} ({source}){detail}")
+        else:
+            logging.error(f"{check.name}: {status} ({source}){detail}")
+            all_passed = False
+    return all_passed
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+대기 유틸리티
+고정 sleep 대신 실제 조건(프로세스 종료, 파일 잠금 해제, 폴더 삭제)을 지수 백오프로 확인하며 기다립니다.
+"""
+
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Type, TypeVar
+
+from src.utils.lazy_import import OptionalModule
+
+psutil = OptionalModule("psutil")
+
+T = TypeVar("T")
+
+# 백오프 기본값 (초)
+INITIAL_DELAY: float = 0.05
+MAX_DELAY: float = 1.0
+BACKOFF_FACTOR: float = 2.0
+
+
+def wait_until(condition: Callable[[], Any], timeout: float,
+               initial_delay: float = INITIAL_DELAY, max_delay: float = MAX_DELAY,
+               description: Optional[str] = None) -> bool:
+    """조건이 참이 될 때까지 지수 백오프로 확인 (전체 제한 시간 timeout초)
+
+    조건이 참이 되는 즉시 True, 제한 시간이 지나면 False를 반환합니다.
+    조건 함수에서 발생한 예외는 '아직 아님'으로 취급합니다.
+    """
+    deadline = time.monotonic() + timeout
+    delay = initial_delay
+    started = time.monotonic()
+    while True:
+        try:
+            if condition():
+                if description:
+                    logging.info("%s 완료 (%.2f초)", description, time.monotonic() - started)
+                return True
+        except Exception as e:
+            logging.debug("대기 조건 확인 실패: %s", e)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            if description:
+                logging.warning("%s 대기 시간 초과 (%.1f초)", description, timeout)
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * BACKOFF_FACTOR, max_delay)
+
+
+def retry_call(func: Callable[[], T], timeout: float,
+               exceptions: Tuple[Type[BaseException], ...] = (OSError,),
+               initial_delay: float = INITIAL_DELAY, max_delay: float = MAX_DELAY) -> T:
+    """예외가 나지 않을 때까지 백오프로 재시도 (제한 시간이 지나면 마지막 예외를 다시 발생)"""
+    deadline = time.monotonic() + timeout
+    delay = initial_delay
+    while True:
+        try:
+            return func()
+        except exceptions:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise
+            time.sleep(min(delay, remaining))
+            delay = min(delay * BACKOFF_FACTOR, max_delay)
+
+
+def wait_for_processes_exit(processes: Iterable[Any], timeout: float) -> List[Any]:
+    """psutil 프로세스들이 종료될 때까지 대기하고 남은 프로세스 목록 반환"""
+    processes = list(processes)
+    if not processes:
+        return []
+    if psutil.available:
+        _, alive = psutil.wait_procs(processes, timeout=timeout)
+        return alive
+    wait_until(lambda: not any(_is_running(proc) for proc in processes), timeout)
+    return [proc for proc in processes if _is_running(proc)]
+
+
+def _is_running(proc: Any) -> bool:
+    try:
+        return bool(proc.is_running())
+    except Exception:
+        return False
+
+
+def is_file_unlocked(path: Path) -> bool:
+    """파일을 쓰기 모드로 열 수 있는지 확인 (없는 파일은 해제된 것으로 봄)
+
+    Windows에서 실행 중인 exe나 다른 프로세스가 연 파일은 PermissionError가 납니다.
+    """
+    try:
+        with open(path, 'r+b'):
+            return True
+    except FileNotFoundError:
+        return True
+    except OSError:
+        return False
+
+
+def wait_for_file_unlocked(path: Path, timeout: float, description: Optional[str] = None) -> bool:
+    """파일 잠금이 풀릴 때까지 대기"""
+    return wait_until(lambda: is_file_unlocked(path), timeout, description=description)
+
+
+def wait_for_path_gone(path: Path, timeout: float, description: Optional[str] = None) -> bool:
+    """파일/폴더가 사라질 때까지 대기"""
+    return wait_until(lambda: not os.path.exists(path), timeout, description=description)
+
+
+def remove_tree(path: Path, timeout: float) -> bool:
+    """폴더 삭제 (잠긴 파일이 풀릴 때까지 백오프로 재시도, 제한 시간 안에 사라지면 True)"""
+    def attempt() -> bool:
+        shutil.rmtree(path, ignore_errors=True)
+        return not os.path.exists(path)
+
+    return wait_until(attempt, timeout)
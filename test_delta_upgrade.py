@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+델타 업그레이드 테스트 스크립트
+패키지 경로 검증(설치 폴더 밖 쓰기 거부)과 사용자 파일 보존을 확인합니다.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from src.core import delta_upgrade, integrity
+
+
+def _write_zip_package(archive: Path, files: dict) -> Path:
+    """files({상대 경로: 내용}) 그대로 매니페스트를 만든 zip 패키지"""
+    manifest = {"format": delta_upgrade.MANIFEST_FORMAT, "version": "test", "files": {}}
+    with zipfile.ZipFile(archive, 'w') as zf:
+        for relative, data in files.items():
+            zf.writestr(relative, data)
+            manifest["files"][relative] = {
+                "sha256": hashlib.sha256(data).hexdigest(),
+                "size": len(data),
+            }
+        zf.writestr(delta_upgrade.MANIFEST_FILE, json.dumps(manifest))
+    return archive
+
+
+def test_rejects_traversal_paths():
+    """상위 폴더를 가리키는 매니페스트 경로(../x, ..\\x)가 있으면 적용 거부"""
+    for relative in ("../x", "..\\x", "sub\\..\\..\\x", "C:/x", "\\\\server\\share\\x"):
+        with tempfile.TemporaryDirectory() as temp:
+            root = Path(temp)
+            install_dir = root / "app" / "text_cleaner"
+            install_dir.mkdir(parents=True)
+            (install_dir / "text_cleaner.exe").write_bytes(b"old")
+            package = _write_zip_package(root / "package.zip", {relative: b"evil", "text_cleaner.exe": b"new"})
+
+            assert delta_upgrade.apply_package(package, install_dir) is None, relative
+            assert (install_dir / "text_cleaner.exe").read_bytes() == b"old"
+            assert not (root / "app" / "x").exists()
+            assert not (root / "x").exists()
+
+
+def test_preserves_unmanifested_files():
+    """기존 매니페스트에 없던 파일(guidelines.json)은 유지하고, 기존 매니페스트 파일만 삭제"""
+    with tempfile.TemporaryDirectory() as temp:
+        root = Path(temp)
+        old_build = root / "old"
+        old_build.mkdir()
+        (old_build / "text_cleaner.exe").write_bytes(b"v1")
+        (old_build / "obsolete.dll").write_bytes(b"old dll")
+        delta_upgrade.write_manifest(old_build, "1")
+
+        install_dir = root / "text_cleaner"
+        assert delta_upgrade.apply_package(old_build, install_dir) is not None
+        (install_dir / "guidelines.json").write_text('{"사용자": {}}', encoding='utf-8')
+
+        package = _write_zip_package(root / "v2.zip", {"text_cleaner.exe": b"v2",
+                                                        "guidelines.json": b"{}"})
+        result = delta_upgrade.apply_package(package, install_dir, keep_backup=False)
+
+        assert result is not None
+        assert result["removed"] == 1 and result["preserved"] == 1
+        assert (install_dir / "text_cleaner.exe").read_bytes() == b"v2"
+        assert not (install_dir / "obsolete.dll").exists()
+        assert (install_dir / "guidelines.json").read_text(encoding='utf-8') == '{"사용자": {}}'
+
+
+def test_rejects_unsigned_manifest_when_key_configured():
+    """서명 키가 있으면 서명을 지운 매니페스트는 거부"""
+    previous = os.environ.get(integrity.MANIFEST_KEY_ENV)
+    os.environ[integrity.MANIFEST_KEY_ENV] = "test-key"
+    try:
+        with tempfile.TemporaryDirectory() as temp:
+            root = Path(temp)
+            package = _write_zip_package(root / "package.zip", {"text_cleaner.exe": b"new"})
+            assert delta_upgrade.apply_package(package, root / "text_cleaner") is None
+            assert integrity.verify_signature({"files": {}}, b"test-key") == "invalid"
+    finally:
+        if previous is None:
+            os.environ.pop(integrity.MANIFEST_KEY_ENV, None)
+        else:
+            os.environ[integrity.MANIFEST_KEY_ENV] = previous
+
+
+def main():
+    for test in (test_rejects_traversal_paths, test_preserves_unmanifested_files,
+                 test_rejects_unsigned_manifest_when_key_configured):
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+표 형식 붙여넣기 변환 테스트 스크립트
+엑셀(TSV)/CSV 감지와 리스트 형식 변환 결과를 확인합니다.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from src.core import tabular_paste
+
+
+def test_excel_tsv_keeps_commas_in_cells():
+    """탭 구분 데이터는 탭으로만 나누고 셀 안의 쉼표는 유지"""
+    pasted = 'O\t3개\t안녕, 반가워\nX\t5\t좋아요, 감사합니다\n\t7\t확인, 완료\n'
+    assert tabular_paste.sniff_dialect(pasted) is tabular_paste.TabDialect
+    assert tabular_paste.convert_to_list_format(pasted) == (
+        'O | 3 | 안녕, 반가워\nX | 5 | 좋아요, 감사합니다\n | 7 | 확인, 완료')
+
+
+def test_single_line_prose_is_not_tabular():
+    """쉼표가 들어간 한 줄 문장은 표가 아님"""
+    assert not tabular_paste.is_tabular('안녕하세요, 오늘 회의는 3시입니다.')
+
+
+def test_tsv_keeps_literal_quotes():
+    """TSV의 따옴표는 셀 내용 그대로 (닫히지 않은 따옴표도 다음 줄을 끌어오지 않음)"""
+    assert tabular_paste.convert_to_list_format('"특가" 상품\t2개\t메모') == '"특가" 상품 | 2 | 메모'
+    assert tabular_paste.convert_to_list_format('"미완성\t1\tx\nb\t2\ty') == '"미완성 | 1 | x\nb | 2 | y'
+
+
+def test_csv_quotes():
+    """CSV는 셀 전체를 감싼 따옴표만 인용으로 처리"""
+    assert tabular_paste.convert_to_list_format('"a, b",1,x\nc,2,y') == 'a, b | 1 | x\nc | 2 | y'
+    assert tabular_paste.convert_to_list_format('"특가" 상품,2,메모\n일반,3,메모2') == (
+        '"특가" 상품 | 2 | 메모\n일반 | 3 | 메모2')
+    assert tabular_paste.convert_to_list_format('"a,1,x\nb,2,y\nc,3,z') == '"a | 1 | x\nb | 2 | y\nc | 3 | z'
+
+
+def test_csv_requires_consistent_lines():
+    """쉼표 데이터는 두 줄 이상, 열 수가 일관될 때만 표"""
+    assert tabular_paste.sniff_dialect('a,1,x\nb,2,y') is tabular_paste.CommaDialect
+    assert not tabular_paste.is_tabular('a,1,x')
+    assert not tabular_paste.is_tabular('첫 줄, 쉼표 하나\n두 번째 줄은, 쉼표가, 여러 개, 있습니다\n셋째 줄')
+
+
+def main():
+    for test in (test_excel_tsv_keeps_commas_in_cells, test_single_line_prose_is_not_tabular,
+                 test_tsv_keeps_literal_quotes, test_csv_quotes, test_csv_requires_consistent_lines):
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
@@ -61,17 +61,23 @@ def main():
         manager = UpgradeManager(guideline_manager=None)
         logging.info("업그레이드 매니저 인스턴스 생성 완료")
         
-        # 업그레이드 실행 (자동 모드)
+        # 업그레이드 실행 (자동 모드) - 작업 스레드에서 실행하며 진행 창 표시
         logging.info("업그레이드 실행 시작")
-        result = manager.execute_upgrade(auto_upgrade=True)
+        from src.ui.upgrade_progress import run_with_progress_window
+        
+        def run_upgrade(progress):
+            manager.progress_callback = progress
+            return manager.execute_upgrade(auto_upgrade=True)
+        
+        result = run_with_progress_window(run_upgrade)
         
         if result:
             logging.info("업그레이드 성공 - 새 프로그램 실행 시도")
             print("[업그레이드 매니저] 업그레이드 성공 - 새 프로그램 실행 시도")
             
-            # 빌드 완료 후 잠시 대기
-            import time
-            time.sleep(2)
+            # 빌드 결과가 보일 때까지 대기 (이미 있으면 즉시 진행)
+            from src.utils.wait_utils import wait_until
+            wait_until(manager._installed_exe_path().exists, manager.FILE_RELEASE_TIMEOUT)
             
             # 새 프로그램 실행 시도
             launch_result = manager.launch_new_program()
@@ -79,10 +85,9 @@ def main():
                 logging.info("새 프로그램 실행 성공")
                 print("[업그레이드 매니저] 새 프로그램 실행 성공")
                 
-                # 새 프로그램 실행 후 대기
-                logging.info("새 프로그램 실행 완료 - 3초 대기 후 업그레이드 매니저 종료")
-                print("[업그레이드 매니저] 새 프로그램 실행 완료 - 3초 대기 후 업그레이드 매니저 종료")
-                time.sleep(3)
+                # launch_new_program이 새 프로세스 시작까지 확인함
+                logging.info("새 프로그램 실행 완료 - 업그레이드 매니저 종료")
+                print("[업그레이드 매니저] 새 프로그램 실행 완료 - 업그레이드 매니저 종료")
                 
                 # 업그레이드 매니저 완료
                 logging.info("업그레이드 매니저 완료")
@@ -11,6 +11,21 @@ import subprocess
 import logging
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from src.utils.verification import Check, run_checks, summarize
+
+# 성공한 검사 결과 캐시 (Python/패키지가 바뀌면 자동으로 무효화)
+CACHE_FILE = Path(__file__).resolve().parent / "cache" / "environment_verify.json"
+
+OPTIONAL_MODULES = {
+    'pytesseract': 'OCR 기능',
+    'PIL': '이미지 처리 기능',
+    'pyperclip': '클립보드 기능',
+    'psutil': '프로세스 관리 기능',
+    'cv2': 'OpenCV (이미지 전처리)',
+    'numpy': '수치 계산'
+}
+
 def setup_logging():
     """로깅 설정"""
     logging.basicConfig(
@@ -82,28 +97,32 @@ def check_required_modules():
         return False
     return True
 
-def check_optional_modules():
+def check_optional_module(module, description):
     """선택적 모듈 확인"""
-    optional_modules = {
-        'pytesseract': 'OCR 기능',
-        'PIL': '이미지 처리 기능',
-        'pyperclip': '클립보드 기능',
-        'psutil': '프로세스 관리 기능',
-        'cv2': 'OpenCV (이미지 전처리)',
-        'numpy': '수치 계산'
-    }
-    
-    available_modules = {}
-    for module, description in optional_modules.items():
-        try:
-            __import__(module)
-            logging.info(f"{module} 모듈 사용 가능 ({description})")
-            available_modules[module] = True
-        except ImportError:
-            logging.warning(f"{module} 모듈 없음 ({description})")
-            available_modules[module] = False
-    
-    return available_modules
+    try:
+        __import__(module)
+        logging.info(f"{module} 모듈 사용 가능 ({description})")
+        return True, description
+    except ImportError:
+        logging.warning(f"{module} 모듈 없음 ({description})")
+        return False, description
+
+def build_checks():
+    """검사 목록 (의존 관계가 없는 검사는 병렬 실행)"""
+    checks = [
+        Check("Python 버전", check_python_version),
+        Check("Python 경로", check_python_path, requires=["Python 버전"]),
+        Check("필수 모듈", check_required_modules, requires=["Python 버전"]),
+        # Tk 창은 메인 스레드에서 생성
+        Check("tkinter 모듈", check_tkinter, requires=["Python 경로"], main_thread=True),
+        # 프로젝트 파일은 Python 환경과 무관하게 바뀌므로 매번 확인
+        Check("프로젝트 파일", check_project_files, cacheable=False),
+    ]
+    for module, description in OPTIONAL_MODULES.items():
+        checks.append(Check(f"선택 모듈 {module}",
+                            lambda module=module, description=description: check_optional_module(module, description),
+                            requires=["Python 버전"], required=False))
+    return checks
 
 def check_project_files():
     """프로젝트 파일 확인"""
@@ -184,43 +203,23 @@ def main():
     logging.info("환경 검증 시작")
     logging.info("=" * 50)
     
-    # 기본 검증
-    checks = {
-        "Python 버전": check_python_version(),
-        "tkinter 모듈": check_tkinter(),
-        "필수 모듈": check_required_modules(),
-        "프로젝트 파일": check_project_files(),
-        "Python 경로": check_python_path()
-    }
-    
-    # 선택적 모듈 확인
-    optional_modules = check_optional_modules()
+    # 병렬 검증 (바뀐 것이 없으면 캐시 결과 사용, --no-cache로 전체 재검사)
+    checks = build_checks()
+    results = run_checks(checks, cache_file=CACHE_FILE, use_cache="--no-cache" not in sys.argv)
     
     # 결과 요약
     logging.info("=" * 50)
     logging.info("검증 결과 요약")
     logging.info("=" * 50)
     
-    all_passed = True
-    for check_name, result in checks.items():
-        status = "성공" if result else "실패"
-        logging.info(f"{check_name}: {status}")
-        if not result:
-            all_passed = False
-    
-    logging.info("선택적 모듈 상태:")
-    for module, available in optional_modules.items():
-        status = "사용 가능" if available else "사용 불가"
-        logging.info(f"  {module}: {status}")
-    
-    if all_passed:
+    if summarize(checks, results):
         logging.info("모든 필수 검증이 통과했습니다!")
         return True
     else:
         logging.error("일부 검증이 실패했습니다.")
         
         # tkinter가 없으면 설치 시도
-        if not checks["tkinter 모듈"]:
+        if not results["tkinter 모듈"]["ok"]:
             logging.info("tkinter 설치 시도...")
             install_missing_modules()
             